@@ -1,46 +1,142 @@
-# ruff: noqa: F401,F403
-
 """Star charts and maps of the sky"""
 
 __version__ = "0.20.4"
 
-from .plots import (
-    MapPlot,
-    HorizonPlot,
-    OpticPlot,
-    ZenithPlot,
-    GalaxyPlot,
-)
-from .models import (
-    DSO,
-    DsoType,
-    Star,
-    Constellation,
-    ConstellationBorder,
-    Comet,
-    Planet,
-    Moon,
-    Sun,
-    ObjectList,
-    Scope,
-    Binoculars,
-    Reflector,
-    Refractor,
-    Camera,
-    Satellite,
-    Observer,
-    MilkyWay,
-)
-from .data import Catalog
-from .styles import *
-from .projections import *
+import contextlib
+
 from .config import settings
-from .plotters.text import CollisionHandler
+from .lazy import lazy_imports
 
-from ibis import _
+# Public names are imported on first access, because importing the plots, models, and data
+# modules also imports matplotlib, cartopy, ibis, skyfield, etc (which takes a few seconds)
+_IMPORTS = {
+    # plots
+    "MapPlot": ".plots",
+    "HorizonPlot": ".plots",
+    "OpticPlot": ".plots",
+    "ZenithPlot": ".plots",
+    "GalaxyPlot": ".plots",
+    # models
+    "DSO": ".models",
+    "DsoType": ".models",
+    "Star": ".models",
+    "Constellation": ".models",
+    "ConstellationBorder": ".models",
+    "Comet": ".models",
+    "Planet": ".models",
+    "Moon": ".models",
+    "Sun": ".models",
+    "ObjectList": ".models",
+    "Scope": ".models",
+    "Binoculars": ".models",
+    "Reflector": ".models",
+    "Refractor": ".models",
+    "Camera": ".models",
+    "Satellite": ".models",
+    "Observer": ".models",
+    "MilkyWay": ".models",
+    # data
+    "Catalog": ".data",
+    # styles
+    "AlignmentEnum": ".styles",
+    "AnchorPointEnum": ".styles",
+    "ArrowStyle": ".styles",
+    "BaseStyle": ".styles",
+    "CapStyleEnum": ".styles",
+    "Color": ".styles",
+    "ColorStr": ".styles",
+    "FillStyleEnum": ".styles",
+    "FontStyleEnum": ".styles",
+    "FontWeightEnum": ".styles",
+    "GradientDirection": ".styles",
+    "JoinStyleEnum": ".styles",
+    "LabelStyle": ".styles",
+    "LegendLocationEnum": ".styles",
+    "LegendStyle": ".styles",
+    "LineStyle": ".styles",
+    "LineStyleEnum": ".styles",
+    "MarkerStyle": ".styles",
+    "MarkerSymbolEnum": ".styles",
+    "ObjectStyle": ".styles",
+    "PathStyle": ".styles",
+    "PlotStyle": ".styles",
+    "PolygonStyle": ".styles",
+    "ZOrderEnum": ".styles",
+    "merge_dict": ".styles",
+    "use_style": ".styles",
+    "style_extensions": ".styles",
+    # projections
+    "AutoProjection": ".projections",
+    "Azimuth": ".projections",
+    "CenterDEC": ".projections",
+    "CenterRA": ".projections",
+    "CenterRADEC": ".projections",
+    "Equidistant": ".projections",
+    "LambertAzEqArea": ".projections",
+    "Mercator": ".projections",
+    "Miller": ".projections",
+    "Mollweide": ".projections",
+    "ObliqueMercator": ".projections",
+    "Orthographic": ".projections",
+    "PlateCarree": ".projections",
+    "ProjectionBase": ".projections",
+    "Robinson": ".projections",
+    "StereoNorth": ".projections",
+    "StereoSouth": ".projections",
+    "Stereographic": ".projections",
+    # other
+    "AstrometryMode": ".coordinates",
+    "CollisionHandler": ".plotters.text",
+    "LabelBudget": ".plotters.text",
+    "FrameSequence": ".animation",
+    "Atlas": ".atlas",
+    "PngStrategy": ".plots.base",
+    "_": "ibis",
+}
 
+# Names that were also available at the top level, because the styles and projections were star-imported
+# (they're still available for compatibility, but aren't part of `__all__`)
+_STAR_IMPORTS = {
+    **{
+        name: ".styles"
+        for name in (
+            "Annotated",
+            "BaseModel",
+            "Enum",
+            "HERE",
+            "Optional",
+            "PI",
+            "Path",
+            "PlainSerializer",
+            "SQR_2",
+            "Union",
+            "base",
+            "circle_cross",
+            "circle_crosshair",
+            "circle_dot",
+            "circle_dotted_rings",
+            "circle_line",
+            "ellipse",
+            "extensions",
+            "fonts",
+            "helpers",
+            "inspect",
+            "json",
+            "markers",
+            "patheffects",
+            "wraps",
+            "yaml",
+        )
+    },
+    **{name: ".projections" for name in ("ABC", "Field", "cached_property", "ccrs")},
+}
 
-import contextlib
+__getattr__, __dir__ = lazy_imports(__name__, {**_IMPORTS, **_STAR_IMPORTS})
+
+__all__ = [name for name in _IMPORTS if not name.startswith("_")] + [
+    "settings",
+    "override_settings",
+]
 
 
 @contextlib.contextmanager
@@ -0,0 +1,261 @@
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+
+import numpy as np
+from matplotlib import image
+from matplotlib.animation import AbstractMovieWriter, FFMpegWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from starplot.config import settings
+from starplot.models import Observer
+from starplot.plots import HorizonPlot
+from starplot.plots.base import DPI
+from starplot.transforms import AltAzTransform
+
+
+class FrameSequence:
+    """
+    Renders a plot at a sequence of times, for time-lapse animations of the sky.
+
+    The plot is only created once (so data is only loaded once) -- every other frame is rendered by updating the time of the plot (see `update_time()` of [HorizonPlot][starplot.HorizonPlot] and [ZenithPlot][starplot.ZenithPlot]). When rendering arrays or PNG files, everything that doesn't change between frames (e.g. the background, horizon, and gridlines) is only rendered once.
+
+    Example:
+
+    ```python
+    def create_plot(observer):
+        p = sp.HorizonPlot(observer=observer, ...)
+        p.horizon()
+        p.stars(where=[_.magnitude < 5])
+        p.planets()
+        return p
+
+    frames = FrameSequence(
+        create_plot,
+        observer=Observer(lat=33.36, lon=-116.83),
+        start=datetime(2025, 10, 13, 21, 0, tzinfo=ZoneInfo("US/Pacific")),
+        end=datetime(2025, 10, 14, 3, 0, tzinfo=ZoneInfo("US/Pacific")),
+        step=timedelta(minutes=5),
+    )
+    frames.to_video("night.mp4", fps=24)
+    ```
+
+    Args:
+        plot_fn: Callable that creates and returns a plot (HorizonPlot or ZenithPlot) for an [Observer][starplot.Observer]. To render frames with multiple processes, it must be picklable (e.g. a module-level function).
+        observer: Observer of the location (and weather) for all frames. Its date/time is ignored.
+        start: Date/time of the first frame (**must be timezone-aware**)
+        end: Date/time of the last frame (only included if it's a whole number of steps after `start`)
+        step: Time between frames
+        requery_degrees: How far (in degrees) the sky can rotate before data is re-queried. If `None`, then the default of the plot type will be used.
+    """
+
+    def __init__(
+        self,
+        plot_fn: Callable,
+        observer: Observer,
+        start: datetime,
+        end: datetime,
+        step: timedelta,
+        requery_degrees: float = None,
+    ):
+        if step <= timedelta(0):
+            raise ValueError("Step must be positive")
+
+        self.plot_fn = plot_fn
+        self.observer = observer
+        self.requery_degrees = requery_degrees
+
+        self.times = []
+        """Date/time of each frame"""
+
+        dt = start
+        while dt <= end:
+            self.times.append(dt)
+            dt += step
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __iter__(self) -> Iterator:
+        """Yields the plot at each frame's time (the same plot instance is updated for every frame)"""
+        observers = self._observers()
+
+        if not observers:
+            return
+
+        plot = self.plot_fn(observers[0])
+        self._prepare_transforms(plot, observers[1:])
+
+        yield plot
+
+        for observer in observers[1:]:
+            plot._update_observer(observer, self.requery_degrees)
+            yield plot
+
+    def arrays(self) -> Iterator[np.ndarray]:
+        """
+        Yields an RGBA image of each frame, as a NumPy array of shape (height, width, 4).
+
+        Images are of the full figure, so every frame has the same size.
+        """
+        renderer = None
+
+        for plot in self:
+            if renderer is None:
+                renderer = _BlitRenderer(plot)
+
+            yield renderer.render()
+
+    def to_files(
+        self, filename: str = "frame-{index:04d}.png", processes: int = 1
+    ) -> list[str]:
+        """
+        Renders each frame to a PNG file.
+
+        Args:
+            filename: Template of the filenames, which is formatted with the frame's `index` and `dt` (e.g. `"frame-{index:04d}.png"`)
+            processes: Number of processes to render frames with. Each process renders a contiguous chunk of the frames with its own plot.
+
+        Returns:
+            Filenames of the frames, in order
+        """
+        if processes > 1 and len(self) > 1:
+            chunks = [
+                c for c in np.array_split(np.arange(len(self)), processes) if len(c)
+            ]
+            with ProcessPoolExecutor(len(chunks)) as executor:
+                futures = [
+                    executor.submit(_write_files, self._chunk(c), filename, int(c[0]))
+                    for c in chunks
+                ]
+                return [f for future in futures for f in future.result()]
+
+        return _write_files(self, filename)
+
+    def to_video(
+        self,
+        filename: str,
+        fps: int = 24,
+        writer: AbstractMovieWriter = None,
+    ) -> None:
+        """
+        Renders the frames to a video file, with a Matplotlib movie writer.
+
+        Args:
+            filename: Filename of the video
+            fps: Frames per second (only used if `writer` is `None`)
+            writer: Movie writer to use. If `None`, then FFmpeg will be used (which must be installed).
+        """
+        writer = writer or FFMpegWriter(fps=fps)
+        frames = iter(self)
+        plot = next(frames, None)
+
+        if plot is None:
+            return
+
+        with writer.saving(plot.fig, filename, dpi=DPI):
+            writer.grab_frame()
+            for _ in frames:
+                writer.grab_frame()
+
+    def _observers(self) -> list[Observer]:
+        place = self.observer.model_dump(
+            include=set(self.observer.model_fields) - {"dt"}
+        )
+        return [type(self.observer)(dt=dt, **place) for dt in self.times]
+
+    def _chunk(self, indices) -> "FrameSequence":
+        chunk = copy(self)
+        chunk.times = [self.times[i] for i in indices]
+        return chunk
+
+    def _prepare_transforms(self, plot, observers: list[Observer]) -> None:
+        """Computes the AZ/ALT transforms of all frames at once"""
+        if (
+            not isinstance(plot, HorizonPlot)
+            or settings.altaz_reference
+            or not observers
+        ):
+            return
+
+        transforms = AltAzTransform.from_observers(observers, plot.ephemeris_name)
+
+        for observer, transform in zip(observers, transforms):
+            type(observer)._altaz_transform.cache_set(
+                observer, transform, plot.ephemeris_name
+            )
+
+
+class _BlitRenderer:
+    """
+    Renders frames of a plot by drawing the static artists once, and then only drawing the
+    artists that change (and everything above them) on top of that background for each frame.
+    """
+
+    def __init__(self, plot):
+        self.plot = plot
+        self.canvas = plot.fig.canvas
+
+        if not isinstance(self.canvas, FigureCanvasAgg):
+            self.canvas = FigureCanvasAgg(plot.fig)
+
+        # everything at or above the lowest z-order of the changing artists is drawn on every frame
+        self.zorder = min(
+            (a.get_zorder() for a in self._changing()), default=float("inf")
+        )
+        foreground = self._foreground()
+
+        for artist in foreground:
+            artist.set_animated(True)
+
+        try:
+            self.canvas.draw()
+            self.background = self.canvas.copy_from_bbox(plot.fig.bbox)
+        finally:
+            for artist in foreground:
+                artist.set_animated(False)
+
+    def _changing(self) -> list:
+        changing = list(self.plot.labels)
+
+        for layer in self.plot._layers:
+            changing.extend(layer.artists)
+            changing.extend(t.artist for t in layer.tracked)
+
+        return changing
+
+    def _foreground(self) -> list:
+        changing = {id(a) for a in self._changing()}
+        ax = self.plot.ax
+        hidden = {id(ax.patch)}
+
+        # same as matplotlib's Axes.draw, which skips the axis and spines when the axis is off
+        if not ax.axison:
+            hidden.update(id(a) for a in (*ax.spines.values(), ax.xaxis, ax.yaxis))
+
+        return [
+            a
+            for a in ax.get_children()
+            if id(a) not in hidden
+            and (id(a) in changing or a.get_zorder() >= self.zorder)
+        ]
+
+    def render(self) -> np.ndarray:
+        self.canvas.restore_region(self.background)
+
+        for artist in sorted(self._foreground(), key=lambda a: a.get_zorder()):
+            self.plot.ax.draw_artist(artist)
+
+        return np.asarray(self.canvas.buffer_rgba()).copy()
+
+
+def _write_files(frames: FrameSequence, filename: str, start: int = 0) -> list[str]:
+    filenames = []
+
+    for index, array in enumerate(frames.arrays(), start=start):
+        path = filename.format(index=index, dt=frames.times[index - start])
+        image.imsave(path, array)
+        filenames.append(path)
+
+    return filenames
@@ -0,0 +1,191 @@
+import gc
+import math
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
+
+import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
+
+
+@dataclass(frozen=True)
+class Page:
+    """Extent of a page in an atlas (in degrees)"""
+
+    ra_min: float
+    ra_max: float
+    dec_min: float
+    dec_max: float
+
+    @property
+    def center_ra(self) -> float:
+        """Right ascension of the page's center, for centering the projection on the page (which is required for pages that cross 0h)"""
+        return (self.ra_min + self.ra_max) / 2 % 360
+
+
+def tile_sphere(dec_step: float = 30, overlap: float = 0) -> list[Page]:
+    """
+    Tiles the whole sky into pages of about the same size, by dividing it into bands of declination and then
+    dividing each band into pages of right ascension (fewer pages for bands closer to the poles).
+
+    The bands at the poles are one page each (with the full range of right ascension), so they should be plotted with a polar projection (e.g. [StereoNorth][starplot.StereoNorth] or [StereoSouth][starplot.StereoSouth]).
+
+    Args:
+        dec_step: Maximum height of pages, in degrees of declination
+        overlap: Overlap (in degrees) of adjacent pages
+
+    Returns:
+        Pages of the tiling, from the south pole to the north pole (and by increasing right ascension in each band). Pages that cross 0h have a `ra_max` of more than 360.
+    """
+    bands = math.ceil(180 / dec_step)
+    height = 180 / bands
+    pages = []
+
+    for band in range(bands):
+        dec_min = -90 + band * height
+        dec_max = dec_min + height
+
+        page_dec_min = max(dec_min - overlap, -90)
+        page_dec_max = min(dec_max + overlap, 90)
+
+        if band in (0, bands - 1):
+            pages.append(Page(0, 360, page_dec_min, page_dec_max))
+            continue
+
+        # the band is widest at the declination closest to the equator
+        widest = 0 if dec_min < 0 < dec_max else min(abs(dec_min), abs(dec_max))
+        count = max(1, math.ceil(360 * math.cos(math.radians(widest)) / height))
+        width = 360 / count
+
+        for index in range(count):
+            ra_min = index * width - overlap
+            ra_max = (index + 1) * width + overlap
+
+            if ra_min < 0:
+                ra_min += 360
+                ra_max += 360
+
+            pages.append(Page(ra_min, ra_max, page_dec_min, page_dec_max))
+
+    return pages
+
+
+class Atlas:
+    """
+    Renders the pages of a star atlas into one PDF.
+
+    Pages are plotted and written one at a time, and each page's plot is released right after it's written, so memory usage doesn't grow with the number of pages. Data (e.g. star positions and ephemerides) and fonts are cached in the process, so they're shared by all pages, and all pages of the PDF share one subset of each font.
+
+    Example:
+
+    ```python
+    def create_page(page):
+        p = sp.MapPlot(
+            projection=sp.Miller(center_ra=page.center_ra),
+            ra_min=page.ra_min,
+            ra_max=page.ra_max,
+            dec_min=page.dec_min,
+            dec_max=page.dec_max,
+        )
+        p.stars(where=[_.magnitude < 8])
+        p.constellations()
+        return p
+
+    atlas = Atlas(create_page, pages=tile_sphere(dec_step=30, overlap=2))
+    atlas.to_pdf("atlas.pdf")
+    ```
+
+    Args:
+        plot_fn: Callable that creates and returns the plot of a [Page][starplot.atlas.Page]. To render pages with multiple processes, it must be picklable (e.g. a module-level function).
+        pages: Pages of the atlas, in order, as a list of [Page][starplot.atlas.Page] instances or tuples of `(ra_min, ra_max, dec_min, dec_max)`
+    """
+
+    def __init__(self, plot_fn: Callable, pages: list):
+        self.plot_fn = plot_fn
+
+        self.pages = [p if isinstance(p, Page) else Page(*p) for p in pages]
+        """Pages of the atlas"""
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __iter__(self) -> Iterator:
+        """Yields the plot of each page (each plot is released when the next one is created)"""
+        for page in self.pages:
+            plot = self.plot_fn(page)
+            yield plot
+            _release(plot)
+            del plot
+
+    def to_pdf(
+        self,
+        filename: str | BinaryIO,
+        padding: float = 0,
+        processes: int = 1,
+        **kwargs,
+    ) -> None:
+        """
+        Renders the pages to a PDF.
+
+        Args:
+            filename: Filename (or binary file object) of the PDF
+            padding: Padding (in inches) around each page
+            processes: Number of processes to render pages with. Each process renders a contiguous chunk of the pages to its own PDF, and then the chunks are combined in order (each chunk has its own subset of each font). Combining the chunks requires [pypdf](https://pypi.org/project/pypdf/), which can be installed with `pip install starplot[atlas]`.
+            **kwargs: Any keyword arguments to pass through to each plot's [`export()`][starplot.plots.base.BasePlot.export] (e.g. `rasterize_threshold`)
+        """
+        if processes <= 1 or len(self) <= 1:
+            _write_pdf(self, filename, padding, kwargs)
+            return
+
+        # fail before rendering anything if the chunks can't be combined
+        PdfWriter = _pdf_writer()
+        chunks = [c for c in np.array_split(np.arange(len(self)), processes) if len(c)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"chunk-{i}.pdf" for i in range(len(chunks))]
+
+            with ProcessPoolExecutor(len(chunks)) as executor:
+                futures = [
+                    executor.submit(_write_pdf, self._chunk(c), path, padding, kwargs)
+                    for c, path in zip(chunks, paths)
+                ]
+                for future in futures:
+                    future.result()
+
+            writer = PdfWriter()
+            for path in paths:
+                writer.append(path)
+
+            writer.write(filename)
+            writer.close()
+
+    def _chunk(self, indices) -> "Atlas":
+        chunk = copy(self)
+        chunk.pages = [self.pages[i] for i in indices]
+        return chunk
+
+
+def _release(plot) -> None:
+    """Releases a plot's figure and indexes, which reference each other (so they're only freed by the garbage collector)"""
+    plot.close_fig()
+    gc.collect()
+
+
+def _pdf_writer():
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        raise ImportError(
+            "Rendering an atlas with multiple processes requires pypdf, which can be installed with: pip install starplot[atlas]"
+        ) from None
+
+    return PdfWriter
+
+
+def _write_pdf(atlas: Atlas, filename, padding: float, kwargs: dict) -> None:
+    with PdfPages(filename) as pdf:
+        for plot in atlas:
+            plot.export(pdf, padding=padding, format="pdf", **kwargs)
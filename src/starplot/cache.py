@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+
+import numpy as np
+
+from starplot.config import settings
+
+
+class PositionCache:
+    """
+    Memory-bounded cache of calculated object positions, shared by all plots in the process.
+
+    Positions are stored per key (e.g. catalog + observation time + location) as arrays that are
+    indexed by the object's primary key (`pk`). When the cache exceeds its max size, then the least
+    recently used keys are evicted.
+
+    Args:
+        max_megabytes: Maximum size of the cache. If `None`, then the `position_cache_size` setting will be used.
+    """
+
+    def __init__(self, max_megabytes: int = None):
+        self.max_megabytes = max_megabytes
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.nbytes = 0
+        """Total size (in bytes) of all cached positions"""
+
+    @property
+    def max_bytes(self) -> int:
+        max_megabytes = (
+            self.max_megabytes
+            if self.max_megabytes is not None
+            else settings.position_cache_size
+        )
+        return int(max_megabytes * 1024**2)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Removes all cached positions"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def get(self, key: tuple, pks: np.ndarray, columns: int):
+        """
+        Returns cached positions for the primary keys
+
+        Args:
+            key: Cache key
+            pks: Array of primary keys
+            columns: Number of values stored for each position
+
+        Returns:
+            Tuple of (found, values) where `found` is a boolean array of which pks were found in the cache, and `values` is an array with shape (len(pks), columns). Values of missing pks are NaN.
+        """
+        pks = np.asarray(pks)
+        found = np.zeros(len(pks), dtype=bool)
+        values = np.full((len(pks), columns), np.nan)
+
+        if len(pks) == 0:
+            return found, values
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return found, values
+            self._entries.move_to_end(key)
+
+        # cached arrays are never modified (merging replaces them), so they're read outside of the lock
+        cached_pks, cached_values = entry
+
+        ix = np.minimum(np.searchsorted(cached_pks, pks), len(cached_pks) - 1)
+        found = cached_pks[ix] == pks
+        values[found] = cached_values[ix[found]]
+
+        return found, values
+
+    def put(self, key: tuple, pks: np.ndarray, values: np.ndarray) -> None:
+        """
+        Adds positions to the cache (merging them with any positions already cached for the key)
+
+        Args:
+            key: Cache key
+            pks: Array of primary keys
+            values: Array of positions with shape (len(pks), columns)
+        """
+        max_bytes = self.max_bytes
+        pks = np.asarray(pks)
+        values = np.asarray(values, dtype=float)
+
+        if max_bytes <= 0 or len(pks) == 0:
+            return
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None:
+                cached_pks, cached_values = entry
+                self.nbytes -= cached_pks.nbytes + cached_values.nbytes
+                is_new = ~np.isin(pks, cached_pks)
+                pks = np.concatenate([cached_pks, pks[is_new]])
+                values = np.concatenate([cached_values, values[is_new]])
+
+            order = np.argsort(pks, kind="stable")
+            pks, values = pks[order], values[order]
+            size = pks.nbytes + values.nbytes
+
+            if size > max_bytes:
+                return
+
+            self._entries[key] = (pks, values)
+            self.nbytes += size
+
+            while self.nbytes > max_bytes:
+                _, (evicted_pks, evicted_values) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_pks.nbytes + evicted_values.nbytes
+
+
+positions = PositionCache()
+"""Process-wide cache of calculated star positions"""
+
+
+def memoize(maxsize: int = 1024):
+    """
+    Decorator for memoizing instance methods.
+
+    Unlike `functools.cache`, the memoized results are stored on the instance (so they're released with the instance,
+    instead of keeping every instance reachable for the life of the process) and the number of results per instance
+    is bounded (least recently used results are evicted).
+
+    Args:
+        maxsize: Maximum number of results to keep for each instance
+    """
+
+    def decorator(func):
+        attribute = f"_memoized_{func.__name__}"
+
+        def _results(instance) -> OrderedDict:
+            results = instance.__dict__.get(attribute)
+
+            if results is None:
+                results = instance.__dict__[attribute] = OrderedDict()
+
+            return results
+
+        def _store(results: OrderedDict, key, result) -> None:
+            results[key] = result
+
+            if len(results) > maxsize:
+                results.popitem(last=False)
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            results = _results(self)
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+
+            if key in results:
+                results.move_to_end(key)
+                return results[key]
+
+            result = func(self, *args, **kwargs)
+            _store(results, key, result)
+            return result
+
+        def cache_clear(instance) -> None:
+            """Removes all memoized results of the instance"""
+            instance.__dict__.pop(attribute, None)
+
+        def cache_set(instance, result, *args, **kwargs) -> None:
+            """Stores the result of calling the method with the arguments (e.g. when results are computed in a batch)"""
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+            _store(_results(instance), key, result)
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_set = cache_set
+        return wrapper
+
+    return decorator
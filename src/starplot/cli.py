@@ -13,7 +13,7 @@ def setup(options):
     db.connect()  # installs spatial extension as side-effect
 
     print("Building font cache...")
-    fonts.load()
+    fonts.load(rebuild=True)
 
     print(f"Downloading data catalogs to: {settings.data_path}")
     download_all_catalogs()
@@ -21,6 +21,14 @@ def _get_boolean(var_name, default) -> bool:
     return _get
 
 
+def _get_number(var_name, default, number_type=float):
+    def _get():
+        value = os.environ.get(var_name)
+        return default if not value else number_type(value)
+
+    return _get
+
+
 class SvgTextType(str, Enum):
     PATH = "path"
     ELEMENT = "element"
@@ -53,6 +61,15 @@ class Settings:
     
     """
 
+    svg_compact: bool = field(
+        default_factory=_get_boolean("STARPLOT_SVG_COMPACT", False)
+    )
+    """
+    If `True`, then SVG exports will be compacted by defining repeated shapes (e.g. markers of the same size) and styles once, and then referencing them. This makes files smaller and faster to open, but takes a little longer to export.
+
+    Default = `False`
+    """
+
     language: str = field(
         default_factory=lambda: os.environ.get("STARPLOT_LANGUAGE", "en-US")
     )
@@ -72,6 +89,33 @@ class Settings:
     **🌐 Want to see another language available? Please help us add it! [Details here](https://github.com/steveberardi/starplot/tree/main/data/raw/translations).**
     """
 
+    position_cache_size: int = field(
+        default_factory=_get_number("STARPLOT_POSITION_CACHE_SIZE", 128, int)
+    )
+    """
+    Maximum memory (in megabytes) used for caching calculated star positions, which are shared by all plots in the process. When the cache is full, the least recently used positions are evicted.
+
+    Set to `0` to disable the cache.
+    """
+
+    position_cache_tolerance: float = field(
+        default_factory=_get_number("STARPLOT_POSITION_CACHE_TOLERANCE", 1.0)
+    )
+    """
+    Time tolerance (in seconds) for sharing cached star positions -- plots with observation times in the same tolerance window will reuse the same positions.
+
+    Default = `1.0`
+    """
+
+    altaz_reference: bool = field(
+        default_factory=_get_boolean("STARPLOT_ALTAZ_REFERENCE", False)
+    )
+    """
+    If `True`, then plots in AZ/ALT (horizon and optic plots) will use Skyfield's full apparent positions for every RA/DEC to AZ/ALT conversion, instead of the vectorized transform engine. This is much slower, and only intended as a reference for checking the engine's accuracy.
+
+    Default = `False`
+    """
+
     debug: bool = field(default_factory=_get_boolean("STARPLOT_DEBUG", False))
     """Global setting for debug mode. When this is enabled, Starplot will log debugging information and plot polygons for debugging text issues"""
 
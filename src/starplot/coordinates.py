@@ -1,3 +1,8 @@
+from enum import Enum
+
+import numpy as np
+
+
 class CoordinateSystem:
     RA_DEC = "radec"
     AZ_ALT = "azalt"
@@ -5,3 +10,54 @@ class CoordinateSystem:
     PROJECTED = "projected"
     DISPLAY = "display"
     GALACTIC = "galactic"
+
+
+class AstrometryMode(str, Enum):
+    """Methods for calculating the positions of stars"""
+
+    CATALOG = "catalog"
+    """Positions as they're stored in the catalog (no proper motion)"""
+
+    PROPER_MOTION = "proper_motion"
+    """Catalog positions propagated (linearly) by their proper motion to the observer's epoch"""
+
+    APPARENT = "apparent"
+    """Full astrometry via Skyfield, which includes light-time and parallax (and aberration/refraction for plots in AZ/ALT)"""
+
+
+MAS_PER_DEGREE = 3_600_000
+
+
+def propagate_proper_motion(
+    ra, dec, ra_mas_per_year, dec_mas_per_year, epoch_year, target_epoch_year
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Propagates positions by their proper motion, using a linear approximation (which is accurate to
+    well under an arcsecond for all catalog stars over a few centuries).
+
+    Args:
+        ra: Right ascension(s) in degrees
+        dec: Declination(s) in degrees
+        ra_mas_per_year: Proper motion in right ascension (μα*, which includes the cos(dec) factor), in milliarcseconds per year
+        dec_mas_per_year: Proper motion in declination, in milliarcseconds per year
+        epoch_year: Epoch(s) of the positions (Julian year)
+        target_epoch_year: Epoch to propagate the positions to (Julian year)
+
+    Returns:
+        Tuple of (RA, DEC) arrays, in degrees
+    """
+    ra = np.asarray(ra, dtype=float)
+    dec = np.asarray(dec, dtype=float)
+    years = target_epoch_year - np.nan_to_num(
+        np.asarray(epoch_year, dtype=float), nan=target_epoch_year
+    )
+    pm_ra = np.nan_to_num(np.asarray(ra_mas_per_year, dtype=float))
+    pm_dec = np.nan_to_num(np.asarray(dec_mas_per_year, dtype=float))
+
+    # avoid dividing by zero at the poles
+    cos_dec = np.maximum(np.cos(np.radians(dec)), 1e-9)
+
+    ra_out = (ra + pm_ra * years / MAS_PER_DEGREE / cos_dec) % 360
+    dec_out = np.clip(dec + pm_dec * years / MAS_PER_DEGREE, -90, 90)
+
+    return ra_out, dec_out
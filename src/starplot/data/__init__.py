@@ -1,15 +1,50 @@
-# ruff: noqa: F401,F403
-
+from functools import cache
 from pathlib import Path
+from threading import Lock
 
 from skyfield.api import Loader
+from skyfield.jpllib import SpiceKernel
+from skyfield.timelib import Timescale
 
 from starplot.config import settings
-from .catalogs import Catalog
+from starplot.lazy import lazy_imports
+
+__getattr__, __dir__ = lazy_imports(__name__, {"Catalog": ".catalogs"})
 
 load = Loader(settings.data_path)  # used for loading ephemeris
 
 
+_ephemerides = {}
+_ephemerides_lock = Lock()
+
+
+@cache
+def timescale() -> Timescale:
+    """Returns the Skyfield timescale, which is loaded on first use"""
+    return load.timescale()
+
+
+def load_ephemeris(name: str = "de421.bsp") -> SpiceKernel:
+    """
+    Returns the Skyfield ephemeris (downloading it to the data path if necessary).
+
+    Each ephemeris file is only opened once per process, so all plots and models share the same instance. The ephemeris data is memory-mapped, so it's only read from disk as it's needed, and worker processes that are forked after an ephemeris is loaded share its pages (instead of each worker having its own copy).
+
+    Args:
+        name: Filename of the ephemeris (e.g. `de421.bsp`)
+    """
+    kernel = _ephemerides.get(name)
+
+    if kernel is None:
+        with _ephemerides_lock:
+            kernel = _ephemerides.get(name)
+
+            if kernel is None:
+                kernel = _ephemerides[name] = load(name)
+
+    return kernel
+
+
 HERE = Path(__file__).resolve().parent
 
 INTERNAL_DATA_PATH = HERE / "library"
@@ -292,6 +292,243 @@ def line_segment(start, end, step) -> list[tuple[float, float]]:
     return LineString([start, end]).segmentize(step).coords
 
 
+class LineSegmentIndex:
+    """
+    Collision index of line segments, in display coordinates.
+
+    Segments are stored as-is (instead of as sampled points in an R-Tree), and queries
+    test a rectangle against all segments in one vectorized pass, so collisions are exact
+    (including diagonal lines) and the index stays small.
+    """
+
+    def __init__(self):
+        self._segments = np.empty((0, 4), dtype=float)
+        self._padding = np.empty(0, dtype=float)
+        self._pending = []
+
+    def __len__(self) -> int:
+        return len(self._segments) + sum(len(p) for p, _ in self._pending)
+
+    def insert(self, start, end, padding: float = 0) -> None:
+        """
+        Adds a line segment to the index
+
+        Args:
+            start: Start of segment (x, y)
+            end: End of segment (x, y)
+            padding: Distance around the segment that is also considered a collision (e.g. half the line width)
+        """
+        self.insert_many([(*start, *end)], padding)
+
+    def insert_many(self, segments, padding: float = 0) -> None:
+        """
+        Adds many line segments to the index
+
+        Args:
+            segments: Array-like of segments, with shape (N, 4) -- each row is (x0, y0, x1, y1)
+            padding: Distance around each segment that is also considered a collision
+        """
+        segments = np.asarray(segments, dtype=float).reshape(-1, 4)
+        segments = segments[np.isfinite(segments).all(axis=1)]
+
+        if len(segments):
+            self._pending.append((segments, np.full(len(segments), float(padding))))
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+
+        segments, padding = zip(*self._pending)
+        self._segments = np.concatenate([self._segments, *segments])
+        self._padding = np.concatenate([self._padding, *padding])
+        self._pending = []
+
+    def intersection(self, bbox, polygon: np.ndarray = None) -> np.ndarray:
+        """
+        Returns indices of all segments that intersect the bounding box
+
+        Args:
+            bbox: Bounding box (xmin, ymin, xmax, ymax)
+            polygon: Optional convex polygon (e.g. a rotated label box) inside the bounding box, as an array of vertices with shape (N, 2). If specified, then segments are tested against this polygon instead of the full bounding box.
+
+        Returns:
+            Array of segment indices
+        """
+        self._flush()
+
+        if not len(self._segments):
+            return np.empty(0, dtype=int)
+
+        xmin, ymin, xmax, ymax = bbox
+        x0, y0, x1, y1 = self._segments.T
+        pad = self._padding
+
+        # quick rejection by the segment's own bounding box
+        candidates = np.flatnonzero(
+            (np.maximum(x0, x1) >= xmin - pad)
+            & (np.minimum(x0, x1) <= xmax + pad)
+            & (np.maximum(y0, y1) >= ymin - pad)
+            & (np.minimum(y0, y1) <= ymax + pad)
+        )
+
+        if not len(candidates):
+            return candidates
+
+        if polygon is None:
+            hits = segments_intersect_box(
+                self._segments[candidates],
+                (xmin, ymin, xmax, ymax),
+                padding=pad[candidates],
+            )
+        else:
+            hits = segments_intersect_polygon(
+                self._segments[candidates],
+                polygon,
+                padding=pad[candidates],
+            )
+        return candidates[hits]
+
+    def intersects(self, bbox, polygon: np.ndarray = None) -> bool:
+        """Returns True if any segment intersects the bounding box (xmin, ymin, xmax, ymax), or the polygon if specified"""
+        return len(self.intersection(bbox, polygon)) > 0
+
+
+def segments_intersect_box(segments: np.ndarray, bbox, padding=0) -> np.ndarray:
+    """
+    Vectorized segment vs axis-aligned rectangle test (Liang-Barsky clipping).
+
+    Args:
+        segments: Array of segments, with shape (N, 4) -- each row is (x0, y0, x1, y1)
+        bbox: Rectangle (xmin, ymin, xmax, ymax)
+        padding: Scalar or array of N values to expand the rectangle by for each segment
+
+    Returns:
+        Boolean array of length N, True where the segment intersects the rectangle
+    """
+    xmin, ymin, xmax, ymax = bbox
+    x0, y0, x1, y1 = np.asarray(segments, dtype=float).T
+    dx = x1 - x0
+    dy = y1 - y0
+
+    p = np.stack([-dx, dx, -dy, dy])
+    q = np.stack(
+        [
+            x0 - (xmin - padding),
+            (xmax + padding) - x0,
+            y0 - (ymin - padding),
+            (ymax + padding) - y0,
+        ]
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / p
+
+    t_enter = np.maximum(np.where(p < 0, r, -np.inf).max(axis=0), 0)
+    t_exit = np.minimum(np.where(p > 0, r, np.inf).min(axis=0), 1)
+    parallel_outside = ((p == 0) & (q < 0)).any(axis=0)
+
+    return (t_enter <= t_exit) & ~parallel_outside
+
+
+def segments_intersect_polygon(
+    segments: np.ndarray, polygon: np.ndarray, padding=0
+) -> np.ndarray:
+    """
+    Vectorized segment vs convex polygon test (separating axis theorem).
+
+    Args:
+        segments: Array of segments, with shape (N, 4) -- each row is (x0, y0, x1, y1)
+        polygon: Vertices of a convex polygon, with shape (M, 2)
+        padding: Scalar or array of N values to expand each segment by
+
+    Returns:
+        Boolean array of length N, True where the segment intersects the polygon
+    """
+    segments = np.asarray(segments, dtype=float)
+    polygon = np.asarray(polygon, dtype=float)
+    padding = np.broadcast_to(np.asarray(padding, dtype=float), len(segments))
+    starts, ends = segments[:, :2], segments[:, 2:]
+
+    # axes from the polygon's edges, shared by all segments
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    axes = np.column_stack([-edges[:, 1], edges[:, 0]])
+    axes = axes / np.linalg.norm(axes, axis=1)[:, None]
+
+    poly_proj = polygon @ axes.T  # (M vertices, M axes)
+    start_proj = starts @ axes.T  # (N, M)
+    end_proj = ends @ axes.T
+    seg_min = np.minimum(start_proj, end_proj) - padding[:, None]
+    seg_max = np.maximum(start_proj, end_proj) + padding[:, None]
+    overlaps = (seg_max >= poly_proj.min(axis=0)) & (seg_min <= poly_proj.max(axis=0))
+    result = overlaps.all(axis=1)
+
+    # the segment's own normal axis
+    direction = ends - starts
+    normals = np.column_stack([-direction[:, 1], direction[:, 0]])
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0] = 1
+    normals = normals / lengths[:, None]
+
+    seg_proj = np.einsum("ij,ij->i", starts, normals)
+    poly_on_normals = normals @ polygon.T  # (N, M)
+    result &= (seg_proj + padding >= poly_on_normals.min(axis=1)) & (
+        seg_proj - padding <= poly_on_normals.max(axis=1)
+    )
+
+    return result
+
+
+def rotated_rectangle(center, width: float, height: float, angle: float) -> np.ndarray:
+    """
+    Returns the corners of a rectangle rotated around its center.
+
+    Args:
+        center: Center of rectangle (x, y)
+        width: Width of rectangle (before rotation)
+        height: Height of rectangle (before rotation)
+        angle: Angle of rotation counterclockwise, in degrees
+
+    Returns:
+        Array of corners with shape (4, 2), in counterclockwise order
+    """
+    theta = np.radians(angle)
+    u = np.array([np.cos(theta), np.sin(theta)]) * width / 2
+    v = np.array([-np.sin(theta), np.cos(theta)]) * height / 2
+    c = np.asarray(center, dtype=float)
+    return np.array([c - u - v, c + u - v, c + u + v, c - u + v])
+
+
+def box_corners(bbox) -> np.ndarray:
+    """Returns the corners of a bounding box (xmin, ymin, xmax, ymax) as an array with shape (4, 2)"""
+    x0, y0, x1, y1 = bbox
+    return np.array([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], dtype=float)
+
+
+def convex_polygons_intersect(a: np.ndarray, b: np.ndarray) -> bool:
+    """
+    Returns True if two convex polygons intersect (separating axis theorem).
+
+    Args:
+        a: Vertices of first polygon, with shape (N, 2)
+        b: Vertices of second polygon, with shape (M, 2)
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+
+    for polygon in (a, b):
+        edges = np.roll(polygon, -1, axis=0) - polygon
+        axes = np.column_stack([-edges[:, 1], edges[:, 0]])
+        a_proj = a @ axes.T
+        b_proj = b @ axes.T
+        if (
+            (a_proj.max(axis=0) < b_proj.min(axis=0))
+            | (b_proj.max(axis=0) < a_proj.min(axis=0))
+        ).any():
+            return False
+
+    return True
+
+
 class BaseGeometry:
 
     """
@@ -0,0 +1,193 @@
+from dataclasses import dataclass, field
+from functools import partial, wraps
+from typing import Callable
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import Collection, LineCollection
+from matplotlib.patches import Patch
+
+
+@dataclass
+class TrackedArtist:
+    """An artist that's plotted at fixed RA/DEC, so it can be moved in place when the plot's time changes"""
+
+    artist: Artist
+    ra: np.ndarray
+    dec: np.ndarray
+    move: Callable[[np.ndarray, np.ndarray], None]
+    """Callable that moves the artist (and re-indexes it for collision detection) to new plotted coordinates (x, y)"""
+
+
+@dataclass
+class Layer:
+    """
+    Record of everything plotted by one call of a plotting function (e.g. `stars()`), which is used for
+    updating the plot to a new time without recreating it.
+    """
+
+    replay: Callable = None
+    """Callable that plots the layer again (e.g. to re-query its data). If `None`, the layer can only be moved in place."""
+
+    dynamic: bool = False
+    """If True, the layer depends on the time in ways other than the rotation of the sky (e.g. planets), so it's replayed on every update"""
+
+    lst: float = None
+    """Local sidereal time (degrees) of when the layer's data was queried"""
+
+    tracked: list[TrackedArtist] = field(default_factory=list)
+    labels: list[Callable] = field(default_factory=list)
+    """Label requests, which are re-solved (in order) when the layer moves"""
+
+    artists: list[Artist] = field(default_factory=list)
+    """All artists plotted by the layer, except labels"""
+
+    objects: dict = field(default_factory=dict)
+    label_keys: set = field(default_factory=set)
+
+    rasterize: bool = None
+    """If True, the layer's markers and areas are always rasterized in vector exports, and if False they're never rasterized. If `None`, they're rasterized when there are more of them than the export's threshold."""
+
+    @property
+    def is_static(self) -> bool:
+        """True if some of the layer's artists can't be moved in place"""
+        tracked = {id(t.artist) for t in self.tracked}
+        return any(id(a) not in tracked for a in self.artists)
+
+    def needs_replay(self, lst: float, requery_degrees: float) -> bool:
+        if self.replay is None:
+            return False
+
+        if self.dynamic or self.is_static:
+            return True
+
+        drift = abs((lst - self.lst + 180) % 360 - 180)
+        return drift > requery_degrees
+
+    def rasterizable(self, threshold: int = None) -> list[Artist]:
+        """
+        Returns the artists of the layer to rasterize in vector exports: markers and areas (e.g. stars,
+        DSO outlines, Milky Way polygons), but never lines or text, which stay sharp as vectors.
+
+        Args:
+            threshold: Number of elements (e.g. markers or polygons) that the layer must have more of to be rasterized. If `None`, then the layer is only rasterized if its `rasterize` is True.
+        """
+        if self.rasterize is False:
+            return []
+
+        # layers of plotting calls outside of plotting functions (e.g. markers) only have tracked artists
+        artists = {id(a): a for a in self.artists}
+        artists.update((id(t.artist), t.artist) for t in self.tracked)
+        artists = [a for a in artists.values() if _is_area(a)]
+
+        if self.rasterize:
+            return artists
+
+        if threshold is None or sum(_element_count(a) for a in artists) <= threshold:
+            return []
+
+        return artists
+
+
+def _is_area(artist: Artist) -> bool:
+    if isinstance(artist, LineCollection):
+        return False
+    return isinstance(artist, (Collection, Patch))
+
+
+def _element_count(artist: Artist) -> int:
+    if isinstance(artist, Collection):
+        return max(len(artist.get_offsets()), len(artist.get_paths()))
+    return 1
+
+
+OBJECT_LISTS = ("stars", "constellations", "dsos", "planets")
+OBJECT_FIELDS = ("moon", "sun")
+
+
+def plot_layer(func=None, dynamic: bool = False):
+    """
+    Decorator for plotting functions that records what they plot as a [Layer][starplot.layers.Layer].
+
+    Calls of other plotting functions (e.g. `marker()` from `planets()`) are recorded as part of the
+    outermost layer.
+
+    Args:
+        dynamic: If True, then the layer is replotted on every time update
+
+    Decorated functions also accept a keyword argument `rasterize`, which sets the
+    [rasterization][starplot.layers.Layer.rasterize] of the layer in vector exports.
+    """
+
+    if func is None:
+        return partial(plot_layer, dynamic=dynamic)
+
+    @wraps(func)
+    def wrapper(self, *args, rasterize: bool = None, **kwargs):
+        if self._active_layer is not None:
+            return func(self, *args, **kwargs)
+
+        layer = Layer(
+            replay=partial(wrapper, self, *args, rasterize=rasterize, **kwargs),
+            dynamic=dynamic,
+            lst=self.observer.lst,
+            rasterize=rasterize,
+        )
+        self._layers.append(layer)
+        self._active_layer = layer
+
+        children = set(self.ax.get_children())
+        objects = {name: len(getattr(self._objects, name)) for name in OBJECT_LISTS}
+        moon, sun = self._objects.moon, self._objects.sun
+        label_keys = set(self._labeled)
+        labels = len(self.labels)
+
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._active_layer = None
+
+            placed = {id(label) for label in self.labels[labels:]}
+            layer.artists = [
+                a
+                for a in self.ax.get_children()
+                if a not in children and id(a) not in placed
+            ]
+            layer.objects = {
+                name: getattr(self._objects, name)[count:]
+                for name, count in objects.items()
+            }
+            if self._objects.moon is not moon:
+                layer.objects["moon"] = self._objects.moon
+            if self._objects.sun is not sun:
+                layer.objects["sun"] = self._objects.sun
+            layer.label_keys = set(self._labeled) - label_keys
+
+    return wrapper
+
+
+def object_layer(func):
+    """
+    Decorator for functions that plot a single object (e.g. `marker()`), which accept a keyword
+    argument `rasterize` that sets the [rasterization][starplot.layers.Layer.rasterize] of the object
+    in vector exports.
+
+    If `rasterize` is set, then the object is plotted in a layer of its own, unless it's plotted by
+    another plotting function (e.g. `planets()`), in which case it's part of that function's layer.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, rasterize: bool = None, **kwargs):
+        if rasterize is None or self._active_layer is not None:
+            return func(self, *args, **kwargs)
+
+        layer = Layer(lst=self.observer.lst, rasterize=rasterize)
+        self._layers.append(layer)
+        self._active_layer = layer
+
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._active_layer = None
+
+    return wrapper
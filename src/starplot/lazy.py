@@ -0,0 +1,49 @@
+import sys
+from importlib import import_module
+
+
+def lazy_imports(module_name: str, imports: dict[str, str]):
+    """
+    Creates the module-level `__getattr__` and `__dir__` functions for a package that resolves its public names on first access, so importing the package doesn't import all of its (heavy) dependencies.
+
+    Example:
+
+    ```python
+    __getattr__, __dir__ = lazy_imports(__name__, {"MapPlot": ".plots"})
+    ```
+
+    Args:
+        module_name: Name of the module (i.e. `__name__`)
+        imports: Dictionary of public names to the module that defines each name (relative modules are resolved from `module_name`). Submodules of the package are also imported on first access.
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str):
+        source = imports.get(name)
+
+        if source is None:
+            # submodules (e.g. `starplot.callables`) used to be available after importing the package
+            submodule = f"{module_name}.{name}"
+            try:
+                return import_module(submodule)
+            except ModuleNotFoundError as e:
+                if e.name != submodule:
+                    raise
+                raise AttributeError(
+                    f"module {module_name!r} has no attribute {name!r}"
+                ) from None
+
+        source_module = import_module(source, module_name)
+        try:
+            value = getattr(source_module, name)
+        except AttributeError:
+            # submodules of the source (e.g. `styles.fonts`) aren't attributes until they're imported
+            value = import_module(f"{source_module.__name__}.{name}")
+
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(module)) | set(imports))
+
+    return __getattr__, __dir__
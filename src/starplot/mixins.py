@@ -1,11 +1,16 @@
-from functools import cache
+from datetime import datetime
 
+import rtree
 from shapely import Polygon, MultiPolygon
+
 from starplot.profile import profile
+from starplot.cache import memoize
+from starplot.geometry import LineSegmentIndex
+from starplot.layers import OBJECT_FIELDS, Layer
 
 
 class ExtentMaskMixin:
-    @cache
+    @memoize(maxsize=1)
     def _extent_mask(self):
         """
         Returns shapely geometry objects of extent (RA = 0...360)
@@ -76,7 +81,7 @@ class ExtentMaskMixin:
 class HorizonExtentMaskMixin:
     """Experimental"""
 
-    @cache
+    @memoize(maxsize=1)
     def _extent_mask_original(self):
         """
         Returns shapely geometry objects of extent (RA = 0...360)
@@ -117,7 +122,7 @@ class HorizonExtentMaskMixin:
             )
 
     @profile
-    @cache
+    @memoize(maxsize=1)
     def _extent_mask2(self):
         """generally working"""
         coords = []
@@ -149,7 +154,7 @@ class HorizonExtentMaskMixin:
         return extent
 
     @profile
-    @cache
+    @memoize(maxsize=1)
     def _extent_mask1(self):
         from shapely import segmentize
 
@@ -200,14 +205,11 @@ class HorizonExtentMaskMixin:
         return extent
 
     def _axes_to_azalt(self, x: float, y: float) -> tuple[float, float]:
-        trans = self.ax.transAxes + self.ax.transData.inverted()
-        x_projected, y_projected = self.ax.transAxes.inverted().transform((x, y))
-        x_projected, y_projected = trans.transform((x, y))  # axes to data
-        az, alt = self._crs.transform_point(x_projected, y_projected, self._proj)
+        az, alt = self._projector.point_from_axes(x, y)
         return float(az), float(alt)
 
     @profile
-    @cache
+    @memoize(maxsize=1)
     def _extent_mask(self):
         coords = []
         azalt = []
@@ -296,6 +298,94 @@ class HorizonExtentMaskMixin:
         )
 
 
+class TimeUpdateMixin:
+    REQUERY_DEGREES = 1.0
+    """Default for how far (in degrees) the sky can rotate before plotted data is re-queried on time updates"""
+
+    def update_time(self, dt: datetime, requery_degrees: float = None) -> None:
+        """
+        Updates the plot to a new time, by moving everything that's already plotted instead of creating a new plot. This is much faster than creating a new plot for each frame of an animation.
+
+        Stars, constellations, markers, lines, and polygons are moved in place, and then all labels are placed again. Data is only re-queried (i.e. the plotting function is called again) after the sky has rotated more than `requery_degrees` since the data was queried, so objects that come into view are plotted. Solar system objects (e.g. planets) are always plotted again, since they also move relative to the stars.
+
+        Objects that were plotted directly on the Matplotlib axes are not updated.
+
+        Args:
+            dt: New date/time of the observer (**must be timezone-aware**)
+            requery_degrees: How far (in degrees) the sky can rotate before data is re-queried. If `None`, then the default of the plot type will be used.
+        """
+        observer = type(self.observer)(
+            dt=dt,
+            **self.observer.model_dump(
+                include=set(self.observer.model_fields) - {"dt"}
+            ),
+        )
+        self._update_observer(observer, requery_degrees)
+
+    def _update_observer(self, observer, requery_degrees: float = None) -> None:
+        """Updates the plot to a new observer (see `update_time()`)"""
+        if requery_degrees is None:
+            requery_degrees = self.REQUERY_DEGREES
+
+        self._set_observer(observer)
+
+        for label in self.labels:
+            label.remove()
+
+        self.labels = []
+        self.labels_dropped = 0
+        self._label_seconds = 0.0
+        self._labels_rtree = rtree.index.Index()
+        self._stars_rtree = rtree.index.Index()
+        self._markers_rtree = rtree.index.Index()
+        self._constellations_index = LineSegmentIndex()
+
+        layers, self._layers = self._layers, []
+
+        for layer in layers:
+            if layer.needs_replay(observer.lst, requery_degrees):
+                self._remove_layer(layer)
+                layer.replay()
+            else:
+                self._move_layer(layer)
+                self._layers.append(layer)
+
+    def _set_observer(self, observer) -> None:
+        self.observer = observer
+
+    def _move_layer(self, layer: Layer) -> None:
+        for tracked in layer.tracked:
+            x, y = self._prepare_coords_array(tracked.ra, tracked.dec)
+            tracked.move(x, y)
+
+        self._resolving_labels = True
+        try:
+            for request in layer.labels:
+                request()
+        finally:
+            self._resolving_labels = False
+
+    def _remove_layer(self, layer: Layer) -> None:
+        for artist in layer.artists:
+            if artist.axes is not None:
+                artist.remove()
+
+        for name, objects in layer.objects.items():
+            if name in OBJECT_FIELDS:
+                if getattr(self._objects, name) is objects:
+                    setattr(self._objects, name, None)
+                continue
+
+            removed = {id(o) for o in objects}
+            setattr(
+                self._objects,
+                name,
+                [o for o in getattr(self._objects, name) if id(o) not in removed],
+            )
+
+        self._labeled.discard(*layer.label_keys)
+
+
 class CreateMapMixin:
     def create_map(self, height_degrees: float, width_degrees: float, *args, **kwargs):
         """
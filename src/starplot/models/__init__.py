@@ -1,21 +1,26 @@
-# ruff: noqa: F401,F403
+from starplot.lazy import lazy_imports
 
-from .constellation import Constellation, ConstellationBorder
-from .comet import Comet
-from .dso import DSO, DsoType
-from .star import Star
-from .planet import Planet
-from .moon import Moon
-from .sun import Sun
-from .optics import (
-    Optic,
-    Scope,
-    Reflector,
-    Refractor,
-    Binoculars,
-    Camera,
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "Constellation": ".constellation",
+        "ConstellationBorder": ".constellation",
+        "Comet": ".comet",
+        "DSO": ".dso",
+        "DsoType": ".dso",
+        "Star": ".star",
+        "Planet": ".planet",
+        "Moon": ".moon",
+        "Sun": ".sun",
+        "Optic": ".optics",
+        "Scope": ".optics",
+        "Reflector": ".optics",
+        "Refractor": ".optics",
+        "Binoculars": ".optics",
+        "Camera": ".optics",
+        "ObjectList": ".objects",
+        "Satellite": ".satellite",
+        "Observer": ".observer",
+        "MilkyWay": ".milky_way",
+    },
 )
-from .objects import ObjectList
-from .satellite import Satellite
-from .observer import Observer
-from .milky_way import MilkyWay
@@ -7,7 +7,7 @@ from skyfield.data import mpc
 from skyfield.constants import GM_SUN_Pitjeva_2005_km3_s2 as GM_SUN
 from shapely import Point
 
-from starplot.data import load
+from starplot.data import load, load_ephemeris, timescale
 from starplot.models.base import SkyObject
 from starplot.models.observer import Observer
 
@@ -285,8 +285,8 @@ def get_comet_at_date_location(
     """
     Creates a Comet instance for date and (optional) observing location.
     """
-    ts = load.timescale()
-    eph = load(ephemeris)
+    ts = timescale()
+    eph = load_ephemeris(ephemeris)
     c = eph["sun"] + mpc.comet_orbit(comet, ts, GM_SUN)
     ra, dec, distance = observer._astrometric(c, ephemeris=ephemeris)
 
@@ -7,7 +7,7 @@ from shapely import Polygon
 from skyfield.api import Angle
 from skyfield import almanac
 
-from starplot.data import load
+from starplot.data import load_ephemeris
 from starplot.models.observer import Observer
 from starplot.models.base import SkyObject
 from starplot.geometry import circle
@@ -69,7 +69,7 @@ class Moon(SkyObject):
         observer = observer or Observer(lat=None, lon=None)
         timescale = observer.timescale
 
-        eph = load(ephemeris)
+        eph = load_ephemeris(ephemeris)
         moon = eph["moon"]
 
         ra, dec, distance = observer._astrometric(moon, ephemeris=ephemeris)
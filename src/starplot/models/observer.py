@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from functools import cached_property, cache
+from functools import cached_property
 from typing import Callable
 
 
@@ -7,9 +7,9 @@ from pydantic import BaseModel, AwareDatetime, Field, computed_field
 from skyfield.timelib import Timescale
 from skyfield.api import wgs84, Star as SkyfieldStar
 
-from starplot.data import load
-
-ts = load.timescale()
+from starplot.cache import memoize
+from starplot.data import load_ephemeris, timescale
+from starplot.transforms import AltAzTransform
 
 
 class Observer(BaseModel):
@@ -61,7 +61,7 @@ class Observer(BaseModel):
 
         Timescale instance of the specified datetime (used by Skyfield)
         """
-        return ts.from_datetime(self.dt)
+        return timescale().from_datetime(self.dt)
 
     @computed_field
     @cached_property
@@ -83,9 +83,9 @@ class Observer(BaseModel):
         """
         Returns an Observer for the specified epoch (Julian year)
         """
-        return Observer(dt=ts.J(epoch).utc_datetime())
+        return Observer(dt=timescale().J(epoch).utc_datetime())
 
-    @cache
+    @memoize(maxsize=8)
     def position(self, ephemeris: str = "de421.bsp"):
         """
         Returns a Skyfield position for this observer.
@@ -95,7 +95,7 @@ class Observer(BaseModel):
         Args:
             ephemeris: Ephemeris to use
         """
-        eph = load(ephemeris)
+        eph = load_ephemeris(ephemeris)
         earth = eph["earth"]
 
         if self.lat is None and self.lon is None:
@@ -103,10 +103,14 @@ class Observer(BaseModel):
 
         return earth + wgs84.latlon(self.lat, self.lon, self.elevation)
 
-    @cache
+    @memoize(maxsize=8)
     def observe(self, ephemeris: str = "de421.bsp") -> Callable:
         return self.position(ephemeris).at(self.timescale).observe
 
+    @memoize(maxsize=8)
+    def _altaz_transform(self, ephemeris: str = "de421.bsp") -> AltAzTransform:
+        return AltAzTransform.from_observer(self, ephemeris)
+
     def _astrometric(self, obj: SkyfieldStar, ephemeris: str = "de421.bsp"):
         ra, dec, distance = self.observe(ephemeris)(obj).radec()
         return ra, dec, distance
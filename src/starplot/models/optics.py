@@ -337,6 +337,6 @@ class Camera(Optic):
         px = x * math.cos(radians) - y * math.sin(radians)
         py = x * math.sin(radians) + y * math.cos(radians)
 
-        in_bounds_x = px < self.radius_x * scale and px > -1 * self.radius_x * scale
-        in_bounds_y = py < self.radius_y * scale and py > -1 * self.radius_y * scale
-        return in_bounds_x and in_bounds_y
+        in_bounds_x = (px < self.radius_x * scale) & (px > -1 * self.radius_x * scale)
+        in_bounds_y = (py < self.radius_y * scale) & (py > -1 * self.radius_y * scale)
+        return in_bounds_x & in_bounds_y
@@ -8,7 +8,7 @@ import numpy as np
 from shapely import Polygon
 from skyfield.api import Angle
 
-from starplot.data import load
+from starplot.data import load_ephemeris
 from starplot.models.base import SkyObject
 from starplot.models.observer import Observer
 from starplot.geometry import circle
@@ -92,7 +92,7 @@ class Planet(SkyObject):
         """
 
         observer = observer or Observer(lat=None, lon=None)
-        eph = load(ephemeris)
+        eph = load_ephemeris(ephemeris)
 
         for p in PlanetName:
             planet = eph[f"{p.value} barycenter"]
@@ -5,12 +5,10 @@ from typing import Iterator
 from shapely import Point
 from skyfield.api import wgs84, EarthSatellite
 
-from starplot.data import load
+from starplot.data import timescale
 from starplot.models.base import SkyObject
 from starplot.models.observer import Observer
 
-ts = load.timescale()
-
 
 @dataclass(slots=True, kw_only=True)
 class Satellite(SkyObject):
@@ -51,7 +49,7 @@ class Satellite(SkyObject):
         """
         observer = observer or Observer()
         return get_satellite_at_date_location(
-            satellite=EarthSatellite.from_omm(ts, data),
+            satellite=EarthSatellite.from_omm(timescale(), data),
             observer=observer,
         )
 
@@ -79,7 +77,7 @@ class Satellite(SkyObject):
                 line1,
                 line2,
                 name,
-                ts,
+                timescale(),
             ),
             observer=observer,
         )
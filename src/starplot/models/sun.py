@@ -5,7 +5,7 @@ import numpy as np
 from shapely import Polygon
 from skyfield.api import Angle
 
-from starplot.data import load
+from starplot.data import load_ephemeris
 from starplot.models.base import SkyObject
 from starplot.models.observer import Observer
 from starplot.geometry import circle
@@ -43,7 +43,7 @@ class Sun(SkyObject):
         RADIUS_KM = 695_700
 
         observer = observer or Observer(lat=None, lon=None)
-        eph = load(ephemeris)
+        eph = load_ephemeris(ephemeris)
         sun = eph["sun"]
 
         ra, dec, distance = observer._astrometric(sun, ephemeris=ephemeris)
@@ -1,7 +1,12 @@
-# ruff: noqa: F401,F403
+from starplot.lazy import lazy_imports
 
-from .map import MapPlot
-from .horizon import HorizonPlot
-from .zenith import ZenithPlot
-from .optic import OpticPlot
-from .galaxy import GalaxyPlot
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "MapPlot": ".map",
+        "HorizonPlot": ".horizon",
+        "ZenithPlot": ".zenith",
+        "OpticPlot": ".optic",
+        "GalaxyPlot": ".galaxy",
+    },
+)
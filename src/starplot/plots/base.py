@@ -1,20 +1,28 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from enum import IntEnum
+from io import BytesIO
+from functools import cached_property, partial
+from pathlib import Path
+from threading import Lock
 from typing import Dict, Union, Optional
 import logging
 
 import numpy as np
-from matplotlib import patches
-from matplotlib import pyplot as plt, patheffects
+from matplotlib import patches, patheffects, rc_context
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
+from matplotlib.transforms import Bbox
+from PIL import Image
 from shapely import Polygon, LineString
 
-from starplot.coordinates import CoordinateSystem
-from starplot import models, warnings
+from starplot.coordinates import AstrometryMode, CoordinateSystem
+from starplot import models, svg, warnings
 from starplot import geometry as _geometry
 from starplot.config import settings as StarplotSettings, SvgTextType
-from starplot.data import load, ecliptic
+from starplot.data import load_ephemeris, ecliptic
 from starplot.data.translations import translate
 from starplot.models.planet import PlanetName, PLANET_LABELS_DEFAULT
 from starplot.models.moon import MoonPhase
@@ -33,9 +41,11 @@ from starplot.styles import (
     AnchorPointEnum,
 )
 from starplot.plotters.debug import DebugPlotterMixin
-from starplot.plotters.text import TextPlotterMixin, CollisionHandler
+from starplot.plotters.text import TextPlotterMixin, CollisionHandler, LabelBudget
 from starplot.styles.helpers import use_style
 from starplot.profile import profile
+from starplot.transforms import Projector
+from starplot.layers import Layer, TrackedArtist, object_layer, plot_layer
 
 LOGGER = logging.getLogger("starplot")
 LOG_HANDLER = logging.StreamHandler()
@@ -45,14 +55,68 @@ LOG_FORMATTER = logging.Formatter(
 LOG_HANDLER.setFormatter(LOG_FORMATTER)
 LOGGER.addHandler(LOG_HANDLER)
 
+RC_LOCK = Lock()
+"""Lock for changing matplotlib's (global) rcParams while exporting"""
+
 DEFAULT_RESOLUTION = 4096
 
+
+class PngStrategy(IntEnum):
+    """Compression strategies for PNG exports (the zlib strategy used for compressing the image data)"""
+
+    DEFAULT = 0
+    """Default strategy, which works best for most plots"""
+
+    FILTERED = 1
+    """Better for images with lots of gradual color changes (e.g. gradient backgrounds)"""
+
+    HUFFMAN_ONLY = 2
+    """Fastest compression, but biggest files"""
+
+    RLE = 3
+    """Fast compression that works well for images with large areas of the same color"""
+
+    FIXED = 4
+    """Prevents the use of dynamic Huffman codes, for faster decoding"""
+
+
 DPI = 100
 
+VECTOR_FORMATS = ("svg", "pdf", "eps", "ps")
+
+
+def _pil_kwargs(
+    compress_level: int = None, png_strategy: PngStrategy = None, quality: int = None
+) -> dict:
+    """Returns Pillow's encoder options for the export options"""
+    pil_kwargs = {}
+
+    if compress_level is not None:
+        if not 0 <= compress_level <= 9:
+            raise ValueError("compress_level must be between 0 and 9")
+        pil_kwargs["compress_level"] = compress_level
+
+    if png_strategy is not None:
+        pil_kwargs["compress_type"] = int(PngStrategy(png_strategy))
+
+    if quality is not None:
+        pil_kwargs["quality"] = quality
+
+    return pil_kwargs
+
+
+def _export_format(filename, file_format: str = None) -> str:
+    """Returns the format of an export, from the filename if the format isn't specified"""
+    if file_format is None and isinstance(filename, (str, Path)):
+        file_format = Path(filename).suffix[1:]
+
+    return (file_format or "").lower()
+
 
 class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
     _coordinate_system = CoordinateSystem.RA_DEC
     _gradient_direction: GradientDirection = GradientDirection.LINEAR
+    _astrometry: AstrometryMode = AstrometryMode.PROPER_MOTION
 
     def __init__(
         self,
@@ -63,6 +127,8 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         point_label_handler: CollisionHandler = None,
         area_label_handler: CollisionHandler = None,
         path_label_handler: CollisionHandler = None,
+        label_budget: LabelBudget = None,
+        astrometry: AstrometryMode = None,
         scale: float = 1.0,
         autoscale: bool = False,
         suppress_warnings: bool = True,
@@ -72,6 +138,11 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         super().__init__(*args, **kwargs)
 
         self._clip_path_polygon: Polygon = None  # clip path in display coordinates
+        self._tight_bbox_cache: tuple[
+            Bbox, int
+        ] = None  # bbox and the figure changes it was measured at
+        self._figure_changes = 0
+        self._exporting = False
 
         self.ax: Axes = None
         """
@@ -85,10 +156,11 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         The underlying [Matplotlib figure](https://matplotlib.org/stable/api/_as_gen/matplotlib.figure.Figure.html#matplotlib.figure.Figure) that the axes is drawn on.
         """
 
-        if StarplotSettings.svg_text_type == SvgTextType.PATH:
-            plt.rcParams["svg.fonttype"] = "path"
-        else:
-            plt.rcParams["svg.fonttype"] = "none"
+        self._svg_rc = {
+            "svg.fonttype": (
+                "path" if StarplotSettings.svg_text_type == SvgTextType.PATH else "none"
+            )
+        }
 
         px = 1 / DPI  # pixel in inches
         self.pixels_per_point = DPI / 72
@@ -127,6 +199,9 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         )
         """Default [collision handler][starplot.CollisionHandler] for path labels."""
 
+        self.label_budget = label_budget or LabelBudget()
+        """[Label budget][starplot.LabelBudget] for the plot."""
+
         self.scale = scale
         self.autoscale = autoscale
         if self.autoscale:
@@ -138,8 +213,11 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             warnings.suppress()
 
         self.observer = observer or Observer()
+
+        self.astrometry = AstrometryMode(astrometry or self._astrometry)
+        """[Method][starplot.AstrometryMode] for calculating star positions."""
         self.ephemeris_name = ephemeris
-        self.ephemeris = load(ephemeris)
+        self.ephemeris = load_ephemeris(ephemeris)
         self.earth = self.ephemeris["earth"]
 
         self._background_clip_path = None
@@ -150,8 +228,11 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         self.debug = StarplotSettings.debug or bool(kwargs.get("debug"))
         self.debug_text = StarplotSettings.debug or bool(kwargs.get("debug_text"))
         self.log_level = logging.DEBUG if self.debug else logging.ERROR
-        self.logger = LOGGER
-        self.logger.setLevel(self.log_level)
+
+        # each plot has its own logger (that isn't registered with the logging module, so it's
+        # released with the plot) which sends its messages to the handlers of the starplot logger
+        self.logger = logging.Logger(LOGGER.name, self.log_level)
+        self.logger.parent = LOGGER
 
         self.text_border = patheffects.withStroke(
             linewidth=self.style.text_border_width * self.scale,
@@ -159,20 +240,88 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         )
 
         self._objects = models.ObjectList()
-        self._labeled_stars = []
+
+        self._layers: list[Layer] = []
+        self._active_layer: Layer = None
+        self._resolving_labels = False
+
         fonts.load()
 
     def _plot_kwargs(self) -> dict:
         return {}
 
+    def _create_figure(self) -> Figure:
+        """
+        Creates the plot's figure with its own Agg canvas. The figure isn't created with pyplot, so it's
+        not registered with pyplot's (global) figure manager.
+        """
+        fig = Figure(
+            figsize=(self.figure_size, self.figure_size),
+            facecolor=self.style.figure_background_color.as_hex(),
+            dpi=DPI,
+        )
+        FigureCanvasAgg(fig)
+        fig.stale_callback = self._figure_changed
+        return fig
+
+    def _figure_changed(self, figure, stale) -> None:
+        """Counts changes of the figure (or any of its artists), which are propagated to the figure by matplotlib"""
+        # savefig temporarily changes (and then restores) the figure's bbox, which isn't a change of the plot
+        if not self._exporting:
+            self._figure_changes += 1
+
     def _prepare_coords(self, ra, dec) -> tuple[float, float]:
         return ra, dec
 
     def _prepare_coords_many(self, coordinates: list, epoch_year: float = 2000) -> list:
         return coordinates
 
+    def _prepare_coords_array(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized version of `_prepare_coords`, which returns a tuple of (x, y) arrays"""
+        coordinates = self._prepare_coords_many(list(zip(ra, dec)))
+
+        if not len(coordinates):
+            return np.empty(0), np.empty(0)
+
+        x, y = np.array(coordinates, dtype=float).T
+        return x, y
+
+    def _current_layer(self) -> Layer:
+        """Returns the layer that's being plotted (or a layer for plotting calls that aren't part of another layer)"""
+        if self._active_layer is not None:
+            return self._active_layer
+
+        last = self._layers[-1] if self._layers else None
+
+        if last is None or last.replay is not None or last.rasterize is not None:
+            self._layers.append(Layer())
+
+        return self._layers[-1]
+
+    def _track(self, artist, ra, dec, move) -> None:
+        """Tracks an artist that's plotted at fixed RA/DEC, so it can be moved in place when the plot's time changes"""
+        self._current_layer().tracked.append(
+            TrackedArtist(
+                artist=artist,
+                ra=np.asarray(ra, dtype=float),
+                dec=np.asarray(dec, dtype=float),
+                move=move,
+            )
+        )
+
+    def _record_label(self, request) -> None:
+        """Records a label request, so the label can be placed again when the plot's time changes"""
+        if not self._resolving_labels:
+            self._current_layer().labels.append(request)
+
+    @cached_property
+    def _projector(self) -> Projector:
+        """Projects prepared coordinates (e.g. RA/DEC or AZ/ALT) to data, display, and axes coordinates"""
+        return Projector(self._crs, self._proj, self.ax)
+
     def _update_clip_path_polygon(self, buffer=8):
-        self.fig.draw_without_rendering()
+        # only the axes position is needed for the patch's display coordinates (not a draw of the figure)
+        self.ax.apply_aspect()
         coords = self._background_clip_path.get_verts()
         self._clip_path_polygon = Polygon(coords).buffer(-1 * buffer)
 
@@ -202,7 +351,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             )
 
     def _fit_to_ax(self) -> None:
-        self.fig.draw_without_rendering()
+        self.ax.apply_aspect()
         bbox = self.ax.get_window_extent().transformed(
             self.fig.dpi_scale_trans.inverted()
         )
@@ -239,29 +388,245 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         self.ax.set_title(text, **style_kwargs)
 
     def close_fig(self) -> None:
-        """Closes the underlying matplotlib figure."""
+        """
+        Closes the underlying matplotlib figure, by removing everything from it.
+
+        Figures are not managed by pyplot, so they're released with the plot and closing them is optional. This is only useful for releasing the figure's memory while keeping a reference to the plot.
+        """
         if self.fig:
-            plt.close(self.fig)
+            self.fig.clear()
 
     @profile
-    def export(self, filename: str, padding: float = 0, **kwargs):
+    def export(
+        self,
+        filename: str,
+        padding: float = 0,
+        compress_level: int = None,
+        png_strategy: PngStrategy = None,
+        quality: int = None,
+        rasterize_threshold: int = None,
+        rasterize_dpi: int = 300,
+        **kwargs,
+    ):
         """Exports the plot to an image file.
 
+        Vector exports (SVG and PDF) contain an element for every star, polygon, etc, so exports of dense plots can get very big and slow to open. To keep them small, the markers and areas (e.g. stars, DSO outlines, and the Milky Way) of dense layers can be embedded as images, while labels and lines stay vector. Each plotting function (and single-object functions like `marker()` and `polygon()`) also accepts a keyword argument `rasterize` to always (True) or never (False) rasterize what it plots, regardless of `rasterize_threshold`. Gradient backgrounds are always rasterized.
+
         Args:
             filename: Filename of exported file (the format will be inferred from the extension)
             padding: Padding (in inches) around the image
+            compress_level: Compression level of PNG exports, from 0 (no compression, fastest) to 9 (smallest files, slowest). If `None`, then the default level (6) will be used.
+            png_strategy: [Compression strategy][starplot.plots.base.PngStrategy] of PNG exports. If `None`, then the default strategy will be used.
+            quality: Quality of JPEG and WebP exports, from 0 (worst) to 100 (best)
+            rasterize_threshold: Number of markers/areas that a layer must have more of to be rasterized in vector exports. If `None`, then only layers plotted with `rasterize=True` will be rasterized.
+            rasterize_dpi: Resolution (dots per inch) of rasterized layers and gradient backgrounds in vector exports
             **kwargs: Any keyword arguments to pass through to matplotlib's `savefig` method
 
         """
         self.logger.debug("Exporting...")
-        self.fig.savefig(
-            filename,
-            bbox_inches="tight",
-            pad_inches=padding * self.scale,
-            dpi=DPI,
-            **kwargs,
+        pil_kwargs = {
+            **(kwargs.pop("pil_kwargs", None) or {}),
+            **_pil_kwargs(compress_level, png_strategy, quality),
+        }
+
+        if pil_kwargs:
+            kwargs["pil_kwargs"] = pil_kwargs
+
+        file_format = _export_format(filename, kwargs.get("format"))
+        rasterized = []
+
+        if file_format in VECTOR_FORMATS:
+            rasterized = [
+                a
+                for layer in self._layers
+                for a in layer.rasterizable(rasterize_threshold)
+                if not a.get_rasterized()
+            ]
+            # in vector exports, the dpi is only the resolution of rasterized artists
+            kwargs.setdefault("dpi", rasterize_dpi)
+
+        kwargs.setdefault("dpi", DPI)
+
+        target = filename
+
+        if file_format == "svg" and StarplotSettings.svg_compact:
+            # SVGs are compacted after matplotlib writes them, so write to memory first
+            filename = BytesIO()
+            kwargs.setdefault("format", "svg")
+
+        bbox_inches = self._tight_bbox().padded(padding * self.scale)
+
+        with self._export_rc_context(file_format), self._rasterized(rasterized):
+            self._exporting = True
+            try:
+                self.fig.savefig(filename, bbox_inches=bbox_inches, **kwargs)
+            finally:
+                self._exporting = False
+
+        if filename is not target:
+            data = svg.compact(filename.getvalue())
+            if isinstance(target, (str, Path)):
+                Path(target).write_bytes(data)
+            else:
+                target.write(data)
+
+    def _tight_bbox(self) -> Bbox:
+        """
+        Returns the tight bounding box (in inches) of everything on the figure.
+
+        Exporting with matplotlib's `bbox_inches="tight"` does a full draw of the figure (without rendering) before
+        measuring it, which is almost as slow as rendering. The plot's layout is already set when the plot is created,
+        and artists that are clipped to the axes aren't measured, so the figure is measured directly instead. The
+        bounding box is cached until the figure changes.
+        """
+        if (
+            self._tight_bbox_cache is None
+            or self._tight_bbox_cache[1] != self._figure_changes
+        ):
+            bbox = self.fig.get_tightbbox(self.fig.canvas.get_renderer())
+            # measuring can mark artists as stale (e.g. by updating text layouts), so the count is taken afterwards
+            self._tight_bbox_cache = (bbox, self._figure_changes)
+
+        return self._tight_bbox_cache[0]
+
+    def export_bytes(self, format: str = "png", padding: float = 0, **kwargs) -> bytes:
+        """Exports the plot to an encoded image in memory (instead of a file).
+
+        Args:
+            format: Format of the image: `png`, `jpeg`, `webp`, `svg`, or `pdf`
+            padding: Padding (in inches) around the image
+            **kwargs: Any keyword arguments to pass through to [`export()`][starplot.plots.base.BasePlot.export] (e.g. `compress_level`)
+
+        Returns:
+            Encoded image
+        """
+        buffer = BytesIO()
+        self.export(buffer, padding=padding, format=format, **kwargs)
+        return buffer.getvalue()
+
+    def export_sizes(
+        self,
+        exports: dict[str, int],
+        padding: float = 0,
+        min_label_pixels: float = 9,
+        compress_level: int = None,
+        png_strategy: PngStrategy = None,
+        quality: int = None,
+    ) -> None:
+        """Exports the plot to multiple files at different sizes (e.g. for print, web, and thumbnails), from the same layout.
+
+        Raster images (PNG, JPEG, WebP) are rendered once at the plot's resolution, and images at that size are written from that render and smaller images are downsampled from it. If downsampling an image would make its smallest label shorter than `min_label_pixels`, then the plot is rendered again at the image's size instead, which keeps small text sharper. Either way, data isn't queried again and labels aren't placed again. Vector images (SVG, PDF) don't have a size, so they're exported as usual.
+
+        Example:
+
+        ```python
+        p.export_sizes({
+            "chart.png": None,  # full resolution
+            "chart-web.jpg": 1600,
+            "chart-thumbnail.webp": 300,
+            "chart.svg": None,
+        })
+        ```
+
+        Args:
+            exports: Dictionary of filenames to image widths in pixels. If a width is `None`, then the image will be exported at the plot's resolution. The format of each image will be inferred from its extension.
+            padding: Padding (in inches) around the images
+            min_label_pixels: Minimum height (in pixels) of the smallest label for downsampling an image
+            compress_level: Compression level of PNG exports (see [`export()`][starplot.plots.base.BasePlot.export])
+            png_strategy: Compression strategy of PNG exports
+            quality: Quality of JPEG and WebP exports
+        """
+        options = dict(
+            compress_level=compress_level, png_strategy=png_strategy, quality=quality
         )
+        raster = {}
 
+        for filename, width in exports.items():
+            if _export_format(filename) in VECTOR_FORMATS:
+                self.export(filename, padding=padding, **options)
+            else:
+                raster[filename] = width
+
+        if not raster:
+            return
+
+        bbox = self._tight_bbox().padded(padding * self.scale)
+        full_width = round(bbox.width * DPI)
+        label_pixels = min(
+            (label.get_fontsize() * DPI / 72 for label in self.labels),
+            default=float("inf"),
+        )
+        image = None
+
+        for filename, width in raster.items():
+            scale = width / full_width if width else 1
+
+            # enlarged images, and images that would have illegible labels when downsampled, are rendered at their size
+            if scale > 1 or label_pixels * scale < min_label_pixels:
+                self.export(filename, padding=padding, dpi=DPI * scale, **options)
+                continue
+
+            if image is None:
+                # the raw RGBA pixels of the render (which is the same size as Agg's canvas) aren't encoded
+                rendered = self.export_bytes("raw", padding=padding)
+                size = (int(bbox.width * DPI), int(bbox.height * DPI))
+                image = Image.frombuffer("RGBA", size, rendered, "raw", "RGBA", 0, 1)
+
+            resized = image
+            if scale < 1:
+                resized = image.resize(
+                    (round(image.width * scale), round(image.height * scale)),
+                    Image.Resampling.LANCZOS,
+                )
+
+            if _export_format(filename) in ("jpg", "jpeg"):
+                resized = resized.convert("RGB")
+
+            resized.save(
+                filename,
+                dpi=(DPI * scale, DPI * scale),
+                **_pil_kwargs(compress_level, png_strategy, quality),
+            )
+
+    def export_array(self) -> np.ndarray:
+        """Renders the plot and returns its pixels, as an array of RGBA values with shape (height, width, 4).
+
+        The array is a view of the figure's render buffer (not a copy), so it's only valid until the plot is rendered again. Unlike exported images, it's the full figure (i.e. it's not cropped to the plot and padding is not added).
+
+        Returns:
+            Array of RGBA values (uint8)
+        """
+        self.fig.canvas.draw()
+        return np.asarray(self.fig.canvas.buffer_rgba())
+
+    @contextmanager
+    def _export_rc_context(self, file_format: str = None):
+        """
+        Context for exporting with the plot's rcParams, which are only needed for SVG exports.
+
+        Since rcParams are global, they're changed while holding a lock, so concurrent exports
+        in threads don't change them for each other.
+        """
+        if file_format != "svg":
+            yield
+            return
+
+        with RC_LOCK, rc_context(self._svg_rc):
+            yield
+
+    @contextmanager
+    def _rasterized(self, artists: list):
+        """Context for rasterizing artists, which are restored to vectors afterwards"""
+        for artist in artists:
+            artist.set_rasterized(True)
+
+        try:
+            yield
+        finally:
+            for artist in artists:
+                artist.set_rasterized(False)
+
+    @object_layer
     @use_style(ObjectStyle)
     def marker(
         self,
@@ -284,6 +649,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             legend_label: How to label the marker in the legend. If `None`, then the marker will not be added to the legend
             skip_bounds_check: If True, then don't check the marker coordinates to ensure they're within the bounds of the plot. If you're plotting many markers, setting this to True can speed up plotting time.
             collision_handler: An instance of [CollisionHandler][starplot.CollisionHandler] that describes what to do on label collisions with other labels, markers, etc. If `None`, then the collision handler of the plot will be used.
+            rasterize: If True, then the marker is always rasterized in vector exports, and if False it's never rasterized. If `None`, then it's rasterized according to the `rasterize_threshold` of the [export][starplot.plots.base.BasePlot.export].
 
         """
 
@@ -304,19 +670,14 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         )
 
         # Add to spatial index
-        data_xy = self._proj.transform_point(x, y, self._crs)
-        display_x, display_y = self.ax.transData.transform(data_xy)
-        if display_x > 0 and display_y > 0:
-            radius = style_kwargs.get("s", 1) ** 0.5 / 5
-            bbox = np.array(
-                (
-                    display_x - radius,
-                    display_y - radius,
-                    display_x + radius,
-                    display_y + radius,
-                )
-            )
-            self._markers_rtree.insert(0, bbox, None)
+        radius = style_kwargs.get("s", 1) ** 0.5 / 5
+        self._index_marker(x, y, radius)
+
+        def move(x, y):
+            result.set_offsets(np.column_stack((x, y)))
+            self._index_marker(x[0], y[0], radius)
+
+        self._track(result, [ra], [dec], move)
 
         # Plot label
         if label:
@@ -343,6 +704,21 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         if legend_label is not None:
             self._legend_handles[legend_label] = result
 
+    def _index_marker(self, x: float, y: float, radius: float) -> None:
+        """Adds a marker to the spatial index that's used for label collisions"""
+        display_x, display_y = self._projector.point_to_display(x, y)
+        if display_x > 0 and display_y > 0:
+            bbox = np.array(
+                (
+                    display_x - radius,
+                    display_y - radius,
+                    display_x + radius,
+                    display_y + radius,
+                )
+            )
+            self._markers_rtree.insert(0, bbox, None)
+
+    @plot_layer(dynamic=True)
     @use_style(ObjectStyle, "planets")
     def planets(
         self,
@@ -363,16 +739,23 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             collision_handler: An instance of [CollisionHandler][starplot.CollisionHandler] that describes what to do on label collisions with other labels, markers, etc. If `None`, then the collision handler of the plot will be used.
         """
         labels = labels or {}
-        planets = models.Planet.all(self.observer, self.ephemeris_name)
+        planets = list(models.Planet.all(self.observer, self.ephemeris_name))
 
         legend_label = translate(legend_label, self.language)
         handler = collision_handler or self.point_label_handler
 
-        for p in planets:
+        planets_in_bounds = self.in_bounds_many(
+            [p.ra for p in planets], [p.dec for p in planets]
+        )
+
+        for p, in_bounds in zip(planets, planets_in_bounds):
             label = labels.get(p.name)
             label = translate(label, self.language)
 
-            if self.in_bounds(p.ra, p.dec):
+            if label and not self._labeled.register(("planet", p.name)):
+                label = None
+
+            if in_bounds:
                 self._objects.planets.append(p)
 
             if true_size:
@@ -407,6 +790,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
                     gid_label="planet-label",
                 )
 
+    @plot_layer(dynamic=True)
     @use_style(ObjectStyle, "sun")
     def sun(
         self,
@@ -493,6 +877,48 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         """
         raise NotImplementedError
 
+    def in_bounds_many(self, ra, dec) -> np.ndarray:
+        """Determine which coordinates are within the bounds of the plot.
+
+        Args:
+            ra: Array of right ascensions, in degrees (0...360)
+            dec: Array of declinations, in degrees (-90...90)
+
+        Returns:
+            Boolean array, which is True for each coordinate that's in bounds
+        """
+        ra = np.atleast_1d(np.asarray(ra, dtype=float))
+        dec = np.atleast_1d(np.asarray(dec, dtype=float))
+
+        if ra.size == 0:
+            return np.zeros(0, dtype=bool)
+
+        return self._in_bounds_xy_many(*self._prepare_coords_array(ra, dec))
+
+    def _in_bounds_xy_many(self, x, y) -> np.ndarray:
+        """Vectorized version of `_in_bounds_xy`, which returns a boolean array"""
+        return np.array(
+            [self._in_bounds_xy(x0, y0) for x0, y0 in zip(x, y)], dtype=bool
+        )
+
+    def _visible_mask(self, ra, dec, radius=0) -> np.ndarray:
+        """
+        Returns a boolean array of which RA/DEC coordinates could be visible on the plot.
+
+        This is a cheap pre-filter (applied before astrometry and projection), so it should never exclude a visible object.
+
+        Args:
+            ra: Array of right ascensions, in degrees (0...360)
+            dec: Array of declinations, in degrees (-90...90)
+            radius: Radius (in degrees) of each object, as a number or array
+        """
+        return np.ones(len(ra), dtype=bool)
+
+    def _in_axes_many(self, x, y) -> np.ndarray:
+        """Returns a boolean array of which data / projected coordinates are inside the axes"""
+        axes_xy = self._projector.to_axes(x, y)
+        return ((axes_xy >= 0) & (axes_xy <= 1)).all(axis=1)
+
     @abstractmethod
     def _in_bounds_xy(self, x: float, y: float) -> bool:
         """
@@ -511,6 +937,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
 
     def _polygon(self, points: list, style: PolygonStyle, **kwargs):
         # points = [self._prepare_coords(*p) for p in points]
+        ra, dec = np.array(points, dtype=float).reshape(-1, 2).T
         points = self._prepare_coords_many(points)
         patch = patches.Polygon(
             points,
@@ -525,6 +952,9 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
         patch.set_clip_on(True)
         patch.set_clip_path(self._background_clip_path)
 
+        self._track(patch, ra, dec, lambda x, y: patch.set_xy(np.column_stack((x, y))))
+
+    @object_layer
     @use_style(PolygonStyle)
     def polygon(
         self,
@@ -544,6 +974,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             points: List of polygon points `[(ra, dec), ...]` - **must be in counterclockwise order**
             geometry: A shapely Polygon. If this value is passed, then the `points` kwarg will be ignored.
             legend_label: Label for this object in the legend
+            rasterize: If True, then the polygon is always rasterized in vector exports, and if False it's never rasterized. If `None`, then it's rasterized according to the `rasterize_threshold` of the [export][starplot.plots.base.BasePlot.export].
 
         """
         if points is None and geometry is None:
@@ -560,6 +991,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
                 style=style.to_marker_style(symbol=MarkerSymbolEnum.SQUARE),
             )
 
+    @object_layer
     @use_style(PolygonStyle)
     def rectangle(
         self,
@@ -580,6 +1012,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             style: Style of rectangle
             angle: Angle of rotation clockwise (degrees)
             legend_label: Label for this object in the legend
+            rasterize: If True, then the rectangle is always rasterized in vector exports, and if False it's never rasterized. If `None`, then it's rasterized according to the `rasterize_threshold` of the [export][starplot.plots.base.BasePlot.export].
         """
         polygon = _geometry.rectangle(
             center,
@@ -596,6 +1029,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
                 style=style.to_marker_style(symbol=MarkerSymbolEnum.SQUARE),
             )
 
+    @object_layer
     @use_style(PolygonStyle)
     def ellipse(
         self,
@@ -622,6 +1056,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             start_angle: Angle to start at
             end_angle: Angle to end at
             legend_label: Label for this object in the legend
+            rasterize: If True, then the ellipse is always rasterized in vector exports, and if False it's never rasterized. If `None`, then it's rasterized according to the `rasterize_threshold` of the [export][starplot.plots.base.BasePlot.export].
         """
 
         polygon = _geometry.ellipse(
@@ -642,6 +1077,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
                 style=style.to_marker_style(symbol=MarkerSymbolEnum.ELLIPSE),
             )
 
+    @object_layer
     @use_style(PolygonStyle)
     def circle(
         self,
@@ -660,6 +1096,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             style: Style of circle
             num_pts: Number of points to calculate for the circle polygon
             legend_label: Label for this object in the legend
+            rasterize: If True, then the circle is always rasterized in vector exports, and if False it's never rasterized. If `None`, then it's rasterized according to the `rasterize_threshold` of the [export][starplot.plots.base.BasePlot.export].
         """
         self.ellipse(
             center,
@@ -677,6 +1114,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
                 style=style.to_marker_style(symbol=MarkerSymbolEnum.CIRCLE),
             )
 
+    @plot_layer(dynamic=True)
     @use_style(ObjectStyle, "moon")
     def moon(
         self,
@@ -899,19 +1337,7 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             num_labels: Max number of labels to plot along the line
             collision_handler: An instance of [CollisionHandler][starplot.CollisionHandler] that describes what to do on label collisions with other labels, markers, etc. If `None`, then the plot's `path_label_handler` will be used.
         """
-        x = []
-        y = []
-        inbounds = []
-
         label = translate(label, self.language)
-
-        for ra, dec in ecliptic.RA_DECS:
-            x0, y0 = self._prepare_coords(ra * 15, dec)
-            x.append(x0)
-            y.append(y0)
-            if self.in_bounds(ra * 15, dec):
-                inbounds.append((ra * 15, dec))
-
         coords = [(ra * 15, dec) for ra, dec in ecliptic.RA_DECS]
 
         self.line(
@@ -979,12 +1405,13 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             raise ValueError("Must pass coordinates or geometry when plotting lines.")
 
         coords = geometry.coords if geometry is not None else coordinates
-        prepared_coords = [self._prepare_coords(*p) for p in coords]
-        x, y = zip(*prepared_coords)
+        coords = np.array(coords, dtype=float).reshape(-1, 2)
+        ra, dec = coords[:, 0], coords[:, 1]
+        x, y = self._prepare_coords_array(ra, dec)
 
         gid = kwargs.get("gid") or "line"
 
-        self.ax.plot(
+        (line,) = self.ax.plot(
             x,
             y,
             clip_on=True,
@@ -994,20 +1421,41 @@ class BasePlot(DebugPlotterMixin, TextPlotterMixin, ABC):
             **style.line.matplot_kwargs(self.scale),
             **self._plot_kwargs(),
         )
+        self._track(line, ra, dec, line.set_data)
 
         if not label:
             return
 
-        prepared_coords = [
-            (x, y) for x, y in prepared_coords if self._in_bounds_xy(x, y)
-        ]
+        request = partial(
+            self._line_label,
+            ra,
+            dec,
+            label,
+            style,
+            num_labels,
+            collision_handler or self.path_label_handler,
+            gid,
+        )
+        self._record_label(request)
+        request()
 
-        if not prepared_coords:
-            return
+    def _line_label(
+        self,
+        ra,
+        dec,
+        label: str,
+        style: PathStyle,
+        num_labels: int,
+        collision_handler: CollisionHandler,
+        gid: str,
+    ):
+        x, y = self._prepare_coords_array(ra, dec)
+        in_bounds = self._in_bounds_xy_many(x, y)
 
-        x, y = zip(*prepared_coords)
+        if not in_bounds.any():
+            return
 
-        collision_handler = collision_handler or self.path_label_handler
+        x, y = x[in_bounds], y[in_bounds]
 
         self._text_line(
             x,
@@ -1,18 +1,13 @@
-from functools import cache
 from typing import Callable
 
-import pandas as pd
 import numpy as np
-import astropy.units as u
-from astropy.coordinates import SkyCoord
 from cartopy import crs as ccrs
-from matplotlib import pyplot as plt, patches
+from matplotlib import patches
 from matplotlib.ticker import FixedLocator, FuncFormatter
-from skyfield.api import Star as SkyfieldStar
-from skyfield.framelib import galactic_frame
 
-from starplot.coordinates import CoordinateSystem
-from starplot.plots.base import BasePlot, DPI
+from starplot.cache import memoize
+from starplot.coordinates import AstrometryMode, CoordinateSystem
+from starplot.plots.base import BasePlot
 from starplot.mixins import ExtentMaskMixin
 from starplot.models.observer import Observer
 from starplot.plotters import (
@@ -24,7 +19,9 @@ from starplot.plotters import (
     LegendPlotterMixin,
     ArrowPlotterMixin,
 )
-from starplot.plotters.text import CollisionHandler
+from starplot.textpath import TextPathCacheArtist
+from starplot.transforms import galactic_to_radec, radec_to_galactic
+from starplot.plotters.text import CollisionHandler, LabelBudget
 from starplot.styles import (
     PlotStyle,
     extensions,
@@ -57,6 +54,8 @@ class GalaxyPlot(
         point_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for point labels.
         area_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for area labels.
         path_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for path labels.
+        label_budget: Optional [LabelBudget][starplot.LabelBudget] that limits the total number of labels and the time spent placing them. If `None`, then labeling is unlimited.
+        astrometry: [Method][starplot.AstrometryMode] for calculating star positions. If `None`, then the default for the plot type will be used (`apparent` for horizon/optic plots, `proper_motion` for all others).
         scale: Scaling factor that will be applied to all relevant sizes in styles (e.g. font size, marker size, line widths, etc). For example, if you want to make everything 2x bigger, then set scale to 2.
         autoscale: If True, then the scale will be automatically set based on resolution
         suppress_warnings: If True (the default), then all warnings will be suppressed
@@ -79,6 +78,8 @@ class GalaxyPlot(
         point_label_handler: CollisionHandler = None,
         area_label_handler: CollisionHandler = None,
         path_label_handler: CollisionHandler = None,
+        label_budget: LabelBudget = None,
+        astrometry: AstrometryMode = None,
         scale: float = 1.0,
         autoscale: bool = False,
         suppress_warnings: bool = True,
@@ -96,6 +97,8 @@ class GalaxyPlot(
             point_label_handler=point_label_handler,
             area_label_handler=area_label_handler,
             path_label_handler=path_label_handler,
+            label_budget=label_budget,
+            astrometry=astrometry,
             scale=scale,
             autoscale=autoscale,
             suppress_warnings=suppress_warnings,
@@ -122,40 +125,53 @@ class GalaxyPlot(
 
     def _prepare_coords(self, ra, dec) -> (float, float):
         """Converts RA/DEC to galactic coordinates (degrees)"""
-        if ra > 360:
-            ra -= 360
-        if ra < 0:
-            ra += 360
-        point = SkyfieldStar(ra_hours=ra / 15, dec_degrees=dec)
-        lat, lon, _ = self.observe(point).frame_latlon(galactic_frame)
-
-        return lon.degrees, lat.degrees
+        lon, lat = radec_to_galactic(ra, dec)
+        return float(lon[0]), float(lat[0])
 
     def _prepare_coords_many(
         self, coordinates: list, epoch_year: float = 2000
     ) -> (float, float):
-        """Converts RA/DEC to AZ/ALT"""
-        df = pd.DataFrame(coordinates, columns=["ra", "dec"])
-        df["ra_hours"], df["dec_degrees"] = (df.ra / 15, df.dec)
-        df["epoch_year"] = epoch_year
+        """Converts RA/DEC to galactic coordinates (degrees)"""
+        if not coordinates:
+            return []
 
-        sf_star = SkyfieldStar.from_dataframe(df)
-        position = self.observe(sf_star)
-        lat, lon, _ = position.frame_latlon(galactic_frame)
-        df["x"], df["y"] = (lon.degrees, lat.degrees)
+        ra, dec = np.array(coordinates, dtype=float).T
+        lon, lat = radec_to_galactic(ra, dec)
+        return list(zip(lon.tolist(), lat.tolist()))
 
-        return list(zip(df["x"], df["y"]))
+    def _prepare_coords_array(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        return radec_to_galactic(ra, dec)
 
     def _prepare_star_coords(self, df, limit_by_altaz=True):
-        stars_position = self.observe(SkyfieldStar.from_dataframe(df))
-        lat, lon, _ = stars_position.frame_latlon(galactic_frame)
-        df["x"], df["y"] = (lon.degrees, lat.degrees)
+        # RA/DEC are already adjusted for the plot's astrometry mode
+        lon, lat = radec_to_galactic(df["ra"].to_numpy(), df["dec"].to_numpy())
+        in_extent = self._in_extent_lonlat(lon, lat)
+
+        if not in_extent.all():
+            df = df[in_extent].copy()
+            lon, lat = lon[in_extent], lat[in_extent]
+
+        df["x"], df["y"] = lon, lat
         return df
 
+    def _in_extent_lonlat(self, lon, lat) -> np.ndarray:
+        """
+        Returns a boolean array of which galactic coordinates are within the extent of the plot.
+
+        This is a fast pre-filter (no projection), so it's applied before the exact bounds checks.
+        """
+        lon = (np.asarray(lon, dtype=float) + 180) % 360 - 180
+        lat = np.asarray(lat, dtype=float)
+        return (
+            (lon >= self.lon_min)
+            & (lon <= self.lon_max)
+            & (lat >= self.lat_min)
+            & (lat <= self.lat_max)
+        )
+
     def _plot_kwargs(self) -> dict:
         return dict(transform=self._crs)
 
-    @cache
     def in_bounds(self, ra, dec) -> bool:
         """Determine if a coordinate is within the bounds of the plot.
 
@@ -179,14 +195,22 @@ class GalaxyPlot(
         Returns:
             True if the coordinate is in bounds, otherwise False
         """
-        x, y = self._proj.transform_point(lon, lat, self._crs)
-        data_to_axes = self.ax.transData + self.ax.transAxes.inverted()
-        x_axes, y_axes = data_to_axes.transform((x, y))
+        x_axes, y_axes = self._projector.point_to_axes(lon, lat)
         return 0 <= x_axes <= 1 and 0 <= y_axes <= 1
 
     def _in_bounds_xy(self, x: float, y: float) -> bool:
         return self.in_bounds_lonlat(x, y)
 
+    def _in_bounds_xy_many(self, x, y) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        in_bounds = self._in_extent_lonlat(x, y)
+
+        if in_bounds.any():
+            in_bounds[in_bounds] = self._in_axes_many(x[in_bounds], y[in_bounds])
+
+        return in_bounds
+
     def _polygon(self, points, style, **kwargs):
         super()._polygon(points, style, transform=self._crs, **kwargs)
 
@@ -199,6 +223,10 @@ class GalaxyPlot(
         self.dec_min = -90
         self.dec_max = 90
 
+        # galactic extent (longitude is -180...180)
+        self.lon_min, self.lon_max = -180, 180
+        self.lat_min, self.lat_max = -90, 90
+
         self.logger.debug(
             f"Extent = RA ({self.ra_min:.2f}, {self.ra_max:.2f}) DEC ({self.dec_min:.2f}, {self.dec_max:.2f})"
         )
@@ -221,15 +249,10 @@ class GalaxyPlot(
             num_labels: Max number of labels to plot along the line
             collision_handler: An instance of [CollisionHandler][starplot.CollisionHandler] that describes what to do on label collisions with other labels, markers, etc. If `None`, then the plot's `path_label_handler` will be used.
         """
-        lons = np.array([ra for ra in range(0, 361)])  # galactic longitudes
-        lats = np.array([0] * 361)  # galactic latitudes
-
-        coords = SkyCoord(l=lons * u.deg, b=lats * u.deg, frame="galactic")
-        coords_eq = coords.icrs
-
-        ra_values = coords_eq.ra.degree
-        dec_values = coords_eq.dec.degree
+        lons = np.arange(0, 361)  # galactic longitudes
+        lats = np.zeros(361)  # galactic latitudes
 
+        ra_values, dec_values = galactic_to_radec(lons, lats)
         radec = list(zip(ra_values, dec_values))
 
         self.line(
@@ -314,19 +337,14 @@ class GalaxyPlot(
         )
         gridlines.set_zorder(style.line.zorder)
 
-    @cache
+    @memoize()
     def _to_ax(self, az: float, alt: float) -> tuple[float, float]:
         """Converts az/alt to axes coordinates"""
-        x, y = self._proj.transform_point(az, alt, self._crs)
-        data_to_axes = self.ax.transData + self.ax.transAxes.inverted()
-        x_axes, y_axes = data_to_axes.transform((x, y))
-        return x_axes, y_axes
+        return self._projector.point_to_axes(az, alt)
 
-    @cache
+    @memoize()
     def _ax_to_azalt(self, x: float, y: float) -> tuple[float, float]:
-        trans = self.ax.transAxes + self.ax.transData.inverted()
-        x_projected, y_projected = trans.transform((x, y))  # axes to data
-        az, alt = self._crs.transform_point(x_projected, y_projected, self._proj)
+        az, alt = self._projector.point_from_axes(x, y)
         return float(az), float(alt)
 
     def _plot_background_clip_path(self):
@@ -354,11 +372,8 @@ class GalaxyPlot(
     def _init_plot(self):
         self._proj = ccrs.Mollweide(central_longitude=self.center_lon)
         self._proj.threshold = 100
-        self.fig = plt.figure(
-            figsize=(self.figure_size, self.figure_size),
-            facecolor=self.style.figure_background_color.as_hex(),
-            dpi=DPI,
-        )
+        self.fig = self._create_figure()
+        self.fig.add_artist(TextPathCacheArtist())
         self.ax = self.fig.add_subplot(1, 1, 1, projection=self._proj)
         self.fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
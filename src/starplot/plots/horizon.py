@@ -1,18 +1,17 @@
 import math
 
-from functools import cache
+from functools import cached_property
 from typing import Callable
 
-import pandas as pd
+import numpy as np
 
 from cartopy import crs as ccrs
-from matplotlib import pyplot as plt, patches
+from matplotlib import patches
 from matplotlib.ticker import FixedLocator, FuncFormatter
-from skyfield.api import Star as SkyfieldStar
 from shapely import Polygon, MultiPolygon
-from starplot.coordinates import CoordinateSystem
-from starplot.plots.base import BasePlot, DPI
-from starplot.mixins import ExtentMaskMixin
+from starplot.coordinates import AstrometryMode, CoordinateSystem
+from starplot.plots.base import BasePlot
+from starplot.mixins import ExtentMaskMixin, TimeUpdateMixin
 from starplot.models.observer import Observer
 from starplot.plotters import (
     ConstellationPlotterMixin,
@@ -23,7 +22,10 @@ from starplot.plotters import (
     LegendPlotterMixin,
     ArrowPlotterMixin,
 )
-from starplot.plotters.text import CollisionHandler
+from starplot.textpath import TextPathCacheArtist
+from starplot.cache import memoize
+from starplot.transforms import altaz_transform
+from starplot.plotters.text import CollisionHandler, LabelBudget
 from starplot.styles import (
     PlotStyle,
     extensions,
@@ -55,6 +57,7 @@ class HorizonPlot(
     GradientBackgroundMixin,
     LegendPlotterMixin,
     ArrowPlotterMixin,
+    TimeUpdateMixin,
 ):
     """Creates a new horizon plot.
 
@@ -68,6 +71,8 @@ class HorizonPlot(
         point_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for point labels.
         area_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for area labels.
         path_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for path labels.
+        label_budget: Optional [LabelBudget][starplot.LabelBudget] that limits the total number of labels and the time spent placing them. If `None`, then labeling is unlimited.
+        astrometry: [Method][starplot.AstrometryMode] for calculating star positions. If `None`, then the default for the plot type will be used (`apparent` for horizon/optic plots, `proper_motion` for all others).
         scale: Scaling factor that will be applied to all relevant sizes in styles (e.g. font size, marker size, line widths, etc). For example, if you want to make everything 2x bigger, then set scale to 2.
         autoscale: If True, then the scale will be automatically set based on resolution
         suppress_warnings: If True (the default), then all warnings will be suppressed
@@ -78,6 +83,7 @@ class HorizonPlot(
     """
 
     _coordinate_system = CoordinateSystem.AZ_ALT
+    _astrometry = AstrometryMode.APPARENT
     _gradient_direction = GradientDirection.LINEAR
 
     FIELD_OF_VIEW_MAX = 9.0
@@ -93,6 +99,8 @@ class HorizonPlot(
         point_label_handler: CollisionHandler = None,
         area_label_handler: CollisionHandler = None,
         path_label_handler: CollisionHandler = None,
+        label_budget: LabelBudget = None,
+        astrometry: AstrometryMode = None,
         scale: float = 1.0,
         autoscale: bool = False,
         suppress_warnings: bool = True,
@@ -110,6 +118,8 @@ class HorizonPlot(
             point_label_handler=point_label_handler,
             area_label_handler=area_label_handler,
             path_label_handler=path_label_handler,
+            label_budget=label_budget,
+            astrometry=astrometry,
             scale=scale,
             autoscale=autoscale,
             suppress_warnings=suppress_warnings,
@@ -152,7 +162,18 @@ class HorizonPlot(
 
         self._calc_position()
 
-    @cache
+    @cached_property
+    def _altaz(self):
+        """Transform of RA/DEC to AZ/ALT for the plot's observer"""
+        return altaz_transform(self.observer, self.ephemeris_name)
+
+    def _set_observer(self, observer: Observer) -> None:
+        super()._set_observer(observer)
+        self.__dict__.pop("_altaz", None)
+        self._prepare_coords.cache_clear(self)
+        self._calc_position()
+
+    @memoize(maxsize=4096)
     def _prepare_coords(self, ra, dec) -> (float, float):
         """Converts RA/DEC to AZ/ALT"""
         if ra > 360:
@@ -160,32 +181,24 @@ class HorizonPlot(
         if ra < 0:
             ra += 360
 
-        return self.observer._apparent(
-            obj=SkyfieldStar(ra_hours=ra / 15, dec_degrees=dec),
-            ephemeris=self.ephemeris_name,
-        )
+        az, alt = self._altaz.transform(ra, dec)
+        return float(az[0]), float(alt[0])
 
     def _prepare_coords_many(
         self, coordinates: list, epoch_year: float = 2000
     ) -> (float, float):
         """Converts RA/DEC to AZ/ALT"""
-        df = pd.DataFrame(coordinates, columns=["ra", "dec"])
-        df["ra_hours"], df["dec_degrees"] = (df.ra / 15, df.dec)
-        df["epoch_year"] = epoch_year
-
-        sf_star = SkyfieldStar.from_dataframe(df)
+        if not coordinates:
+            return []
 
-        df["x"], df["y"] = self.observer._apparent(
-            obj=sf_star,
-            ephemeris=self.ephemeris_name,
-        )
-
-        return list(zip(df["x"], df["y"]))
+        ra, dec = np.array(coordinates, dtype=float).T
+        az, alt = self._altaz.transform(ra, dec)
+        return list(zip(az.tolist(), alt.tolist()))
 
     def _prepare_star_coords(self, df, limit_by_altaz=True):
-        df["x"], df["y"] = self.observer._apparent(
-            obj=SkyfieldStar.from_dataframe(df),
-            ephemeris=self.ephemeris_name,
+        # RA/DEC are already adjusted for the plot's astrometry mode
+        df["x"], df["y"] = self._altaz.transform(
+            df["ra"].to_numpy(), df["dec"].to_numpy()
         )
 
         # if limit_by_altaz:
@@ -210,7 +223,6 @@ class HorizonPlot(
     def _plot_kwargs(self) -> dict:
         return dict(transform=self._crs)
 
-    @cache
     def in_bounds(self, ra, dec) -> bool:
         """Determine if a coordinate is within the bounds of the plot.
 
@@ -221,8 +233,8 @@ class HorizonPlot(
         Returns:
             True if the coordinate is in bounds, otherwise False
         """
-        az, alt = self._prepare_coords(ra, dec)
-        return self.in_bounds_altaz(alt, az)
+        az, alt = self._altaz.transform(ra, dec)
+        return self.in_bounds_altaz(float(alt[0]), float(az[0]))
 
     def in_bounds_altaz(self, alt, az, scale: float = 1) -> bool:
         """Determine if a coordinate is within the bounds of the plot.
@@ -235,16 +247,22 @@ class HorizonPlot(
             True if the coordinate is in bounds, otherwise False
         """
         # return self.altaz_mask.contains(Point(az, alt))
-        x, y = self._to_ax(az, alt)
+        x, y = self._projector.point_to_axes(az, alt)
         return 0 <= x <= 1 and 0 <= y <= 1
 
     def _in_bounds_xy(self, x: float, y: float) -> bool:
         return self.in_bounds_altaz(y, x)  # alt = y, az = x
 
+    def _in_bounds_xy_many(self, x, y) -> np.ndarray:
+        return self._in_axes_many(x, y)
+
+    def _prepare_coords_array(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        return self._altaz.transform(ra, dec)
+
     def _polygon(self, points, style, **kwargs):
         super()._polygon(points, style, transform=self._crs, **kwargs)
 
-    @cache
+    @memoize(maxsize=1)
     def _extent_mask_altaz(self):
         """
         Returns shapely geometry objects of the alt/az extent
@@ -475,19 +493,14 @@ class HorizonPlot(
                     **style.label.matplot_kwargs(self.scale / 2),
                 )
 
-    @cache
+    @memoize()
     def _to_ax(self, az: float, alt: float) -> tuple[float, float]:
         """Converts az/alt to axes coordinates"""
-        x, y = self._proj.transform_point(az, alt, self._crs)
-        data_to_axes = self.ax.transData + self.ax.transAxes.inverted()
-        x_axes, y_axes = data_to_axes.transform((x, y))
-        return x_axes, y_axes
+        return self._projector.point_to_axes(az, alt)
 
-    @cache
+    @memoize()
     def _ax_to_azalt(self, x: float, y: float) -> tuple[float, float]:
-        trans = self.ax.transAxes + self.ax.transData.inverted()
-        x_projected, y_projected = trans.transform((x, y))  # axes to data
-        az, alt = self._crs.transform_point(x_projected, y_projected, self._proj)
+        az, alt = self._projector.point_from_axes(x, y)
         return float(az), float(alt)
 
     def _plot_background_clip_path(self):
@@ -518,12 +531,8 @@ class HorizonPlot(
             central_latitude=0,
         )
         self._proj.threshold = 100
-        self.fig = plt.figure(
-            figsize=(self.figure_size, self.figure_size),
-            facecolor=self.style.figure_background_color.as_hex(),
-            # layout="constrained",
-            dpi=DPI,
-        )
+        self.fig = self._create_figure()
+        self.fig.add_artist(TextPathCacheArtist())
         self.ax = self.fig.add_subplot(1, 1, 1, projection=self._proj)
         self.fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
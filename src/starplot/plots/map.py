@@ -1,18 +1,16 @@
 import math
 from typing import Callable
-from functools import cache
 
 from cartopy import crs as ccrs
-from matplotlib import pyplot as plt
 from matplotlib import patches, ticker
 from matplotlib.ticker import FuncFormatter, FixedLocator
 from shapely import Polygon
 from skyfield.api import wgs84
 import numpy as np
 
-from starplot.coordinates import CoordinateSystem
+from starplot.coordinates import AstrometryMode, CoordinateSystem
 from starplot import geometry
-from starplot.plots.base import BasePlot, DPI
+from starplot.plots.base import BasePlot
 from starplot.mixins import ExtentMaskMixin
 from starplot.models.observer import Observer
 from starplot.plotters import (
@@ -24,7 +22,8 @@ from starplot.plotters import (
     GradientBackgroundMixin,
     ArrowPlotterMixin,
 )
-from starplot.plotters.text import CollisionHandler
+from starplot.textpath import TextPathCacheArtist
+from starplot.plotters.text import CollisionHandler, LabelBudget
 from starplot.projections import StereoNorth, StereoSouth, ProjectionBase
 from starplot.styles import (
     ObjectStyle,
@@ -63,6 +62,8 @@ class MapPlot(
         point_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for point labels.
         area_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for area labels.
         path_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for path labels.
+        label_budget: Optional [LabelBudget][starplot.LabelBudget] that limits the total number of labels and the time spent placing them. If `None`, then labeling is unlimited.
+        astrometry: [Method][starplot.AstrometryMode] for calculating star positions. If `None`, then the default for the plot type will be used (`apparent` for horizon/optic plots, `proper_motion` for all others).
         clip_path: An optional Shapely Polygon that specifies the clip path of the plot -- only objects inside the polygon will be plotted. If `None` (the default), then the clip path will be the extent of the map you specified with the RA/DEC parameters.
         scale: Scaling factor that will be applied to all sizes in styles (e.g. font size, marker size, line widths, etc). For example, if you want to make everything 2x bigger, then set the scale to 2. At `scale=1` and `resolution=4096` (the default), all sizes are optimized visually for a map that covers 1-3 constellations. So, if you're creating a plot of a _larger_ extent, then it'd probably be good to decrease the scale (i.e. make everything smaller) -- and _increase_ the scale if you're plotting a very small area.
         autoscale: If True, then the scale will be set automatically based on resolution.
@@ -90,6 +91,8 @@ class MapPlot(
         point_label_handler: CollisionHandler = None,
         area_label_handler: CollisionHandler = None,
         path_label_handler: CollisionHandler = None,
+        label_budget: LabelBudget = None,
+        astrometry: AstrometryMode = None,
         clip_path: Polygon = None,
         scale: float = 1.0,
         autoscale: bool = False,
@@ -108,6 +111,8 @@ class MapPlot(
             point_label_handler=point_label_handler,
             area_label_handler=area_label_handler,
             path_label_handler=path_label_handler,
+            label_budget=label_budget,
+            astrometry=astrometry,
             scale=scale,
             autoscale=autoscale,
             suppress_warnings=suppress_warnings,
@@ -146,7 +151,6 @@ class MapPlot(
     def _plot_kwargs(self) -> dict:
         return dict(transform=self._crs)
 
-    @cache
     def in_bounds(self, ra: float, dec: float) -> bool:
         """Determine if a coordinate is within the bounds of the plot.
 
@@ -157,14 +161,17 @@ class MapPlot(
         Returns:
             True if the coordinate is in bounds, otherwise False
         """
-        # TODO : try using pyproj transformer directly
-        x, y = self._proj.transform_point(ra, dec, self._crs)
-        data_to_axes = self.ax.transData + self.ax.transAxes.inverted()
-        x_axes, y_axes = data_to_axes.transform((x, y))
-        return 0 <= x_axes <= 1 and 0 <= y_axes <= 1
+        return self._in_bounds_xy(*self._prepare_coords(ra, dec))
 
     def _in_bounds_xy(self, x: float, y: float) -> bool:
-        return self.in_bounds(x, y)
+        x_axes, y_axes = self._projector.point_to_axes(x, y)
+        return 0 <= x_axes <= 1 and 0 <= y_axes <= 1
+
+    def _in_bounds_xy_many(self, x, y) -> np.ndarray:
+        return self._in_axes_many(x, y)
+
+    def _prepare_coords_array(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        return np.asarray(ra, dtype=float), np.asarray(dec, dtype=float)
 
     def _polygon(self, points, style, **kwargs):
         super()._polygon(points, style, transform=self._crs, **kwargs)
@@ -445,12 +452,8 @@ class MapPlot(
             self.ax.set_extent(bounds, crs=self._plate_carree)
 
     def _init_plot(self):
-        self.fig = plt.figure(
-            figsize=(self.figure_size, self.figure_size),
-            facecolor=self.style.figure_background_color.as_hex(),
-            # layout="constrained",
-            dpi=DPI,
-        )
+        self.fig = self._create_figure()
+        self.fig.add_artist(TextPathCacheArtist())
 
         self._proj = self.projection.crs
         self.ax = self.fig.add_subplot(1, 1, 1, projection=self._proj)
@@ -465,9 +468,7 @@ class MapPlot(
         self._plot_background_clip_path()
 
     def _ax_to_radec(self, x, y):
-        trans = self.ax.transAxes + self.ax.transData.inverted()
-        x_projected, y_projected = trans.transform((x, y))  # axes to data
-        x_ra, y_ra = self._crs.transform_point(x_projected, y_projected, self._proj)
+        x_ra, y_ra = self._projector.point_from_axes(x, y)
         return (x_ra + 360), y_ra
 
     def _plot_background_clip_path(self):
@@ -478,14 +479,8 @@ class MapPlot(
             background_color = self.style.background_color.as_hex()
 
         def to_axes(points):
-            ax_points = []
-
-            for ra, dec in points:
-                x, y = self._proj.transform_point(ra, dec, self._crs)
-                data_to_axes = self.ax.transData + self.ax.transAxes.inverted()
-                x_axes, y_axes = data_to_axes.transform((x, y))
-                ax_points.append([x_axes, y_axes])
-            return ax_points
+            ra, dec = np.array(points, dtype=float).T
+            return self._projector.to_axes(ra, dec).tolist()
 
         if self.clip_path is not None:
             points = list(zip(*self.clip_path.exterior.coords.xy))
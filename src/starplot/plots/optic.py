@@ -1,15 +1,15 @@
+from functools import cached_property
 from typing import Callable
 
 
-import pandas as pd
+import numpy as np
 from cartopy import crs as ccrs
-from matplotlib import pyplot as plt, patches, path
-from skyfield.api import Star as SkyfieldStar
+from matplotlib import patches, path
 
 
 from starplot import callables, geometry
-from starplot.coordinates import CoordinateSystem
-from starplot.plots.base import BasePlot, DPI
+from starplot.coordinates import AstrometryMode, CoordinateSystem
+from starplot.plots.base import BasePlot
 from starplot.data.catalogs import Catalog, BIG_SKY_MAG11
 from starplot.mixins import ExtentMaskMixin
 from starplot.models import Star, Optic, Camera
@@ -30,7 +30,9 @@ from starplot.styles import (
     GradientDirection,
 )
 from starplot.utils import azimuth_to_string
-from starplot.plotters.text import CollisionHandler
+from starplot.textpath import TextPathCacheArtist
+from starplot.transforms import altaz_transform
+from starplot.plotters.text import CollisionHandler, LabelBudget
 
 
 class OpticPlot(
@@ -54,6 +56,8 @@ class OpticPlot(
         point_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for point labels.
         area_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for area labels.
         path_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for path labels.
+        label_budget: Optional [LabelBudget][starplot.LabelBudget] that limits the total number of labels and the time spent placing them. If `None`, then labeling is unlimited.
+        astrometry: [Method][starplot.AstrometryMode] for calculating star positions. If `None`, then the default for the plot type will be used (`apparent` for horizon/optic plots, `proper_motion` for all others).
         raise_on_below_horizon: If True, then a ValueError will be raised if the target is below the horizon at the observing time/location
         scale: Scaling factor that will be applied to all sizes in styles (e.g. font size, marker size, line widths, etc). For example, if you want to make everything 2x bigger, then set the scale to 2. At `scale=1` and `resolution=4096` (the default), all sizes are optimized visually for a map that covers 1-3 constellations. So, if you're creating a plot of a _larger_ extent, then it'd probably be good to decrease the scale (i.e. make everything smaller) -- and _increase_ the scale if you're plotting a very small area.
         autoscale: If True, then the scale will be set automatically based on resolution.
@@ -65,6 +69,7 @@ class OpticPlot(
     """
 
     _coordinate_system = CoordinateSystem.AZ_ALT
+    _astrometry = AstrometryMode.APPARENT
     _gradient_direction = GradientDirection.RADIAL
 
     FIELD_OF_VIEW_MAX = 20
@@ -81,6 +86,8 @@ class OpticPlot(
         point_label_handler: CollisionHandler = None,
         area_label_handler: CollisionHandler = None,
         path_label_handler: CollisionHandler = None,
+        label_budget: LabelBudget = None,
+        astrometry: AstrometryMode = None,
         raise_on_below_horizon: bool = True,
         scale: float = 1.0,
         autoscale: bool = False,
@@ -99,6 +106,8 @@ class OpticPlot(
             point_label_handler=point_label_handler,
             area_label_handler=area_label_handler,
             path_label_handler=path_label_handler,
+            label_budget=label_budget,
+            astrometry=astrometry,
             scale=scale,
             autoscale=autoscale,
             suppress_warnings=suppress_warnings,
@@ -140,29 +149,26 @@ class OpticPlot(
         """Azimuth of target (degrees)"""
         return self.pos_az
 
+    @cached_property
+    def _altaz(self):
+        """Transform of RA/DEC to AZ/ALT for the plot's observer"""
+        return altaz_transform(self.observer, self.ephemeris_name)
+
     def _prepare_coords(self, ra, dec) -> (float, float):
         """Converts RA/DEC to AZ/ALT"""
-        return self.observer._apparent(
-            obj=SkyfieldStar(ra_hours=ra / 15, dec_degrees=dec),
-            ephemeris=self.ephemeris_name,
-        )
+        az, alt = self._altaz.transform(ra, dec)
+        return float(az[0]), float(alt[0])
 
     def _prepare_coords_many(
         self, coordinates: list, epoch_year: float = 2000
     ) -> (float, float):
         """Converts RA/DEC to AZ/ALT"""
-        df = pd.DataFrame(coordinates, columns=["ra", "dec"])
-        df["ra_hours"], df["dec_degrees"] = (df.ra / 15, df.dec)
-        df["epoch_year"] = epoch_year
-
-        sf_star = SkyfieldStar.from_dataframe(df)
-
-        df["x"], df["y"] = self.observer._apparent(
-            obj=sf_star,
-            ephemeris=self.ephemeris_name,
-        )
+        if not coordinates:
+            return []
 
-        return list(zip(df["x"], df["y"]))
+        ra, dec = np.array(coordinates, dtype=float).T
+        az, alt = self._altaz.transform(ra, dec)
+        return list(zip(az.tolist(), alt.tolist()))
 
     def _plot_kwargs(self) -> dict:
         return dict(transform=self._crs)
@@ -190,7 +196,7 @@ class OpticPlot(
         Returns:
             True if the coordinate is in bounds, otherwise False
         """
-        x, y = self._proj.transform_point(az, alt, self._crs)
+        x, y = self._projector.point_to_data(az, alt)
         return self.optic.in_bounds(x, y, scale)
 
     def _polygon(self, points, style, **kwargs):
@@ -199,11 +205,7 @@ class OpticPlot(
     def _calc_position(self):
         self.observe = self.observer.observe(self.ephemeris_name)
 
-        target = SkyfieldStar(ra_hours=self.ra / 15, dec_degrees=self.dec)
-        self.pos_az, self.pos_alt = self.observer._apparent(
-            obj=target,
-            ephemeris=self.ephemeris_name,
-        )
+        self.pos_az, self.pos_alt = self._prepare_coords(self.ra, self.dec)
         if self.pos_alt < 0 and self.raise_on_below_horizon:
             raise ValueError("Target is below horizon at specified time/location.")
 
@@ -246,10 +248,17 @@ class OpticPlot(
     def _in_bounds_xy(self, x: float, y: float) -> bool:
         return self.in_bounds_altaz(y, x)  # alt = y, az = x
 
-    def _prepare_star_coords(self, df):
-        df["x"], df["y"] = self.observer._apparent(
-            obj=SkyfieldStar.from_dataframe(df),
-            ephemeris=self.ephemeris_name,
+    def _in_bounds_xy_many(self, x, y) -> np.ndarray:
+        data_xy = self._projector.to_data(x, y)
+        return np.asarray(self.optic.in_bounds(data_xy[:, 0], data_xy[:, 1]))
+
+    def _prepare_coords_array(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        return self._altaz.transform(ra, dec)
+
+    def _prepare_star_coords(self, df, limit_by_altaz=False):
+        # RA/DEC are already adjusted for the plot's astrometry mode
+        df["x"], df["y"] = self._altaz.transform(
+            df["ra"].to_numpy(), df["dec"].to_numpy()
         )
         return df
 
@@ -446,12 +455,8 @@ class OpticPlot(
             central_latitude=self.pos_alt,
         )
         self._proj.threshold = 1000
-        self.fig = plt.figure(
-            figsize=(self.figure_size, self.figure_size),
-            facecolor=self.style.figure_background_color.as_hex(),
-            # layout="constrained",
-            dpi=DPI,
-        )
+        self.fig = self._create_figure()
+        self.fig.add_artist(TextPathCacheArtist())
         self.ax = self.fig.add_subplot(1, 1, 1, projection=self._proj)
         self.fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
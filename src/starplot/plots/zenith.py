@@ -1,9 +1,11 @@
 import numpy as np
 from matplotlib import path, patches
 
-from starplot.coordinates import CoordinateSystem
+from starplot.coordinates import AstrometryMode, CoordinateSystem
 from starplot.data.translations import translate
 from starplot.plots.map import MapPlot
+from starplot.mixins import TimeUpdateMixin
+from starplot.layers import plot_layer
 from starplot.models.observer import Observer
 from starplot.projections import Stereographic
 from starplot.styles import (
@@ -14,10 +16,11 @@ from starplot.styles import (
     extensions,
 )
 from starplot.styles.helpers import use_style
-from starplot.plotters.text import CollisionHandler
+from starplot.transforms import geometric_altitude
+from starplot.plotters.text import CollisionHandler, LabelBudget
 
 
-class ZenithPlot(MapPlot):
+class ZenithPlot(MapPlot, TimeUpdateMixin):
     """Creates a new zenith plot.
 
     Args:
@@ -28,6 +31,8 @@ class ZenithPlot(MapPlot):
         point_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for point labels.
         area_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for area labels.
         path_label_handler: Default [CollisionHandler][starplot.CollisionHandler] for path labels.
+        label_budget: Optional [LabelBudget][starplot.LabelBudget] that limits the total number of labels and the time spent placing them. If `None`, then labeling is unlimited.
+        astrometry: [Method][starplot.AstrometryMode] for calculating star positions. If `None`, then the default for the plot type will be used (`apparent` for horizon/optic plots, `proper_motion` for all others).
         scale: Scaling factor that will be applied to all sizes in styles (e.g. font size, marker size, line widths, etc). For example, if you want to make everything 2x bigger, then set the scale to 2. At `scale=1` and `resolution=4096` (the default), all sizes are optimized visually for a map that covers 1-3 constellations. So, if you're creating a plot of a _larger_ extent, then it'd probably be good to decrease the scale (i.e. make everything smaller) -- and _increase_ the scale if you're plotting a very small area.
         autoscale: If True, then the scale will be set automatically based on resolution.
         suppress_warnings: If True (the default), then all warnings will be suppressed
@@ -40,6 +45,12 @@ class ZenithPlot(MapPlot):
     _coordinate_system = CoordinateSystem.RA_DEC
     _gradient_direction = GradientDirection.RADIAL
 
+    HORIZON_MARGIN = 3
+    """Margin (in degrees) below the horizon for culling objects, which covers refraction, proper motion, marker sizes, and the curvature of lines"""
+
+    REQUERY_DEGREES = 2.0
+    """Default for how far (in degrees) the sky can rotate before plotted data is re-queried on time updates (must be less than the horizon margin, so no rising objects are missed)"""
+
     def __init__(
         self,
         observer: Observer = None,
@@ -49,6 +60,8 @@ class ZenithPlot(MapPlot):
         point_label_handler: CollisionHandler = None,
         area_label_handler: CollisionHandler = None,
         path_label_handler: CollisionHandler = None,
+        label_budget: LabelBudget = None,
+        astrometry: AstrometryMode = None,
         scale: float = 1.0,
         autoscale: bool = False,
         suppress_warnings: bool = True,
@@ -75,6 +88,8 @@ class ZenithPlot(MapPlot):
             point_label_handler=point_label_handler,
             area_label_handler=area_label_handler,
             path_label_handler=path_label_handler,
+            label_budget=label_budget,
+            astrometry=astrometry,
             clip_path=None,
             scale=scale,
             autoscale=autoscale,
@@ -154,6 +169,7 @@ class ZenithPlot(MapPlot):
         self.ax.set_extent((p / 3.548 for p in extent), crs=self._proj)
         self.ax.set_boundary(circle, transform=self.ax.transAxes)
 
+    @plot_layer(dynamic=True)
     @use_style(LabelStyle, "info_text")
     def info(self, style: LabelStyle = None):
         """
@@ -162,7 +178,8 @@ class ZenithPlot(MapPlot):
         Args:
             style: Styling of the info text. If None, then the plot's style definition will be used.
         """
-        dt_str = self.dt.strftime("%m/%d/%Y @ %H:%M:%S") + " " + self.dt.tzname()
+        dt = self.observer.dt
+        dt_str = dt.strftime("%m/%d/%Y @ %H:%M:%S") + " " + dt.tzname()
         info = f"{str(self.observer.lat)}, {str(self.observer.lon)}\n{dt_str}"
         self.ax.text(
             0.05,
@@ -194,24 +211,38 @@ class ZenithPlot(MapPlot):
         self.ax.add_patch(self._background_clip_path)
         self._update_clip_path_polygon(buffer=20)
 
-    def _prepare_star_coords(self, df, limit_by_altaz=False):
-        # TODO : reconcile this commented code
-        # self.location = self.earth + wgs84.latlon(
-        #     self.observer.lat, self.observer.lon
-        # )
-        # df["ra_hours"], df["dec_degrees"] = (df.ra / 15, df.dec)
-        # stars_apparent = (
-        #     self.location.at(self.observer.timescale)
-        #     .observe(SkyfieldStar.from_dataframe(df))
-        #     .apparent()
-        # )
-        # # we only need altitude
-        # stars_alt, _, _ = stars_apparent.altaz()
-        # df["alt"] = stars_alt.degrees
-        # df = df[df["alt"] > 0]
-
-        df["x"], df["y"] = (
-            df["ra"],
-            df["dec"],
+    def _visible_mask(self, ra, dec, radius=0) -> np.ndarray:
+        """Returns a boolean array of which coordinates are above the horizon (including a margin)"""
+        alt = geometric_altitude(ra, dec, self.observer.lst, self.observer.lat)
+        return alt + np.nan_to_num(radius) > -self.HORIZON_MARGIN
+
+    @property
+    def _lst_offset(self) -> float:
+        """
+        Difference (in degrees) between the local sidereal time and the center of the projection, which is non-zero
+        after the plot's time is updated.
+
+        Instead of changing the projection, the sky is rotated by this offset: rotating the sky in RA is the same as
+        moving the center of the projection in RA.
+        """
+        return (self.observer.lst - self.projection.center_ra + 180) % 360 - 180
+
+    def _prepare_coords(self, ra, dec) -> tuple[float, float]:
+        return ra - self._lst_offset, dec
+
+    def _prepare_coords_many(self, coordinates: list, epoch_year: float = 2000) -> list:
+        offset = self._lst_offset
+        return [(ra - offset, dec) for ra, dec in coordinates]
+
+    def _prepare_coords_array(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        return (
+            np.asarray(ra, dtype=float) - self._lst_offset,
+            np.asarray(dec, dtype=float),
         )
+
+    def _prepare_star_coords(self, df, limit_by_altaz=False):
+        df["x"], df["y"] = self._prepare_coords_array(df["ra"], df["dec"])
         return df
+
+    def _star_positions_key(self, catalog) -> tuple:
+        return (*super()._star_positions_key(catalog), self._lst_offset)
@@ -15,14 +15,8 @@ from starplot.utils import points_on_line
 
 class ArrowPlotterMixin:
     def _to_axes(self, points):
-        ax_points = []
-
-        for ra, dec in points:
-            x, y = self._proj.transform_point(ra, dec, self._crs)
-            data_to_axes = self.ax.transData + self.ax.transAxes.inverted()
-            x_axes, y_axes = data_to_axes.transform((x, y))
-            ax_points.append([x_axes, y_axes])
-        return ax_points
+        ra, dec = np.array(points, dtype=float).T
+        return self._projector.to_axes(ra, dec).tolist()
 
     def _to_display(self, points):
         display_points = []
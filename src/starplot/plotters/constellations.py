@@ -1,6 +1,7 @@
 from typing import Callable
 
-import rtree
+import numpy as np
+
 from shapely import (
     MultiPoint,
 )
@@ -19,9 +20,10 @@ from starplot.data.stars import load as load_stars
 from starplot.models import Star, Constellation
 from starplot.models.constellation import from_tuple
 from starplot.profile import profile
+from starplot.layers import plot_layer
 from starplot.styles import LineStyle, LabelStyle
 from starplot.styles.helpers import use_style
-from starplot.geometry import is_wrapped_polygon, line_segment, split_line_at_meridian
+from starplot.geometry import is_wrapped_polygon, split_line_at_meridian
 from starplot.plotters.text import CollisionHandler
 
 
@@ -33,9 +35,11 @@ class ConstellationPlotterMixin:
         """
         Returns dictionary of stars and their position:
 
-        {hip: (x,y)}
+        {hip: (x, y, ra, dec)}
 
         Where (x, y) is the plotted coordinate system (RA/DEC or AZ/ALT)
+
+        Stars are only included if they're on a line with at least one star that could be visible on the plot.
         """
         hips = []
         for c in constellations:
@@ -46,6 +50,7 @@ class ConstellationPlotterMixin:
             filters=[_.hip.isin(hips)],
         )
         results = results.select(
+            "pk",
             "ra",
             "dec",
             "epoch_year",
@@ -55,12 +60,34 @@ class ConstellationPlotterMixin:
             "dec_mas_per_year",
         )
         df = results.to_pandas()
-        df["ra_hours"], df["dec_degrees"] = (df.ra / 15, df.dec)
-        df = self._prepare_star_coords(df, limit_by_altaz=False)
 
-        return {star.hip: (star.x, star.y) for star in df.itertuples()}
+        visible = self._visible_mask(df["ra"].to_numpy(), df["dec"].to_numpy())
+        if not visible.all():
+            hips_visible = set(df["hip"][visible])
+            hips_needed = set()
+            for c in constellations:
+                for s1_hip, s2_hip in c.star_hip_lines:
+                    if s1_hip in hips_visible or s2_hip in hips_visible:
+                        hips_needed.update((s1_hip, s2_hip))
+            df = df[df["hip"].isin(hips_needed)].copy()
+
+        df = self._star_positions(df, BIG_SKY_MAG11, limit_by_altaz=False)
+
+        return {
+            star.hip: (star.x, star.y, star.ra, star.dec) for star in df.itertuples()
+        }
+
+    def _hips_in_bounds(self, constars: dict) -> set:
+        """Returns the HIP ids of all constellation stars that are within the bounds of the plot"""
+        if not constars:
+            return set()
+
+        x, y = np.array(list(constars.values()), dtype=float)[:, :2].T
+        in_bounds = self._in_bounds_xy_many(x, y)
+        return {hip for hip, b in zip(constars.keys(), in_bounds) if b}
 
     @profile
+    @plot_layer
     @use_style(LineStyle, "constellation_lines")
     def constellations(
         self,
@@ -82,7 +109,6 @@ class ConstellationPlotterMixin:
         self.logger.debug("Plotting constellation lines...")
 
         where = where or []
-        ctr = 0
 
         extent = self._extent_mask()
         results = condata.load(extent=extent, filters=where, sql=sql, catalog=catalog)
@@ -93,9 +119,9 @@ class ConstellationPlotterMixin:
 
         constellations = [from_tuple(c) for c in constellations_df.itertuples()]
 
-        constellation_points_to_index = []
         lines = []
         constars = self._prepare_constellation_stars(constellations)
+        hips_in_bounds = self._hips_in_bounds(constars)
 
         for c in constellations:
             hiplines = c.star_hip_lines
@@ -105,67 +131,33 @@ class ConstellationPlotterMixin:
                 if not constars.get(s1_hip) or not constars.get(s2_hip):
                     continue
 
-                x1, y1 = constars.get(s1_hip)
-                x2, y2 = constars.get(s2_hip)
+                x1, y1 = constars.get(s1_hip)[:2]
+                x2, y2 = constars.get(s2_hip)[:2]
 
                 if x1 == x2 and y1 == y2:
                     continue
 
-                if x1 - x2 > 60:
-                    x2 += 360
-                elif x2 - x1 > 60:
-                    x1 += 360
-
                 if not inbounds and (
-                    self._in_bounds_xy(x1, y1) or self._in_bounds_xy(x2, y2)
+                    s1_hip in hips_in_bounds or s2_hip in hips_in_bounds
                 ):
                     inbounds = True
                 elif not inbounds:
                     continue
 
-                xy_lines = []
-
-                if x2 > 360:
-                    xy_lines = [*split_line_at_meridian((x1, y1), (x2, y2))]
-                elif x1 > 360:
-                    xy_lines = [*split_line_at_meridian((x2, y2), (x1, y1))]
-                else:
-                    xy_lines = [[(x1, y1), (x2, y2)]]
-
-                data_lines = [
-                    [self._proj.transform_point(x, y, self._crs) for x, y in line]
-                    for line in xy_lines
-                ]
-                display_lines = [
-                    [self.ax.transData.transform(p) for p in line]
-                    for line in data_lines
-                ]
-
-                lines.extend(data_lines)
-
-                radius = style.width * self.scale if style.width else 1
-
-                for display_start, display_end in display_lines:
-                    for x, y in line_segment(display_start, display_end, radius * 4):
-                        if x < 0 or y < 0:
-                            continue
-                        bbox = (
-                            x - radius,
-                            y - radius,
-                            x + radius,
-                            y + radius,
-                        )
-                        if self.debug_text:
-                            self._debug_bbox(bbox, color="#39FF14", width=0.5)
-
-                        constellation_points_to_index.append((ctr, bbox, None))
-                        ctr += 1
+                lines.append((*constars.get(s1_hip), *constars.get(s2_hip)))
 
             if inbounds:
                 self._objects.constellations.append(c)
 
+        if not lines:
+            return
+
+        # columns: x, y, ra, dec -- of the start and end of each line
+        endpoints = np.array(lines, dtype=float).reshape(-1, 4)
+        segments = self._constellation_segments(endpoints[:, 0], endpoints[:, 1])
+
         line_collection = LineCollection(
-            lines,
+            segments,
             clip_on=True,
             clip_path=self._background_clip_path,
             gid="constellations-line",
@@ -173,19 +165,57 @@ class ConstellationPlotterMixin:
         )
         self.ax.add_collection(line_collection)
 
-        if self._constellations_rtree.get_size() == 0:
-            self._constellations_rtree = rtree.index.Index(
-                constellation_points_to_index
-            )
-        else:
-            for bbox in constellation_points_to_index:
-                self._constellations_rtree.insert(
-                    0,
-                    bbox,
-                    None,
-                )
+        radius = style.width * self.scale if style.width else 1
+        self._index_constellation_segments(segments, radius)
+
+        def move(x, y):
+            segments = self._constellation_segments(x, y)
+            line_collection.set_segments(segments)
+            self._index_constellation_segments(segments, radius)
+
+        self._track(line_collection, endpoints[:, 2], endpoints[:, 3], move)
+
+    def _constellation_segments(self, x, y) -> np.ndarray:
+        """
+        Returns constellation line segments in data coordinates, with shape (N, 2, 2)
+
+        Args:
+            x: Array of the x coordinate (in the plotted coordinate system) of each line's start and end, i.e. `[start, end, start, end, ...]`
+            y: Array of the y coordinate of each line's start and end
+        """
+        xy_lines = []
+
+        for x1, y1, x2, y2 in np.column_stack((x, y)).reshape(-1, 4).tolist():
+            if x1 - x2 > 60:
+                x2 += 360
+            elif x2 - x1 > 60:
+                x1 += 360
+
+            if x2 > 360:
+                xy_lines.extend(split_line_at_meridian((x1, y1), (x2, y2)))
+            elif x1 > 360:
+                xy_lines.extend(split_line_at_meridian((x2, y2), (x1, y1)))
+            else:
+                xy_lines.append([(x1, y1), (x2, y2)])
+
+        # project all line endpoints at once
+        xy = np.array(xy_lines, dtype=float).reshape(-1, 2)
+        data = self._projector.to_data(xy[:, 0], xy[:, 1])
+        return data.reshape(-1, 2, 2)
+
+    def _index_constellation_segments(self, segments, radius: float) -> None:
+        """Adds constellation line segments (in data coordinates) to the index that's used for label collisions"""
+        segments_to_index = self.ax.transData.transform(
+            segments.reshape(-1, 2)
+        ).reshape(-1, 4)
+        self._constellations_index.insert_many(segments_to_index, padding=radius)
+
+        if self.debug_text:
+            for x0, y0, x1, y1 in segments_to_index:
+                self._debug_segment((x0, y0), (x1, y1), color="#39FF14", width=0.5)
 
     @profile
+    @plot_layer
     @use_style(LineStyle, "constellation_borders")
     def constellation_borders(
         self, style: LineStyle = None, catalog: Catalog = CONSTELLATION_BORDERS
@@ -208,27 +238,30 @@ class ConstellationPlotterMixin:
         if borders_df.empty:
             return
 
-        border_lines = []
+        if self._coordinate_system not in (
+            CoordinateSystem.RA_DEC,
+            CoordinateSystem.AZ_ALT,
+        ):
+            raise ValueError("Unrecognized coordinate system")
+
+        border_coords = []
         geometries = [line.geometry for line in borders_df.itertuples()]
 
         for ls in geometries:
             if ls.length < 360:
                 ls = ls.segmentize(1)
 
-            xy = [c for c in ls.coords]
-
-            if self._coordinate_system == CoordinateSystem.RA_DEC:
-                border_lines.append(xy)
+            border_coords.append(np.array(ls.coords, dtype=float))
 
-            elif self._coordinate_system == CoordinateSystem.AZ_ALT:
-                coords = [self._prepare_coords(*p) for p in xy]
-                border_lines.append(coords)
+        # all borders are converted at once, and then split back into lines
+        splits = np.cumsum([len(c) for c in border_coords])[:-1]
+        ra, dec = np.concatenate(border_coords).T
 
-            else:
-                raise ValueError("Unrecognized coordinate system")
+        def border_lines(x, y):
+            return np.split(np.column_stack((x, y)), splits)
 
         line_collection = LineCollection(
-            border_lines,
+            border_lines(*self._prepare_coords_array(ra, dec)),
             **style.matplot_line_collection_kwargs(self.scale),
             transform=self._crs,
             clip_on=True,
@@ -237,7 +270,15 @@ class ConstellationPlotterMixin:
         )
         self.ax.add_collection(line_collection)
 
+        self._track(
+            line_collection,
+            ra,
+            dec,
+            lambda x, y: line_collection.set_segments(border_lines(x, y)),
+        )
+
     @profile
+    @plot_layer
     @use_style(LabelStyle, "constellation_labels")
     def constellation_labels(
         self,
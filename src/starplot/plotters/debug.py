@@ -1,3 +1,4 @@
+from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
 from matplotlib.transforms import Bbox
 
@@ -19,3 +20,15 @@ class DebugPlotterMixin:
             zorder=100_000,
         )
         self.ax.add_patch(rect)
+
+    def _debug_segment(self, start, end, color, width=1):
+        line = Line2D(
+            [start[0], end[0]],
+            [start[1], end[1]],
+            transform=None,  # display coordinates
+            color=color,
+            linewidth=width,
+            alpha=1,
+            zorder=100_000,
+        )
+        self.ax.add_line(line)
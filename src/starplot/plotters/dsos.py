@@ -15,6 +15,7 @@ from starplot.models.dso import (
 )
 from starplot.styles import MarkerSymbolEnum
 from starplot.profile import profile
+from starplot.layers import plot_layer
 from starplot.plotters.text import CollisionHandler
 
 
@@ -144,6 +145,7 @@ class DsoPlotterMixin:
         self.dsos(where=where, **kwargs)
 
     @profile
+    @plot_layer
     def dsos(
         self,
         where: list = None,
@@ -201,10 +203,26 @@ class DsoPlotterMixin:
             pks = result["pk"].to_list()
             dsos_labeled = dsos_labeled.filter(_.pk.isin(pks))
 
-        label_pks = dsos_labeled.select("pk").to_pandas()["pk"].tolist()
-        true_size_pks = dsos_true_size.select("pk").to_pandas()["pk"].tolist()
+        label_pks = set(dsos_labeled.select("pk").to_pandas()["pk"])
+        true_size_pks = set(dsos_true_size.select("pk").to_pandas()["pk"])
 
-        results_df = dso_results.to_pandas().replace({np.nan: None})
+        results_df = dso_results.to_pandas()
+
+        # remove DSOs that can't be visible (e.g. below the horizon), including their extent
+        radius = results_df["maj_ax"].to_numpy(dtype=float) / 60 / 2
+        visible = self._visible_mask(
+            results_df["ra"].to_numpy(), results_df["dec"].to_numpy(), radius
+        )
+        results_df = results_df[visible]
+
+        if self.label_budget.is_limited:
+            # label brightest DSOs first, so the budget is spent on the most prominent labels
+            results_df = results_df.sort_values("magnitude", na_position="last")
+
+        results_df["inbounds"] = self.in_bounds_many(
+            results_df["ra"], results_df["dec"]
+        )
+        results_df = results_df.replace({np.nan: None})
 
         for d in results_df.itertuples():
             ra = d.ra
@@ -225,7 +243,9 @@ class DsoPlotterMixin:
             _alpha_fn = alpha_fn or (lambda d: style.marker.alpha)
             style.marker.alpha = _alpha_fn(_dso)
 
-            if _dso.pk not in label_pks:
+            if _dso.pk not in label_pks or (
+                label and not self._labeled.register(("dso", _dso.name))
+            ):
                 label = None
 
             _true_size = _dso.pk in true_size_pks
@@ -265,7 +285,7 @@ class DsoPlotterMixin:
                             angle=angle or 0,
                         )
 
-                if label and self.in_bounds(ra, dec):
+                if label and d.inbounds:
                     self.text(
                         label,
                         ra,
@@ -277,7 +297,7 @@ class DsoPlotterMixin:
 
                 self._add_legend_handle_marker(legend_label, style.marker)
 
-            else:
+            elif d.inbounds:
                 # if no major axis, then just plot as a marker
                 self.marker(
                     ra=ra,
@@ -286,7 +306,7 @@ class DsoPlotterMixin:
                     label=label,
                     legend_label=legend_label,
                     collision_handler=handler,
-                    # skip_bounds_check=True,
+                    skip_bounds_check=True,
                     gid_marker=f"dso-{d.type}-marker",
                     gid_label=f"dso-{d.type}-label",
                 )
@@ -2,6 +2,7 @@ import numpy as np
 from matplotlib.colors import LinearSegmentedColormap
 from starplot.profile import profile
 from starplot.styles import GradientDirection
+from starplot.transforms import ICRS_TO_GALACTIC
 
 
 class GradientBackgroundMixin:
@@ -126,21 +127,13 @@ class GradientBackgroundMixin:
         x = np.linspace(-np.pi, np.pi, 250)
         y = np.linspace(-np.pi / 2, np.pi / 2, 250)
         X, Y = np.meshgrid(x, y)
-        # Rotation matrix (ICRS → Galactic)
-        R = np.array(
-            [
-                [-0.0548755604162154, -0.8734370902348850, -0.4838350155487132],
-                [0.4941094278755837, -0.4448296299600112, 0.7469822444972189],
-                [-0.8676661490190047, -0.1980763734312015, 0.4559837761750669],
-            ]
-        )
         # Equatorial unit vectors
         cos_y = np.cos(Y)
         eq = np.stack(
             [cos_y * np.cos(X), cos_y * np.sin(X) * -1, np.sin(Y) * -1], axis=-1
         )
         # Rotate into Galactic coords
-        gal = eq @ R.T
+        gal = eq @ ICRS_TO_GALACTIC.T
         # Gradient follows galactic latitude
         gradient = np.arcsin(gal[..., 2])
         return X, Y, gradient
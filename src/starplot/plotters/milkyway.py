@@ -8,11 +8,13 @@ from starplot.styles import PolygonStyle
 from starplot.styles.helpers import use_style
 from starplot.geometry import split_polygon_at_zero
 from starplot.profile import profile
+from starplot.layers import plot_layer
 from starplot.models.milky_way import from_tuple
 
 
 class MilkyWayPlotterMixin:
     @profile
+    @plot_layer
     @use_style(PolygonStyle, "milky_way")
     def milky_way(self, style: PolygonStyle = None, catalog: Catalog = MILKY_WAY):
         """
@@ -3,18 +3,25 @@ from typing import Callable
 
 import rtree
 import numpy as np
+import pandas as pd
 from ibis import _ as ibis_table
 from skyfield.api import Star as SkyfieldStar
 
-from starplot import callables
+from starplot import cache, callables
+from starplot.config import settings as StarplotSettings
 from starplot.data import stars
 from starplot.data.catalogs import Catalog, BIG_SKY_MAG11
+from starplot.coordinates import AstrometryMode, propagate_proper_motion
 from starplot.data.translations import translate
 from starplot.models.star import Star, from_tuple
 from starplot.styles import ObjectStyle, use_style
 from starplot.profile import profile
+from starplot.layers import plot_layer
 from starplot.plotters.text import CollisionHandler
 
+POSITION_COLUMNS = ["ra", "dec", "x", "y"]
+"""Columns of star positions that are stored in the position cache"""
+
 
 class StarPlotterMixin:
     def _load_stars(self, catalog, filters=None, sql=None):
@@ -57,11 +64,43 @@ class StarPlotterMixin:
 
         return plotted
 
+    def _index_stars(self, display_x, display_y, radii) -> None:
+        """
+        Adds stars to the spatial index that's used for label collisions
+
+        Args:
+            display_x: Array of x coordinates, in display coordinates
+            display_y: Array of y coordinates, in display coordinates
+            radii: Array of each star's radius (in display coordinates). Stars with a radius of NaN are not indexed.
+        """
+        indexed = (
+            np.isfinite(radii)
+            & np.isfinite(display_x)
+            & np.isfinite(display_y)
+            & (display_x >= 0)
+            & (display_y >= 0)
+        )
+        x, y, r = display_x[indexed], display_y[indexed], radii[indexed]
+        bboxes = np.column_stack((x - r, y - r, x + r, y + r))
+
+        if self.debug_text:
+            for bbox in bboxes:
+                self._debug_bbox(bbox, color="#39FF14", width=1)
+
+        if self._stars_rtree.get_size() > 0:
+            for bbox in bboxes:
+                self._stars_rtree.insert(0, bbox, None)
+        elif len(bboxes):
+            # bulk loading is much faster than inserting one at a time
+            self._stars_rtree = rtree.index.Index(
+                (i, bbox, None) for i, bbox in enumerate(bboxes)
+            )
+
     def _star_labels(
         self,
         star_objects: list[Star],
         star_sizes: list[float],
-        label_pks: list,
+        label_pks: set,
         style: ObjectStyle,
         bayer_labels: bool,
         flamsteed_labels: bool,
@@ -71,22 +110,20 @@ class StarPlotterMixin:
         _bayer = []
         _flamsteed = []
 
+        order = range(len(star_objects))
+
+        if self.label_budget.is_limited:
+            # label brightest stars first, so the budget is spent on the most prominent labels
+            order = sorted(order, key=lambda i: star_objects[i].magnitude)
+
         # Plot all star common names first
-        for i, s in enumerate(star_objects):
+        for i in order:
+            s = star_objects[i]
             if s.pk not in label_pks:
                 continue
 
-            if (
-                s.hip
-                and s.hip in self._labeled_stars
-                or s.tyc
-                and s.tyc in self._labeled_stars
-            ):
+            if not self._labeled.register(("hip", s.hip), ("tyc", s.tyc)):
                 continue
-            elif s.hip:
-                self._labeled_stars.append(s.hip)
-            elif s.tyc:
-                self._labeled_stars.append(s.tyc)
 
             label = label_fn(s)
             bayer_desig = s.bayer
@@ -141,6 +178,108 @@ class StarPlotterMixin:
                 gid="stars-label-flamsteed",
             )
 
+    def _apply_astrometry(self, df):
+        """Sets the RA/DEC of each star in the dataframe, based on the plot's astrometry mode."""
+        if self.astrometry == AstrometryMode.APPARENT:
+            nearby_stars = SkyfieldStar.from_dataframe(df)
+            astrometric = self.earth.at(self.observer.timescale).observe(nearby_stars)
+            stars_ra, stars_dec, _ = astrometric.radec()
+            df["ra"], df["dec"] = (
+                stars_ra.hours * 15,
+                stars_dec.degrees,
+            )
+            return df
+
+        if self.astrometry == AstrometryMode.PROPER_MOTION:
+            df["ra"], df["dec"] = propagate_proper_motion(
+                df["ra"],
+                df["dec"],
+                df["ra_mas_per_year"],
+                df["dec_mas_per_year"],
+                df["epoch_year"],
+                self.observer.timescale.J,
+            )
+
+        return df
+
+    def _star_positions_key(self, catalog) -> tuple:
+        """Returns the key of star positions in the position cache"""
+        observer = self.observer
+        seconds = observer.timescale.tt * 86_400
+        tolerance = StarplotSettings.position_cache_tolerance
+        time_key = round(seconds / tolerance) if tolerance else seconds
+
+        return (
+            self.__class__.__name__,
+            str(getattr(catalog, "path", catalog)),
+            time_key,
+            observer.lat,
+            observer.lon,
+            observer.elevation,
+            observer.temperature,
+            observer.pressure,
+            self.astrometry.value,
+            self.ephemeris_name,
+        )
+
+    def _star_positions(self, df, catalog, limit_by_altaz=True):
+        """
+        Sets the position of each star in the dataframe: RA/DEC (based on the plot's astrometry mode) and the
+        plotted coordinates (x, y).
+
+        Positions are looked up by `pk` in the process-wide position cache first, so only stars that
+        haven't been calculated yet for the same sky (catalog, time, location, and astrometry mode) are calculated.
+
+        If `limit_by_altaz` is True, then stars that can't be visible on the plot (e.g. below the horizon) are removed first.
+        """
+        if limit_by_altaz:
+            visible = self._visible_mask(df["ra"].to_numpy(), df["dec"].to_numpy())
+            if not visible.all():
+                df = df[visible].copy()
+
+        df["ra_hours"], df["dec_degrees"] = (df.ra / 15, df.dec)
+
+        key = self._star_positions_key(catalog)
+        found, values = cache.positions.get(
+            key, df["pk"].to_numpy(), len(POSITION_COLUMNS)
+        )
+        calculated = df.index[found]
+
+        if not found.all():
+            missing = df[~found].copy()
+            missing = self._apply_astrometry(missing)
+            missing = self._prepare_star_coords(missing, limit_by_altaz=limit_by_altaz)
+            missing_values = missing[POSITION_COLUMNS].to_numpy(dtype=float)
+            cache.positions.put(key, missing["pk"].to_numpy(), missing_values)
+
+            values = pd.DataFrame(values, index=df.index, columns=POSITION_COLUMNS)
+            values.loc[missing.index] = missing_values
+            values = values.to_numpy()
+            calculated = calculated.union(missing.index)
+
+        df[POSITION_COLUMNS] = values
+
+        if len(calculated) < len(df):
+            # stars that were excluded when preparing coordinates (e.g. below the horizon) are removed
+            df = df[df.index.isin(calculated)].copy()
+
+        return df
+
+    def _skyfield_stars(self, df) -> SkyfieldStar:
+        """
+        Returns a Skyfield star (vector) for all stars in the dataframe, for calculating AZ/ALT or other frames.
+
+        For astrometry modes other than apparent, the RA/DEC in the dataframe are already final, so they're used
+        as-is (without proper motion or parallax) to avoid propagating them again.
+        """
+        if self.astrometry == AstrometryMode.APPARENT:
+            return SkyfieldStar.from_dataframe(df)
+
+        return SkyfieldStar(
+            ra_hours=df["ra"].to_numpy() / 15,
+            dec_degrees=df["dec"].to_numpy(),
+        )
+
     def _prepare_star_coords(self, df, limit_by_altaz=False):
         df["x"], df["y"] = (
             df["ra"],
@@ -149,6 +288,7 @@ class StarPlotterMixin:
         return df
 
     @profile
+    @plot_layer
     @use_style(ObjectStyle, "star")
     def stars(
         self,
@@ -198,7 +338,6 @@ class StarPlotterMixin:
         handler = collision_handler or self.point_label_handler
         where = where or []
         where_labels = where_labels or []
-        stars_to_index = []
 
         star_results = self._load_stars(catalog, filters=where, sql=sql)
 
@@ -213,67 +352,42 @@ class StarPlotterMixin:
             pks = result["pk"].to_list()
             star_results_labeled = star_results_labeled.filter(ibis_table.pk.isin(pks))
 
-        label_pks = star_results_labeled.to_pandas()["pk"].tolist()
+        label_pks = set(star_results_labeled.to_pandas()["pk"])
 
         stars_df = star_results.to_pandas()
-        stars_df["ra_hours"], stars_df["dec_degrees"] = (stars_df.ra / 15, stars_df.dec)
-
-        nearby_stars = SkyfieldStar.from_dataframe(stars_df)
-        astrometric = self.earth.at(self.observer.timescale).observe(nearby_stars)
-        stars_ra, stars_dec, _ = astrometric.radec()
-        stars_df["ra"], stars_df["dec"] = (
-            stars_ra.hours * 15,
-            stars_dec.degrees,
-        )
-        stars_df = self._prepare_star_coords(stars_df)
+        stars_df = self._star_positions(stars_df, catalog)
 
         starz = []
-        rtree_id = 1
 
-        transformed = self._proj.transform_points(
-            self._crs,
-            stars_df["x"].to_numpy(),
-            stars_df["y"].to_numpy(),
-        )
-        stars_df["data_x"] = transformed[:, 0]
-        stars_df["data_y"] = transformed[:, 1]
-        stars_df[["display_x", "display_y"]] = self.ax.transData.transform(
-            stars_df[["data_x", "data_y"]].to_numpy()
+        stars_df[["display_x", "display_y"]] = self._projector.to_display(
+            stars_df["x"].to_numpy(), stars_df["y"].to_numpy()
         )
         stars_df = stars_df[(stars_df["display_x"] >= 0) & (stars_df["display_y"] >= 0)]
 
         for star in stars_df.itertuples():
-            display_x, display_y = star.display_x, star.display_y
-
             obj = from_tuple(star)
             size = size_fn(obj) * self.scale**2
             alpha = alpha_fn(obj)
             color = color_fn(obj) or style.marker.color.as_hex()
 
-            if obj.magnitude < 5:
-                rtree_id += 1
-                radius = size**0.5 / 5
-                bbox = np.array(
-                    (
-                        display_x - radius,
-                        display_y - radius,
-                        display_x + radius,
-                        display_y + radius,
-                    )
+            # only bright stars are indexed for label collisions
+            radius = size**0.5 / 5 if obj.magnitude < 5 else np.nan
+
+            starz.append(
+                (
+                    star.x,
+                    star.y,
+                    size,
+                    alpha,
+                    color,
+                    obj,
+                    star.ra,
+                    star.dec,
+                    star.display_x,
+                    star.display_y,
+                    radius,
                 )
-                if self.debug_text:
-                    self._debug_bbox(bbox, color="#39FF14", width=1)
-                if self._stars_rtree.get_size() > 0:
-                    self._stars_rtree.insert(
-                        0,
-                        bbox,
-                        None,
-                    )
-                else:
-                    # if the index has no stars yet, then wait until end to load for better performance
-                    stars_to_index.append((rtree_id, bbox, None))
-
-            starz.append((star.x, star.y, size, alpha, color, obj))
+            )
 
         starz.sort(key=lambda s: s[2], reverse=True)  # sort by descending size
 
@@ -281,14 +395,27 @@ class StarPlotterMixin:
             self.logger.debug(f"Star count = {len(starz)}")
             return
 
-        x, y, sizes, alphas, colors, star_objects = zip(*starz)
+        (
+            x,
+            y,
+            sizes,
+            alphas,
+            colors,
+            star_objects,
+            ras,
+            decs,
+            display_x,
+            display_y,
+            radii,
+        ) = zip(*starz)
+        radii = np.array(radii)
 
         self._objects.stars.extend(star_objects)
 
         self.logger.debug(f"Star count = {len(star_objects)}")
 
         # Plot Stars
-        self._scatter_stars(
+        plotted = self._scatter_stars(
             x,
             y,
             sizes,
@@ -301,12 +428,18 @@ class StarPlotterMixin:
             else "none",
         )
 
+        self._index_stars(np.array(display_x), np.array(display_y), radii)
+
+        def move(x, y):
+            plotted.set_offsets(np.column_stack((x, y)))
+            display = self._projector.to_display(x, y)
+            self._index_stars(display[:, 0], display[:, 1], radii)
+
+        self._track(plotted, ras, decs, move)
+
         _legend_label = translate(legend_label, self.language) or legend_label
         self._add_legend_handle_marker(_legend_label, style.marker)
 
-        if stars_to_index:
-            self._stars_rtree = rtree.index.Index(stars_to_index)
-
         self._star_labels(
             star_objects,
             sizes,
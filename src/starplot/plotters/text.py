@@ -1,17 +1,23 @@
 import math
+import time
 from dataclasses import dataclass
+from functools import partial
 
 import numpy as np
 import rtree
-from shapely import Point, box
+from shapely import Point, Polygon, box
 from shapely.errors import GEOSException
-from matplotlib.text import Annotation
+from matplotlib.text import Annotation, Text
 
 from starplot.config import settings as StarplotSettings, SvgTextType
 from starplot.styles import AnchorPointEnum, LabelStyle
 from starplot.styles.helpers import use_style
 from starplot.geometry import (
+    LineSegmentIndex,
+    box_corners,
+    convex_polygons_intersect,
     random_point_in_polygon_at_distance,
+    rotated_rectangle,
     union_at_zero,
 )
 
@@ -27,6 +33,16 @@ Long term strategy:
 BBox = tuple[int, int, int, int]
 """Tuple of integers representing bounding box (xmin, ymin, xmax, ymax) -- in display coordinates."""
 
+FONT_KWARGS = (
+    "family",
+    "fontname",
+    "fontsize",
+    "fontstyle",
+    "weight",
+    "linespacing",
+)
+"""Text kwargs that affect the size of rendered text"""
+
 
 def round_away_from_zero(x):
     """
@@ -99,6 +115,78 @@ class CollisionHandler:
         ]
 
 
+@dataclass
+class LabelBudget:
+    """
+    Dataclass that describes the total amount of labeling work allowed for a plot.
+
+    Labels that are requested after the budget is spent are dropped, and counted in the plot's `labels_dropped` attribute.
+    """
+
+    max_labels: int = None
+    """Maximum number of labels to plot. If `None`, then there's no limit."""
+
+    time_limit: float = None
+    """Maximum time (in seconds) to spend placing labels. If `None`, then there's no limit."""
+
+    def is_spent(self, num_labels: int, seconds: float) -> bool:
+        """Returns True if the budget is spent, based on the number of plotted labels and the time spent placing labels"""
+        if self.max_labels is not None and num_labels >= self.max_labels:
+            return True
+
+        if self.time_limit is not None and seconds >= self.time_limit:
+            return True
+
+        return False
+
+    @property
+    def is_limited(self) -> bool:
+        """Returns True if the budget has any limits"""
+        return self.max_labels is not None or self.time_limit is not None
+
+
+class LabelRegistry:
+    """
+    Registry of objects that have been labeled on a plot, used for suppressing duplicate labels across layers.
+
+    Objects are identified by keys of (namespace, identifier), for example: `("hip", 32349)` or `("dso", "NGC2632")`.
+    """
+
+    def __init__(self):
+        self._keys = set()
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def register(self, *keys: tuple) -> bool:
+        """
+        Registers an object by all of its keys.
+
+        Args:
+            keys: Keys of the object. Keys with an empty identifier (e.g. a star without a HIP id) are ignored.
+
+        Returns:
+            True if the object was registered, False if it was already registered by any of its keys
+        """
+        keys = [k for k in keys if k[1]]
+
+        if any(k in self._keys for k in keys):
+            return False
+
+        self._keys.update(keys)
+        return True
+
+    def discard(self, *keys: tuple) -> None:
+        """Removes keys from the registry, so their objects can be labeled again"""
+        self._keys.difference_update(keys)
+
+
 def next_best_position(
     plotted_positions: list[int],
     available_positions: list[int],
@@ -210,25 +298,61 @@ class TextPlotterMixin:
     def __init__(self, *args, **kwargs):
         self.labels = []
         self._labels_rtree = rtree.index.Index()
-        self._constellations_rtree = rtree.index.Index()
+        self._constellations_index = LineSegmentIndex()
         self._stars_rtree = rtree.index.Index()
         self._markers_rtree = rtree.index.Index()
+        self._text_extents = {}
+        self._labeled = LabelRegistry()
+
+        self.labels_dropped = 0
+        """Number of labels that were dropped because the plot's label budget was spent"""
+
+        self._label_seconds = 0.0
+
+    def _is_label_budget_spent(self, num_labels: int = 1) -> bool:
+        """Returns True if the plot's label budget is spent, and counts the label(s) as dropped"""
+        if not self.label_budget.is_spent(len(self.labels), self._label_seconds):
+            return False
 
-    def _is_label_collision(self, bbox: BBox) -> bool:
-        ix = list(self._labels_rtree.intersection(bbox))
-        return len(ix) > 0
+        if self.labels_dropped == 0:
+            self.logger.debug("Label budget spent, dropping remaining labels")
 
-    def _is_constellation_collision(self, bbox: BBox) -> bool:
-        ix = list(self._constellations_rtree.intersection(bbox))
-        return len(ix) > 0
+        self.labels_dropped += num_labels
+        return True
+
+    def _is_rtree_collision(
+        self, index: rtree.index.Index, bbox: BBox, polygon: np.ndarray = None
+    ) -> bool:
+        """
+        Returns True if the bounding box intersects any item in the R-Tree.
+
+        If a polygon (e.g. a rotated label box) is specified, then each candidate from the R-Tree is
+        tested against the polygon. Items that were inserted with a polygon as their object use that
+        polygon, otherwise their bounding box is used.
+        """
+        if polygon is None:
+            return index.count(bbox) > 0
+
+        for item in index.intersection(bbox, objects=True):
+            other = item.object if item.object is not None else box_corners(item.bbox)
+            if convex_polygons_intersect(polygon, other):
+                return True
+
+        return False
+
+    def _is_label_collision(self, bbox: BBox, polygon: np.ndarray = None) -> bool:
+        return self._is_rtree_collision(self._labels_rtree, bbox, polygon)
+
+    def _is_constellation_collision(
+        self, bbox: BBox, polygon: np.ndarray = None
+    ) -> bool:
+        return self._constellations_index.intersects(bbox, polygon)
 
-    def _is_star_collision(self, bbox: BBox) -> bool:
-        ix = list(self._stars_rtree.intersection(bbox))
-        return len(ix) > 0
+    def _is_star_collision(self, bbox: BBox, polygon: np.ndarray = None) -> bool:
+        return self._is_rtree_collision(self._stars_rtree, bbox, polygon)
 
-    def _is_marker_collision(self, bbox: BBox) -> bool:
-        ix = list(self._markers_rtree.intersection(bbox))
-        return len(ix) > 0
+    def _is_marker_collision(self, bbox: BBox, polygon: np.ndarray = None) -> bool:
+        return self._is_rtree_collision(self._markers_rtree, bbox, polygon)
 
     def _is_clipped(self, points) -> bool:
         p = self._clip_path_polygon
@@ -239,7 +363,9 @@ class TextPlotterMixin:
 
         return False
 
-    def _is_clipped_box(self, bbox: BBox) -> bool:
+    def _is_clipped_box(self, bbox: BBox, polygon: np.ndarray = None) -> bool:
+        if polygon is not None:
+            return not self._clip_path_polygon.contains(Polygon(polygon))
         return not self._clip_path_polygon.contains(box(*bbox))
 
     def _get_label_bbox(self, label: Annotation) -> BBox:
@@ -256,7 +382,30 @@ class TextPlotterMixin:
 
         return tuple(int(p) for p in result)
 
-    def _add_label_to_rtree(self, label: Annotation, bbox: BBox = None) -> None:
+    def _get_text_extent(self, text: str, **kwargs) -> tuple[float, float]:
+        """
+        Returns the (width, height) of unrotated text in display coordinates, without adding an artist to the plot.
+
+        Extents are cached per text/font combination, so each unique label is only measured once.
+
+        Args:
+            text: Text to measure
+            **kwargs: Text kwargs (only the ones that affect the size of the text are used)
+        """
+        font_kwargs = {k: kwargs[k] for k in FONT_KWARGS if kwargs.get(k) is not None}
+        key = (text, tuple((k, str(v)) for k, v in font_kwargs.items()))
+
+        if key not in self._text_extents:
+            t = Text(0, 0, text, **font_kwargs)
+            t.set_figure(self.fig)
+            extent = t.get_window_extent(renderer=self.fig.canvas.get_renderer())
+            self._text_extents[key] = (extent.width, extent.height)
+
+        return self._text_extents[key]
+
+    def _add_label_to_rtree(
+        self, label: Annotation, bbox: BBox = None, polygon: np.ndarray = None
+    ) -> None:
         """
         Adds a label to the R-Tree, which is a spatial index for all plotted labels and used for collision detection.
 
@@ -265,6 +414,7 @@ class TextPlotterMixin:
         Args:
             label: Annotation instance returned from matplotlib's annotate() function
             bbox: Tuple of integers representing bounding box (xmin, ymin, xmax, ymax) -- in display coordinates. If None, then bounding box will be obtained from label instance.
+            polygon: Corners of the label's rotated box -- in display coordinates. If specified, then collision tests against this label will use the rotated box instead of the bounding box.
         """
         bbox = bbox or self._get_label_bbox(label)
 
@@ -272,7 +422,7 @@ class TextPlotterMixin:
             self._debug_bbox(bbox, color="white", width=1.5)
 
         self.labels.append(label)
-        self._labels_rtree.insert(0, bbox)
+        self._labels_rtree.insert(0, bbox, obj=polygon)
 
     def _is_open_space(
         self,
@@ -282,12 +432,14 @@ class TextPlotterMixin:
         allow_label_collisions=False,
         allow_marker_collisions=False,
         allow_constellation_collisions=False,
+        polygon: np.ndarray = None,
     ) -> bool:
         """
         Returns true if the bounding box is in an open space, according to the allow_* kwargs.
 
         Args:
             bbox: Tuple of integers representing bounding box (xmin, ymin, xmax, ymax) -- in display coordinates.
+            polygon: Corners of a rotated box inside the bounding box -- in display coordinates. If specified, then collisions are tested against this box instead of the full bounding box. Padding is not applied to the polygon.
         """
         x0, y0, x1, y1 = bbox
         bbox_padded = (
@@ -300,20 +452,22 @@ class TextPlotterMixin:
         if any([np.isnan(c) for c in (x0, y0, x1, y1)]):
             return False
 
-        if not allow_clipped and self._is_clipped_box(bbox_padded):
+        if not allow_clipped and self._is_clipped_box(bbox_padded, polygon):
             return False
 
-        if not allow_label_collisions and self._is_label_collision(bbox_padded):
+        if not allow_label_collisions and self._is_label_collision(
+            bbox_padded, polygon
+        ):
             return False
 
         if not allow_marker_collisions and (
-            self._is_star_collision(bbox_padded)
-            or self._is_marker_collision(bbox_padded)
+            self._is_star_collision(bbox_padded, polygon)
+            or self._is_marker_collision(bbox_padded, polygon)
         ):
             return False
 
         if not allow_constellation_collisions and self._is_constellation_collision(
-            bbox_padded
+            bbox_padded, polygon
         ):
             return False
 
@@ -356,8 +510,7 @@ class TextPlotterMixin:
         height = 0
         width = 0
 
-        data_xy = self._proj.transform_point(x, y, self._crs)
-        display_x, display_y = self.ax.transData.transform(data_xy)
+        display_x, display_y = self._projector.point_to_display(x, y)
 
         anchors = [(original_va, original_ha)]
         for a in collision_handler.anchor_fallbacks:
@@ -542,8 +695,7 @@ class TextPlotterMixin:
             x, y = self._prepare_coords(point.x, point.y)
 
             if height and width:
-                data_xy = self._proj.transform_point(x, y, self._crs)
-                display_x, display_y = self.ax.transData.transform(data_xy)
+                display_x, display_y = self._projector.point_to_display(x, y)
                 bbox = (
                     display_x - width / 2,
                     display_y - height / 2,
@@ -612,18 +764,53 @@ class TextPlotterMixin:
             curvature_threshold: threshold for determining smooth sections
 
         """
+        if self._is_label_budget_spent(num_labels):
+            return
+
+        start_time = time.perf_counter()
+        try:
+            self._text_line_labels(
+                x,
+                y,
+                text,
+                num_labels=num_labels,
+                collision_handler=collision_handler,
+                min_spacing=min_spacing,
+                curvature_threshold=curvature_threshold,
+                **kwargs,
+            )
+        finally:
+            self._label_seconds += time.perf_counter() - start_time
+
+    def _text_line_labels(
+        self,
+        x,
+        y,
+        text: str,
+        num_labels: int,
+        collision_handler: CollisionHandler,
+        min_spacing,
+        curvature_threshold,
+        **kwargs,
+    ) -> None:
+        """Finds positions for (and plots) the labels of `_text_line`"""
         kwargs.pop("ha", None)  # alignment is forced to center of line
         kwargs.pop("va", None)
         kwargs.pop("transform", None)  # we'll plot in axes coords
 
-        xy = list(zip(x, y))
-        data_xy = [self._proj.transform_point(_x, _y, self._crs) for _x, _y in xy]
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        data_xy = self._projector.to_data(x, y)
+        data_xy = data_xy[np.isfinite(data_xy).all(axis=1)]
         display_xy = self.ax.transData.transform(data_xy)
 
         # sort coords by display x value
         display_xy = display_xy[display_xy[:, 0].argsort()]
         num_positions = len(display_xy)
 
+        if num_positions < 2:
+            return
+
         if min_spacing is None:
             min_spacing = 1.0 / (num_labels + 1)
 
@@ -645,18 +832,16 @@ class TextPlotterMixin:
             if not too_close:
                 smooth_positions.append(section_center)
 
-        def plot_label(x0, y0, x1, y1, text):
-            # calculate angle in display coordinates
-            dx_display = x1 - x0
-            dy_display = y1 - y0
-            angle = np.degrees(np.arctan2(dy_display, dx_display))
+        # angle of the line at every position, in display coordinates (kept upright)
+        deltas = np.diff(display_xy, axis=0)
+        angles = np.degrees(np.arctan2(deltas[:, 1], deltas[:, 0]))
+        angles[angles > 90] -= 180
+        angles[angles < -90] += 180
 
-            # keep text upright
-            if angle > 90:
-                angle -= 180
-            elif angle < -90:
-                angle += 180
+        # label size is the same at every position, so measure it once
+        width, height = self._get_text_extent(text, **kwargs)
 
+        def plot_label(x0, y0, angle, text):
             axes_coords = self.ax.transAxes.inverted().transform([(x0, y0)])
             x_axes, y_axes = axes_coords[0]
 
@@ -682,6 +867,9 @@ class TextPlotterMixin:
             and attempts < collision_handler.attempts
             and len(positions) > 0
         ):
+            if self._is_label_budget_spent(num_labels - len(plotted_positions)):
+                return
+
             attempts += 1
 
             if smooth_positions:
@@ -698,14 +886,9 @@ class TextPlotterMixin:
 
             pos = max(0, min(pos, num_positions - 2))
             x0, y0 = display_xy[pos]
-            x1, y1 = display_xy[pos + 1]
-            label = plot_label(x0, y0, x1, y1, text)
-            bbox = self._get_label_bbox(label)
-
-            # TODO : find better bbox (that's rotated with text)
-
-            if bbox is None:
-                continue
+            angle = float(angles[pos])
+            corners = rotated_rectangle((x0, y0), width, height, angle)
+            bbox = tuple(int(p) for p in (*corners.min(axis=0), *corners.max(axis=0)))
 
             is_open = self._is_open_space(
                 bbox,
@@ -714,18 +897,17 @@ class TextPlotterMixin:
                 allow_constellation_collisions=collision_handler.allow_constellation_line_collisions,
                 allow_marker_collisions=collision_handler.allow_marker_collisions,
                 allow_label_collisions=collision_handler.allow_label_collisions,
+                polygon=corners,
             )
             is_final_attempt = attempts == collision_handler.attempts
 
             if is_open or (collision_handler.plot_on_fail and is_final_attempt):
-                self._add_label_to_rtree(label, bbox=bbox)
+                label = plot_label(x0, y0, angle, text)
+                self._add_label_to_rtree(label, bbox=bbox, polygon=corners)
                 plotted_positions.add(pos)
-                if self.debug_text and label:
+                if self.debug_text:
                     self._debug_bbox(bbox, color="red", width=1)
 
-            elif label is not None:
-                label.remove()
-
             if is_final_attempt or len(plotted_positions) == num_labels:
                 return
 
@@ -752,6 +934,30 @@ class TextPlotterMixin:
         if not text:
             return
 
+        self._record_label(
+            partial(self.text, text, ra, dec, style, collision_handler, **kwargs)
+        )
+
+        if self._is_label_budget_spent():
+            return
+
+        start_time = time.perf_counter()
+        try:
+            label = self._text_label(text, ra, dec, style, collision_handler, **kwargs)
+        finally:
+            self._label_seconds += time.perf_counter() - start_time
+
+        return label
+
+    def _text_label(
+        self,
+        text: str,
+        ra: float,
+        dec: float,
+        style: LabelStyle,
+        collision_handler: CollisionHandler = None,
+        **kwargs,
+    ):
         style = style.model_copy()  # need a copy because we possibly mutate it below
 
         collision_handler = collision_handler or self.point_label_handler
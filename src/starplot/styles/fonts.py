@@ -1,15 +1,91 @@
+import json
+from dataclasses import asdict, fields
 from pathlib import Path
 
+import matplotlib
 from matplotlib import font_manager
 
+from starplot.config import settings
+
 HERE = Path(__file__).resolve().parent
 FONTS_PATH = HERE / "fonts-library"
 
+FONT_LIST_FILENAME = "fonts.json"
+"""Filename of the persisted font list (in the data path)"""
+
+_loaded = False
+
+
+def load(rebuild: bool = False):
+    """
+    Loads all fonts in ./fonts-library
+
+    Fonts are only loaded once per process. If a font list was built (by `starplot setup`), then the font properties are read from that instead of scanning and parsing every font file.
+
+    Args:
+        rebuild: If True, then the fonts are parsed again (even if they were already loaded) and the font list is rebuilt
+    """
+    global _loaded
+
+    if _loaded and not rebuild:
+        return
+
+    manager = font_manager.fontManager
+    entries = None if rebuild else _read_font_list()
+
+    if entries is None:
+        manager.ttflist = [e for e in manager.ttflist if not _is_library_font(e)]
+        count = len(manager.ttflist)
+
+        for font_file in font_manager.findSystemFonts(fontpaths=[FONTS_PATH]):
+            manager.addfont(font_file)
+
+        if rebuild:
+            _write_font_list(manager.ttflist[count:])
+    else:
+        manager.ttflist.extend(entries)
+        manager._findfont_cached.cache_clear()
+
+    _loaded = True
+
+
+def _font_list_path() -> Path:
+    return settings.data_path / FONT_LIST_FILENAME
+
+
+def _font_list_key() -> dict:
+    from starplot import __version__
+
+    return {
+        "starplot": __version__,
+        "matplotlib": matplotlib.__version__,
+        "path": str(FONTS_PATH),
+    }
+
+
+def _is_library_font(entry) -> bool:
+    return FONTS_PATH in Path(entry.fname).parents
+
+
+def _read_font_list() -> list | None:
+    try:
+        font_list = json.loads(_font_list_path().read_text())
+    except (OSError, ValueError):
+        return None
+
+    if font_list.get("key") != _font_list_key():
+        return None
+
+    names = {f.name for f in fields(font_manager.FontEntry)}
+    return [
+        font_manager.FontEntry(**{k: v for k, v in entry.items() if k in names})
+        for entry in font_list["fonts"]
+    ]
 
-def load():
-    """Loads all fonts in ./fonts-library"""
-    font_dirs = [FONTS_PATH]
-    font_files = font_manager.findSystemFonts(fontpaths=font_dirs)
 
-    for font_file in font_files:
-        font_manager.fontManager.addfont(font_file)
+def _write_font_list(entries: list) -> None:
+    font_list = {
+        "key": _font_list_key(),
+        "fonts": [asdict(e) for e in entries],
+    }
+    _font_list_path().write_text(json.dumps(font_list))
@@ -0,0 +1,178 @@
+import re
+from collections import Counter
+from xml.etree import ElementTree as ET
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+NAMESPACES = {
+    "": SVG_NS,
+    "xlink": XLINK_NS,
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "cc": "http://creativecommons.org/ns#",
+}
+
+PATH_COMMANDS = {"M", "L", "Q", "C", "z"}
+"""Commands of paths written by matplotlib, which are all absolute"""
+
+CLIPPING_ATTRIBUTES = ("clip-path", "mask", "filter")
+
+NUMBER = re.compile(r"^-?\d+(\.\d*)?$")
+
+for prefix, uri in NAMESPACES.items():
+    ET.register_namespace(prefix, uri)
+
+
+def compact(svg: bytes) -> bytes:
+    """
+    Compacts an SVG written by matplotlib, by replacing duplicated content with references:
+
+    - Shapes that are repeated at different positions (e.g. markers of the same size) are defined once and reused with `<use>` elements
+    - Styles that are repeated are defined once as CSS classes
+
+    Glyphs of text (when text is rendered as paths) are already defined once and reused by matplotlib.
+
+    Args:
+        svg: SVG document to compact
+
+    Returns:
+        Compacted SVG document
+    """
+    root = ET.fromstring(svg)
+    defs = root.find(_tag("defs"))
+
+    if defs is None:
+        defs = ET.Element(_tag("defs"))
+        root.insert(0, defs)
+
+    _share_shapes(root, defs)
+    _share_styles(root, defs)
+
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def _tag(name: str) -> str:
+    return f"{{{SVG_NS}}}{name}"
+
+
+def _shapes(element: ET.Element):
+    """Yields all paths that are drawn (i.e. not definitions or clip paths)"""
+    for child in element:
+        if child.tag in (_tag("defs"), _tag("clipPath")):
+            continue
+
+        if child.tag == _tag("path") and child.get("d"):
+            yield child
+
+        yield from _shapes(child)
+
+
+def _format(value: float) -> str:
+    formatted = f"{round(value, 6):f}".rstrip("0").rstrip(".")
+    return "0" if formatted == "-0" else formatted
+
+
+def _normalize(d: str) -> tuple[str, float, float] | None:
+    """Returns the path data relative to its first point, and the first point"""
+    tokens = d.split()
+    numbers = [t for t in tokens if t not in PATH_COMMANDS]
+
+    if (
+        len(numbers) < 2
+        or len(numbers) % 2
+        or not all(NUMBER.match(n) for n in numbers)
+    ):
+        return None
+
+    x0, y0 = float(numbers[0]), float(numbers[1])
+    normalized = []
+    index = 0
+
+    for token in tokens:
+        if token in PATH_COMMANDS:
+            normalized.append(token)
+            continue
+
+        origin = x0 if index % 2 == 0 else y0
+        normalized.append(_format(float(token) - origin))
+        index += 1
+
+    return " ".join(normalized), x0, y0
+
+
+def _share_shapes(root: ET.Element, defs: ET.Element) -> None:
+    shapes = []
+
+    for path in _shapes(root):
+        # the position of a <use> would also move its gradients and patterns
+        if "url(" in path.get("style", ""):
+            continue
+
+        normalized = _normalize(path.get("d"))
+        if normalized is not None:
+            shapes.append((path, *normalized))
+
+    counts = Counter(d for _, d, _, _ in shapes)
+    ids = {}
+
+    for path, d, x, y in shapes:
+        if counts[d] < 2:
+            continue
+
+        if d not in ids:
+            ids[d] = f"shape-{len(ids)}"
+            ET.SubElement(defs, _tag("path"), {"id": ids[d], "d": d})
+
+        del path.attrib["d"]
+        use = path
+
+        # the position of a <use> would also move its clip path, so the <use> is wrapped in a group that's clipped
+        clipping = {
+            k: path.attrib.pop(k) for k in CLIPPING_ATTRIBUTES if k in path.attrib
+        }
+
+        if clipping:
+            # clip paths are in the coordinates of the element, including its transform
+            if "transform" in path.attrib:
+                clipping["transform"] = path.attrib.pop("transform")
+
+            attributes = dict(path.attrib)
+            path.attrib.clear()
+            path.attrib.update(clipping)
+            path.tag = _tag("g")
+            use = ET.SubElement(path, _tag("use"), attributes)
+        else:
+            use.tag = _tag("use")
+
+        use.set(f"{{{XLINK_NS}}}href", f"#{ids[d]}")
+        use.set("x", _format(x))
+        use.set("y", _format(y))
+
+
+def _share_styles(root: ET.Element, defs: ET.Element) -> None:
+    counts = Counter(e.get("style") for e in root.iter() if e.get("style"))
+    classes = {}
+
+    for element in root.iter():
+        style = element.get("style")
+
+        if not style or counts[style] < 2:
+            continue
+
+        if style not in classes:
+            classes[style] = f"style-{len(classes)}"
+
+        del element.attrib["style"]
+        element.set("class", f"{element.get('class', '')} {classes[style]}".strip())
+
+    if not classes:
+        return
+
+    stylesheet = defs.find(_tag("style"))
+
+    if stylesheet is None:
+        stylesheet = ET.SubElement(defs, _tag("style"), {"type": "text/css"})
+
+    rules = "".join(f".{name}{{{style}}}" for style, name in classes.items())
+    stylesheet.text = (stylesheet.text or "") + rules
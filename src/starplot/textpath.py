@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_mixed import MixedModeRenderer
+from matplotlib.textpath import TextToPath
+
+MAX_CACHED_TEXTS = 4096
+"""Maximum number of text paths to keep in the cache"""
+
+
+class CachedTextToPath(TextToPath):
+    """
+    Text-to-path converter that caches glyph outlines and the paths of whole strings.
+
+    Matplotlib converts text to paths when it's drawn with path effects (e.g. the text border on labels) or
+    exported to SVG with `svg.fonttype = "path"`, and it does that conversion from scratch for every label. Glyph
+    outlines are extracted at a fixed font scale and scaled at draw time, so they only depend on the font and glyph --
+    which means identical strings (Greek letters, cardinal directions, etc) and shared glyphs can be reused across all
+    labels of all plots.
+    """
+
+    def __init__(self, max_texts: int = MAX_CACHED_TEXTS):
+        super().__init__()
+        self.max_texts = max_texts
+        self._glyphs = {}
+        self._texts = OrderedDict()
+
+        # the caches are shared by plots rendering in other threads (and get_text_path calls get_glyphs_with_font)
+        self._lock = RLock()
+
+    def clear(self) -> None:
+        """Removes all cached glyphs and texts"""
+        with self._lock:
+            self._glyphs.clear()
+            self._texts.clear()
+
+    def get_glyphs_with_font(self, font, s, glyph_map=None, *args, **kwargs):
+        # backends that track their own glyphs (e.g. SVG defs) pass a glyph map,
+        # otherwise the shared glyph cache is used
+        if glyph_map is not None:
+            return super().get_glyphs_with_font(font, s, glyph_map, *args, **kwargs)
+
+        with self._lock:
+            return super().get_glyphs_with_font(font, s, self._glyphs, *args, **kwargs)
+
+    def get_text_path(self, prop, s, ismath=False, *, features=None, language=None):
+        # text shaping features and language were added in matplotlib 3.10, so they're only passed when set
+        shaping = {
+            name: value
+            for name, value in (("features", features), ("language", language))
+            if value is not None
+        }
+
+        if ismath == "TeX":
+            return super().get_text_path(prop, s, ismath=ismath, **shaping)
+
+        key = (
+            tuple(prop.get_family()),
+            prop.get_style(),
+            prop.get_variant(),
+            prop.get_weight(),
+            prop.get_stretch(),
+            prop.get_file(),
+            prop.get_math_fontfamily(),
+            s,
+            ismath,
+            tuple(features) if features is not None else None,
+            language,
+        )
+
+        with self._lock:
+            if key in self._texts:
+                self._texts.move_to_end(key)
+                return self._texts[key]
+
+            verts, codes = super().get_text_path(prop, s, ismath=ismath, **shaping)
+            result = (
+                np.asarray(verts, dtype=float).reshape(-1, 2),
+                np.asarray(codes),
+            )
+            self._texts[key] = result
+
+            if len(self._texts) > self.max_texts:
+                self._texts.popitem(last=False)
+
+        return result
+
+
+text_to_path = CachedTextToPath()
+"""Process-wide text-to-path cache, shared by all plots"""
+
+
+def install(renderer) -> None:
+    """Sets the renderer's text-to-path converter to the shared cache"""
+    # mixed-mode renderers (used by vector backends) delegate drawing to an underlying renderer,
+    # but other renderers (e.g. Agg) have a `_renderer` of their own that isn't a python renderer
+    if isinstance(renderer, MixedModeRenderer):
+        renderer = renderer._renderer
+
+    if hasattr(renderer, "_text2path"):
+        renderer._text2path = text_to_path
+
+
+class TextPathCacheArtist(Artist):
+    """
+    Invisible artist that installs the text path cache on the renderer when a figure is drawn.
+
+    It has the lowest z-order of the figure's artists, so it's drawn before anything else. Works for
+    all backends (raster and vector), because it hooks into the figure's draw instead of a specific canvas.
+    """
+
+    zorder = float("-inf")
+
+    def __init__(self):
+        super().__init__()
+        self.set_in_layout(False)
+
+    def draw(self, renderer):
+        install(renderer)
+        self.stale = False
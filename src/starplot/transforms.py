@@ -0,0 +1,391 @@
+from functools import lru_cache
+from math import exp
+
+import numpy as np
+from pyproj import Transformer
+from skyfield.api import wgs84, Star as SkyfieldStar
+from skyfield.constants import C_AUDAY
+from skyfield.earthlib import refract
+from skyfield.relativity import add_aberration
+
+from starplot.config import settings
+
+
+def radec_to_xyz(ra, dec) -> np.ndarray:
+    """
+    Converts RA/DEC to unit vectors
+
+    Args:
+        ra: Right ascension(s) in degrees
+        dec: Declination(s) in degrees
+
+    Returns:
+        Array of unit vectors with shape (3, N)
+    """
+    ra = np.radians(np.asarray(ra, dtype=float))
+    dec = np.radians(np.asarray(dec, dtype=float))
+    cos_dec = np.cos(dec)
+    return np.array([cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)])
+
+
+def xyz_to_lonlat(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts vectors to spherical longitude/latitude (e.g. RA/DEC or AZ/ALT)
+
+    Args:
+        xyz: Array of vectors with shape (3, N)
+
+    Returns:
+        Tuple of (longitude, latitude) arrays in degrees. Longitude is in the range 0...360
+    """
+    x, y, z = xyz
+    lon = np.degrees(np.arctan2(y, x)) % 360
+    lat = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    return lon, lat
+
+
+def geometric_altitude(ra, dec, lst: float, lat: float) -> np.ndarray:
+    """
+    Returns the geometric altitude (no refraction, aberration, etc) of RA/DEC coordinates for an observer.
+
+    This is a cheap approximation that's useful for quickly determining which objects are above the horizon.
+
+    Args:
+        ra: Right ascension(s) in degrees
+        dec: Declination(s) in degrees
+        lst: Local sidereal time of the observer, in degrees
+        lat: Latitude of the observer, in degrees
+
+    Returns:
+        Array of altitudes in degrees
+    """
+    hour_angle = np.radians(lst - np.asarray(ra, dtype=float))
+    dec = np.radians(np.asarray(dec, dtype=float))
+    lat = np.radians(lat)
+    sin_alt = np.sin(dec) * np.sin(lat) + np.cos(dec) * np.cos(lat) * np.cos(hour_angle)
+    return np.degrees(np.arcsin(np.clip(sin_alt, -1, 1)))
+
+
+ICRS_TO_GALACTIC = np.array(
+    [
+        [-0.0548755604162154, -0.8734370902348850, -0.4838350155487132],
+        [0.4941094278755837, -0.4448296299600112, 0.7469822444972189],
+        [-0.8676661490190047, -0.1980763734312015, 0.4559837761750669],
+    ]
+)
+"""Rotation matrix from ICRS (equatorial) to galactic coordinates"""
+
+
+def radec_to_galactic(ra, dec) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts RA/DEC to galactic coordinates
+
+    Args:
+        ra: Right ascension(s) in degrees
+        dec: Declination(s) in degrees
+
+    Returns:
+        Tuple of (longitude, latitude) arrays in degrees
+    """
+    xyz = radec_to_xyz(np.atleast_1d(ra), np.atleast_1d(dec))
+    return xyz_to_lonlat(ICRS_TO_GALACTIC @ xyz)
+
+
+def galactic_to_radec(lon, lat) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts galactic coordinates to RA/DEC
+
+    Args:
+        lon: Galactic longitude(s) in degrees
+        lat: Galactic latitude(s) in degrees
+
+    Returns:
+        Tuple of (RA, DEC) arrays in degrees
+    """
+    xyz = radec_to_xyz(np.atleast_1d(lon), np.atleast_1d(lat))
+    return xyz_to_lonlat(ICRS_TO_GALACTIC.T @ xyz)
+
+
+def _pressure(observer) -> float:
+    """Returns the observer's pressure (in millibars), estimated from their elevation if it's not set"""
+    if observer.pressure is not None:
+        return observer.pressure
+
+    return 1010.0 * exp(-observer.elevation / 9.1e3)
+
+
+class AltAzTransform:
+    """
+    Vectorized conversion of RA/DEC to apparent AZ/ALT for an observer.
+
+    The rotation to the observer's horizon system (precession, nutation, Earth rotation, and polar motion),
+    the observer's velocity (for aberration of light), and the refraction curve are all computed
+    once -- after that, converting any number of coordinates is just a few NumPy operations.
+
+    Compared to Skyfield's apparent positions, the only effects that are skipped are gravitational deflection
+    and stellar parallax, which are both well below an arcsecond (except within a few degrees of the Sun).
+
+    Args:
+        rotation: Rotation matrix (3x3) from GCRS to the observer's horizon system (x = north, y = east, z = zenith)
+        velocity: Barycentric velocity of the observer, in AU per day. If `None`, then aberration will not be applied.
+        temperature: Temperature in degrees Celsius, for refraction. If `None`, then refraction will not be applied.
+        pressure: Atmospheric pressure in millibars, for refraction
+    """
+
+    REFRACTION_STEP = 0.01
+    """Altitude step (in degrees) of the precomputed refraction curve"""
+
+    def __init__(
+        self,
+        rotation: np.ndarray,
+        velocity: np.ndarray = None,
+        temperature: float = None,
+        pressure: float = None,
+    ):
+        self.rotation = np.asarray(rotation, dtype=float)
+        self.velocity = (
+            np.asarray(velocity, dtype=float).reshape(3, 1)
+            if velocity is not None
+            else None
+        )
+        self._refraction_alt = None
+        self._refraction_apparent_alt = None
+
+        if temperature is not None:
+            # refraction is zero more than 1 degree below the horizon
+            self._refraction_alt = np.arange(
+                -1, 90 + self.REFRACTION_STEP, self.REFRACTION_STEP
+            )
+            self._refraction_apparent_alt = refract(
+                self._refraction_alt, temperature, pressure
+            )
+
+    @classmethod
+    def from_observer(cls, observer, ephemeris: str = "de421.bsp"):
+        """
+        Creates a transform for an [Observer][starplot.Observer], with refraction based on the observer's temperature and pressure.
+
+        Args:
+            observer: Observer instance, which must have a location
+            ephemeris: Ephemeris to use for the observer's velocity
+        """
+        t = observer.timescale
+        rotation = wgs84.latlon(
+            observer.lat, observer.lon, observer.elevation
+        ).rotation_at(t)
+        velocity = observer.position(ephemeris).at(t).velocity.au_per_d
+        return cls(
+            rotation=rotation,
+            velocity=velocity,
+            temperature=observer.temperature,
+            pressure=_pressure(observer),
+        )
+
+    @classmethod
+    def from_observers(
+        cls, observers: list, ephemeris: str = "de421.bsp"
+    ) -> list["AltAzTransform"]:
+        """
+        Creates transforms for many [Observer][starplot.Observer]s at the same place but different times (e.g. the frames of an animation).
+
+        This is much faster than creating each transform with `from_observer`, because the rotations and velocities are computed for all times at once (with a Skyfield time array), and the refraction curve is only computed once.
+
+        Args:
+            observers: Observer instances, which must all have the same location, temperature, and pressure
+            ephemeris: Ephemeris to use for the observers' velocities
+        """
+        if not observers:
+            return []
+
+        first = observers[0]
+        fields = {"lat", "lon", "elevation", "temperature", "pressure"}
+        place = first.model_dump(include=fields)
+
+        if any(o.model_dump(include=fields) != place for o in observers[1:]):
+            raise ValueError(
+                "Observers must all have the same location, temperature, and pressure"
+            )
+
+        t = first.timescale.ts.from_datetimes([o.dt for o in observers])
+        rotations = wgs84.latlon(first.lat, first.lon, first.elevation).rotation_at(t)
+        velocities = first.position(ephemeris).at(t).velocity.au_per_d
+
+        transforms = [
+            cls(
+                rotation=rotations[:, :, 0],
+                velocity=velocities[:, 0],
+                temperature=first.temperature,
+                pressure=_pressure(first),
+            )
+        ]
+
+        for i in range(1, len(observers)):
+            transform = cls(rotation=rotations[:, :, i], velocity=velocities[:, i])
+            transform._refraction_alt = transforms[0]._refraction_alt
+            transform._refraction_apparent_alt = transforms[0]._refraction_apparent_alt
+            transforms.append(transform)
+
+        return transforms
+
+    def refract(self, alt) -> np.ndarray:
+        """Returns the apparent (refracted) altitude of true altitudes, in degrees"""
+        alt = np.asarray(alt, dtype=float)
+
+        if self._refraction_alt is None:
+            return alt
+
+        return np.where(
+            alt >= self._refraction_alt[0],
+            np.interp(alt, self._refraction_alt, self._refraction_apparent_alt),
+            alt,
+        )
+
+    def transform(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Converts RA/DEC to apparent AZ/ALT
+
+        Args:
+            ra: Right ascension(s) in degrees
+            dec: Declination(s) in degrees
+
+        Returns:
+            Tuple of (azimuth, altitude) arrays in degrees
+        """
+        xyz = radec_to_xyz(np.atleast_1d(ra), np.atleast_1d(dec))
+
+        if self.velocity is not None:
+            add_aberration(xyz, self.velocity, 1 / C_AUDAY)
+
+        az, alt = xyz_to_lonlat(self.rotation @ xyz)
+
+        return az, self.refract(alt)
+
+
+class SkyfieldAltAzTransform:
+    """
+    Reference conversion of RA/DEC to apparent AZ/ALT, which uses Skyfield's full apparent positions for every coordinate.
+
+    Args:
+        observer: Observer instance, which must have a location
+        ephemeris: Ephemeris to use
+    """
+
+    def __init__(self, observer, ephemeris: str = "de421.bsp"):
+        self.observer = observer
+        self.ephemeris = ephemeris
+
+    def transform(self, ra, dec) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Converts RA/DEC to apparent AZ/ALT
+
+        Args:
+            ra: Right ascension(s) in degrees
+            dec: Declination(s) in degrees
+
+        Returns:
+            Tuple of (azimuth, altitude) arrays in degrees
+        """
+        star = SkyfieldStar(
+            ra_hours=np.atleast_1d(np.asarray(ra, dtype=float)) / 15,
+            dec_degrees=np.atleast_1d(np.asarray(dec, dtype=float)),
+        )
+        az, alt = self.observer._apparent(obj=star, ephemeris=self.ephemeris)
+        return np.atleast_1d(az), np.atleast_1d(alt)
+
+
+def altaz_transform(observer, ephemeris: str = "de421.bsp"):
+    """
+    Returns the AZ/ALT transform for an observer: the vectorized [AltAzTransform][starplot.transforms.AltAzTransform],
+    or the Skyfield reference transform if the `altaz_reference` setting is enabled.
+    """
+    if settings.altaz_reference:
+        return SkyfieldAltAzTransform(observer, ephemeris)
+
+    return observer._altaz_transform(ephemeris)
+
+
+@lru_cache(maxsize=32)
+def _transformer(source_crs, target_crs) -> Transformer:
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+class Projector:
+    """
+    Projects a plot's coordinates (e.g. RA/DEC or AZ/ALT) to data, display, and axes coordinates.
+
+    Cartopy's `transform_point` does a lot of work on every call (validating arrays, comparing CRS instances, catching
+    warnings, etc), which adds up when it's called once per object. The projector uses the pyproj transformer
+    directly, and the axes' affine transform (which is always current, so it reflects any changes to the extent).
+
+    Methods that start with `point_` are scalar conveniences, all other methods are vectorized.
+
+    Args:
+        source_crs: CRS of the plot's coordinates
+        target_crs: CRS of the plot's projection
+        ax: Axes of the plot
+    """
+
+    def __init__(self, source_crs, target_crs, ax):
+        self.transformer = _transformer(source_crs, target_crs)
+        self.inverse = _transformer(target_crs, source_crs)
+        self.ax = ax
+
+    def to_data(self, x, y) -> np.ndarray:
+        """Returns projected (data) coordinates as an array with shape (N, 2). Coordinates outside the projection's domain are NaN."""
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+
+        if x.size == 0:
+            return np.empty((0, 2))
+
+        data = np.column_stack(self.transformer.transform(x, y, errcheck=False))
+        data[~np.isfinite(data)] = np.nan
+        return data
+
+    def to_display(self, x, y) -> np.ndarray:
+        """Returns display coordinates (pixels) as an array with shape (N, 2)"""
+        return self.ax.transData.transform(self.to_data(x, y))
+
+    def to_axes(self, x, y) -> np.ndarray:
+        """Returns axes coordinates (0...1 inside the axes) as an array with shape (N, 2)"""
+        return (self.ax.transData - self.ax.transAxes).transform(self.to_data(x, y))
+
+    def from_axes(self, x, y) -> np.ndarray:
+        """Returns the plot's coordinates of axes coordinates, as an array with shape (N, 2)"""
+        data = (self.ax.transAxes - self.ax.transData).transform(
+            np.column_stack([np.atleast_1d(x), np.atleast_1d(y)])
+        )
+        return np.column_stack(
+            self.inverse.transform(data[:, 0], data[:, 1], errcheck=False)
+        )
+
+    def point_to_data(self, x: float, y: float) -> tuple[float, float]:
+        """Returns projected (data) coordinates of a single point"""
+        data_x, data_y = self.transformer.transform(float(x), float(y), errcheck=False)
+        if not (np.isfinite(data_x) and np.isfinite(data_y)):
+            return np.nan, np.nan
+        return data_x, data_y
+
+    def point_to_display(self, x: float, y: float) -> tuple[float, float]:
+        """Returns display coordinates (pixels) of a single point"""
+        return self._affine(self.ax.transData, *self.point_to_data(x, y))
+
+    def point_to_axes(self, x: float, y: float) -> tuple[float, float]:
+        """Returns axes coordinates (0...1 inside the axes) of a single point"""
+        return self._affine(
+            self.ax.transData - self.ax.transAxes, *self.point_to_data(x, y)
+        )
+
+    def point_from_axes(self, x: float, y: float) -> tuple[float, float]:
+        """Returns the plot's coordinates of a single point in axes coordinates"""
+        data_x, data_y = self._affine(self.ax.transAxes - self.ax.transData, x, y)
+        return self.inverse.transform(data_x, data_y, errcheck=False)
+
+    @staticmethod
+    def _affine(transform, x: float, y: float) -> tuple[float, float]:
+        if not transform.is_affine:
+            x, y = transform.transform((x, y))
+            return float(x), float(y)
+
+        (a, b, c), (d, e, f), _ = transform.get_matrix()
+        return float(a * x + b * y + c), float(d * x + e * y + f)
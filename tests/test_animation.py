@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from starplot import HorizonPlot, Observer
+from starplot.animation import FrameSequence
+from starplot.transforms import AltAzTransform
+
+START = datetime(2024, 3, 2, 4, 0, tzinfo=timezone.utc)
+
+OBSERVER = Observer(
+    dt=datetime(2015, 3, 2, 4, 0, tzinfo=timezone.utc), lat=33.36, lon=-116.83
+)
+
+STARS = [
+    (101.29, -16.72, "Sirius"),
+    (88.79, 7.41, "Betelgeuse"),
+    (78.63, -8.2, "Rigel"),
+]
+
+
+def create_plot(observer):
+    p = HorizonPlot(
+        altitude=(0, 60),
+        azimuth=(120, 240),
+        observer=observer,
+        resolution=800,
+    )
+    p.horizon()
+    p.gridlines()
+    for ra, dec, label in STARS:
+        p.marker(ra, dec, label=label, style={"marker": {"symbol": "circle"}})
+    return p
+
+
+def frames(count: int = 4) -> FrameSequence:
+    return FrameSequence(
+        create_plot,
+        observer=OBSERVER,
+        start=OBSERVER.dt,
+        end=OBSERVER.dt + timedelta(minutes=20 * (count - 1)),
+        step=timedelta(minutes=20),
+    )
+
+
+def test_frame_sequence_times():
+    frames = FrameSequence(
+        None,
+        observer=Observer(lat=33.36, lon=-116.83),
+        start=START,
+        end=START + timedelta(hours=1),
+        step=timedelta(minutes=20),
+    )
+    assert len(frames) == 4
+    assert frames.times[-1] == START + timedelta(hours=1)
+
+    observers = frames._observers()
+    assert [o.dt for o in observers] == frames.times
+    assert all(o.lat == 33.36 and o.lon == -116.83 for o in observers)
+
+
+def test_frame_sequence_chunk():
+    frames = FrameSequence(
+        None,
+        observer=Observer(),
+        start=START,
+        end=START + timedelta(minutes=50),
+        step=timedelta(minutes=10),
+    )
+    chunk = frames._chunk([2, 3])
+    assert chunk.times == frames.times[2:4]
+    assert len(frames) == 6
+
+
+def test_frame_sequence_invalid_step():
+    with pytest.raises(ValueError):
+        FrameSequence(
+            None, observer=Observer(), start=START, end=START, step=timedelta(0)
+        )
+
+
+def test_frame_sequence_arrays_match_full_render():
+    sequence = frames()
+    arrays = [a.copy() for a in sequence.arrays()]
+    assert len(arrays) == 4
+
+    # frames are blitted on top of the background, but match a full render of a new plot
+    last = create_plot(sequence._observers()[-1])
+    assert np.array_equal(arrays[-1], last.export_array())
+    assert not np.array_equal(arrays[0], arrays[-1])
+
+
+def test_frame_sequence_reuses_batched_transforms(monkeypatch):
+    calls = []
+    from_observer = AltAzTransform.from_observer.__func__
+
+    def counting_from_observer(cls, observer, *args, **kwargs):
+        calls.append(observer)
+        return from_observer(cls, observer, *args, **kwargs)
+
+    monkeypatch.setattr(
+        AltAzTransform, "from_observer", classmethod(counting_from_observer)
+    )
+
+    sequence = frames()
+    plots = iter(sequence)
+    next(plots)
+    assert len(calls) == 1
+
+    # transforms of frames 2..N were computed in one batch, and are reused by the plot
+    for plot in plots:
+        assert plot.observer._altaz_transform(plot.ephemeris_name) is not None
+
+    assert len(calls) == 1
+
+
+def test_frame_sequence_to_files_processes(tmp_path):
+    sequential = frames().to_files(str(tmp_path / "a-{index}.png"))
+    parallel = frames().to_files(str(tmp_path / "b-{index}.png"), processes=2)
+
+    assert len(parallel) == 4
+    for a, b in zip(sequential, parallel):
+        assert np.array_equal(np.asarray(Image.open(a)), np.asarray(Image.open(b)))
@@ -0,0 +1,106 @@
+import re
+import sys
+
+import pytest
+
+from starplot import MapPlot, Miller
+from starplot.atlas import Atlas, Page, tile_sphere
+
+
+def create_page(page):
+    p = MapPlot(
+        projection=Miller(center_ra=page.center_ra),
+        ra_min=page.ra_min,
+        ra_max=page.ra_max,
+        dec_min=page.dec_min,
+        dec_max=page.dec_max,
+        resolution=600,
+    )
+    p.gridlines()
+    return p
+
+
+def _check_pdf(data: bytes, pages: int):
+    xref = int(re.search(rb"startxref\n(\d+)", data).group(1))
+    offsets = re.findall(rb"(\d{10}) 00000 n", data[xref:])
+
+    # every object in the cross-reference table is where it says
+    for number, offset in enumerate(offsets, start=1):
+        assert data[int(offset) :].startswith(b"%d 0 obj" % number)
+
+    assert len(re.findall(rb"/Type /Page\b", data)) == pages
+    assert b"/Count %d" % pages in data
+
+
+def test_tile_sphere():
+    pages = tile_sphere(dec_step=30)
+
+    # poles
+    assert pages[0] == Page(0, 360, -90, -60)
+    assert pages[-1] == Page(0, 360, 60, 90)
+
+    # bands closer to the poles have fewer pages
+    band = lambda dec_min: [p for p in pages if p.dec_min == dec_min]  # noqa: E731
+    assert len(band(-30)) == len(band(0)) == 12
+    assert len(band(-60)) < len(band(-30))
+
+    # pages of each band cover all right ascensions
+    for dec_min in (-60, -30, 0, 30):
+        ranges = sorted((p.ra_min, p.ra_max) for p in band(dec_min))
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 360
+        assert all(a[1] == pytest.approx(b[0]) for a, b in zip(ranges, ranges[1:]))
+
+
+def test_tile_sphere_overlap():
+    pages = tile_sphere(dec_step=30, overlap=2)
+
+    assert pages[0].dec_max == -58
+    assert pages[1].dec_min == -62
+
+    # pages that cross 0h are centered on it
+    assert pages[1].ra_min == 358
+    assert pages[1].ra_max > 360
+    assert pages[1].center_ra == pytest.approx((358 + pages[1].ra_max) / 2 - 360)
+
+
+def test_atlas_pages_from_tuples():
+    atlas = Atlas(create_page, [(0, 30, -10, 10), Page(30, 60, -10, 10)])
+    assert atlas.pages == [Page(0, 30, -10, 10), Page(30, 60, -10, 10)]
+    assert len(atlas) == 2
+    assert atlas._chunk([1]).pages == [Page(30, 60, -10, 10)]
+
+
+def test_atlas_to_pdf(tmp_path):
+    pages = [(0, 30, -10, 10), (30, 60, -10, 10), (350, 380, -10, 10)]
+    filename = tmp_path / "atlas.pdf"
+
+    Atlas(create_page, pages).to_pdf(filename)
+
+    _check_pdf(filename.read_bytes(), pages=3)
+
+
+def test_atlas_to_pdf_processes(tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    pages = [(0, 30, -10, 10), (30, 60, -10, 10), (350, 380, -10, 10)]
+    sequential, parallel = tmp_path / "sequential.pdf", tmp_path / "parallel.pdf"
+
+    Atlas(create_page, pages).to_pdf(sequential)
+    Atlas(create_page, pages).to_pdf(parallel, processes=2)
+
+    expected = pypdf.PdfReader(sequential).pages
+    merged = pypdf.PdfReader(parallel, strict=True).pages
+
+    assert len(merged) == 3
+    for page, expected_page in zip(merged, expected):
+        assert [float(v) for v in page.mediabox] == pytest.approx(
+            [float(v) for v in expected_page.mediabox]
+        )
+
+
+def test_atlas_to_pdf_processes_requires_pypdf(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+    atlas = Atlas(None, [(0, 30, -10, 10), (30, 60, -10, 10)])
+
+    with pytest.raises(ImportError, match="pip install starplot\\[atlas\\]"):
+        atlas.to_pdf(tmp_path / "atlas.pdf", processes=2)
@@ -0,0 +1,123 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+import weakref
+
+import numpy as np
+
+from starplot.cache import PositionCache, memoize
+
+
+def test_position_cache_get_put():
+    cache = PositionCache(max_megabytes=1)
+    key = ("MapPlot", "stars.parquet", 0)
+
+    cache.put(key, [5, 1, 3], [[5, 5], [1, 1], [3, 3]])
+    found, values = cache.get(key, np.array([3, 4, 5, 0]), 2)
+
+    assert found.tolist() == [True, False, True, False]
+    assert values[0].tolist() == [3, 3]
+    assert values[2].tolist() == [5, 5]
+    assert np.isnan(values[1]).all()
+
+    # new positions are merged with existing ones
+    cache.put(key, [4], [[4, 4]])
+    found, values = cache.get(key, np.array([1, 4]), 2)
+    assert found.all()
+    assert values.tolist() == [[1, 1], [4, 4]]
+
+    found, _ = cache.get(("MapPlot", "stars.parquet", 1), np.array([1]), 2)
+    assert not found.any()
+
+
+def test_position_cache_eviction():
+    cache = PositionCache(max_megabytes=1)
+    pks = np.arange(20_000)
+    values = np.zeros((20_000, 4))  # ~800KB per entry, with pks
+
+    cache.put("a", pks, values)
+    cache.put("b", pks, values)
+
+    assert len(cache) == 1
+    assert cache.get("a", pks[:1], 4)[0].tolist() == [False]
+    assert cache.get("b", pks[:1], 4)[0].tolist() == [True]
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_position_cache_disabled():
+    cache = PositionCache(max_megabytes=0)
+    cache.put("a", [1], [[1, 1]])
+    assert len(cache) == 0
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    @memoize(maxsize=2)
+    def double(self, x):
+        self.calls += 1
+        return x * 2
+
+
+def test_position_cache_threads():
+    # small enough that keys are evicted while other threads are reading them
+    cache = PositionCache(max_megabytes=0.05)
+    pks = np.arange(500)
+    values = np.ones((500, 2))
+
+    def use(i):
+        key = ("stars", i % 7)
+        cache.put(key, pks[i % 3 :: 3], values[i % 3 :: 3])
+        found, _ = cache.get(key, pks, 2)
+        return found.sum()
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(use, range(2_000)))
+
+    assert cache.nbytes == sum(p.nbytes + v.nbytes for p, v in cache._entries.values())
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_memoize_per_instance():
+    a, b = Counter(), Counter()
+
+    assert a.double(1) == 2
+    assert a.double(1) == 2
+    assert b.double(1) == 2
+    assert a.calls == 1
+    assert b.calls == 1
+
+    Counter.double.cache_clear(a)
+    a.double(1)
+    assert a.calls == 2
+
+
+def test_memoize_bounded():
+    c = Counter()
+    c.double(1)
+    c.double(2)
+    c.double(3)  # evicts 1
+    c.double(3)
+    assert c.calls == 3
+
+    c.double(1)
+    assert c.calls == 4
+
+
+def test_memoize_cache_set():
+    c = Counter()
+    Counter.double.cache_set(c, 42, 1)
+
+    assert c.double(1) == 42
+    assert c.calls == 0
+
+
+def test_memoize_releases_instance():
+    c = Counter()
+    c.double(1)
+    ref = weakref.ref(c)
+
+    del c
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from starplot.coordinates import AstrometryMode, propagate_proper_motion
+
+
+def test_propagate_proper_motion_barnards_star():
+    # Barnard's Star, at epoch J2000
+    ra, dec = propagate_proper_motion(
+        ra=[269.452083],
+        dec=[4.693364],
+        ra_mas_per_year=[-798.58],
+        dec_mas_per_year=[10328.12],
+        epoch_year=[2000],
+        target_epoch_year=1991.25,
+    )
+    assert round(ra[0], 3) == 269.454
+    assert round(dec[0], 3) == 4.668
+
+
+def test_propagate_proper_motion_missing_values():
+    ra, dec = propagate_proper_motion(
+        ra=[359.9999, 10],
+        dec=[0, 20],
+        ra_mas_per_year=[3600, np.nan],
+        dec_mas_per_year=[0, np.nan],
+        epoch_year=[2000, np.nan],
+        target_epoch_year=2100,
+    )
+    # wraps at 360
+    assert ra[0] == pytest.approx(0.0999)
+    assert dec[0] == 0
+    # missing proper motion leaves position unchanged
+    assert ra[1] == 10
+    assert dec[1] == 20
+
+
+def test_astrometry_mode_from_str():
+    assert AstrometryMode("catalog") == AstrometryMode.CATALOG
@@ -12,3 +12,16 @@ def test_data_path():
 
     assert os.environ.get("STARPLOT_DATA_PATH") == "/testing"
     assert str(config.settings.data_path) == "/testing"
+
+
+def test_load_ephemeris_once():
+    loader = mock.Mock(side_effect=lambda name: object())
+
+    with mock.patch.object(data, "load", loader), mock.patch.object(
+        data, "_ephemerides", {}
+    ):
+        de421 = data.load_ephemeris("de421.bsp")
+
+        assert data.load_ephemeris("de421.bsp") is de421
+        assert data.load_ephemeris("de440s.bsp") is not de421
+        assert loader.call_count == 2
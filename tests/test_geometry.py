@@ -68,3 +68,64 @@ def test_circle_at_meridian():
         (358.0, -8.0),
     ]
     assert len(points) == 6
+
+
+def test_line_segment_index_diagonal():
+    index = geometry.LineSegmentIndex()
+    index.insert((0, 0), (100, 100))
+
+    # box sits on the diagonal, between both endpoints
+    assert index.intersects((45, 45, 55, 55))
+
+    # box is inside the segment's bounding box, but away from the line
+    assert not index.intersects((70, 10, 90, 30))
+
+
+def test_line_segment_index_padding():
+    index = geometry.LineSegmentIndex()
+    index.insert((0, 0), (100, 0), padding=3)
+
+    assert index.intersects((40, 2, 60, 10))
+    assert not index.intersects((40, 4, 60, 10))
+
+
+def test_line_segment_index_many():
+    index = geometry.LineSegmentIndex()
+    index.insert_many(
+        [
+            (0, 0, 10, 0),
+            (20, 20, 20, 40),
+            (float("nan"), 0, 5, 5),  # non-finite segments are ignored
+        ]
+    )
+
+    assert len(index) == 2
+    assert list(index.intersection((15, 25, 25, 30))) == [1]
+    assert list(index.intersection((-5, -5, 50, 50))) == [0, 1]
+    assert not index.intersects((30, 0, 40, 10))
+
+
+def test_line_segment_index_rotated_box():
+    index = geometry.LineSegmentIndex()
+    index.insert((0, 50), (100, 50))
+
+    # box rotated 45 degrees crosses the line, but its bounding box does too
+    corners = geometry.rotated_rectangle((50, 50), 40, 4, 45)
+    assert index.intersects((0, 0, 100, 100), corners)
+
+    # long thin box parallel to the line, just above it: bounding box of a
+    # rotated version overlaps the line, but the rotated box does not
+    corners = geometry.rotated_rectangle((50, 60), 40, 4, 20)
+    xmin, ymin = corners.min(axis=0)
+    xmax, ymax = corners.max(axis=0)
+    assert index.intersects((xmin, ymin - 5, xmax, ymax))
+    assert not index.intersects((xmin, ymin, xmax, ymax), corners)
+
+
+def test_convex_polygons_intersect():
+    a = geometry.box_corners((0, 0, 10, 10))
+    b = geometry.rotated_rectangle((15, 15), 10, 2, 45)
+    c = geometry.rotated_rectangle((12, 12), 20, 2, 45)
+
+    assert not geometry.convex_polygons_intersect(a, b)
+    assert geometry.convex_polygons_intersect(a, c)
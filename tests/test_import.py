@@ -0,0 +1,186 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "astropy_healpix",
+    "cartopy",
+    "duckdb",
+    "ibis",
+    "matplotlib",
+    "pandas",
+    "pyarrow",
+    "shapely",
+    "skyfield",
+]
+
+
+# names that were available at the top level when the package imported everything eagerly
+TOP_LEVEL_NAMES = [
+    "ABC",
+    "AlignmentEnum",
+    "AnchorPointEnum",
+    "Annotated",
+    "ArrowStyle",
+    "AutoProjection",
+    "Azimuth",
+    "BaseModel",
+    "BaseStyle",
+    "Binoculars",
+    "Camera",
+    "CapStyleEnum",
+    "Catalog",
+    "CenterDEC",
+    "CenterRA",
+    "CenterRADEC",
+    "CollisionHandler",
+    "Color",
+    "ColorStr",
+    "Comet",
+    "Constellation",
+    "ConstellationBorder",
+    "DSO",
+    "DsoType",
+    "Enum",
+    "Equidistant",
+    "Field",
+    "FillStyleEnum",
+    "FontStyleEnum",
+    "FontWeightEnum",
+    "GalaxyPlot",
+    "GradientDirection",
+    "HERE",
+    "HorizonPlot",
+    "JoinStyleEnum",
+    "LabelStyle",
+    "LambertAzEqArea",
+    "LegendLocationEnum",
+    "LegendStyle",
+    "LineStyle",
+    "LineStyleEnum",
+    "MapPlot",
+    "MarkerStyle",
+    "MarkerSymbolEnum",
+    "Mercator",
+    "MilkyWay",
+    "Miller",
+    "Mollweide",
+    "Moon",
+    "ObjectList",
+    "ObjectStyle",
+    "ObliqueMercator",
+    "Observer",
+    "OpticPlot",
+    "Optional",
+    "Orthographic",
+    "PI",
+    "Path",
+    "PathStyle",
+    "PlainSerializer",
+    "Planet",
+    "PlateCarree",
+    "PlotStyle",
+    "PolygonStyle",
+    "ProjectionBase",
+    "Reflector",
+    "Refractor",
+    "Robinson",
+    "SQR_2",
+    "Satellite",
+    "Scope",
+    "Star",
+    "StereoNorth",
+    "StereoSouth",
+    "Stereographic",
+    "Sun",
+    "Union",
+    "ZOrderEnum",
+    "ZenithPlot",
+    "_",
+    "base",
+    "cached_property",
+    "callables",
+    "ccrs",
+    "circle_cross",
+    "circle_crosshair",
+    "circle_dot",
+    "circle_dotted_rings",
+    "circle_line",
+    "config",
+    "contextlib",
+    "coordinates",
+    "data",
+    "ellipse",
+    "extensions",
+    "fonts",
+    "geometry",
+    "helpers",
+    "inspect",
+    "json",
+    "markers",
+    "merge_dict",
+    "mixins",
+    "models",
+    "override_settings",
+    "patheffects",
+    "plots",
+    "plotters",
+    "profile",
+    "projections",
+    "settings",
+    "style_extensions",
+    "styles",
+    "use_style",
+    "utils",
+    "warnings",
+    "wraps",
+    "yaml",
+]
+
+
+def run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    imported = run(
+        "import sys, starplot; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert imported == ""
+
+
+@pytest.mark.parametrize(
+    "name", ["callables", "styles", "geometry", "data", "models", "plots"]
+)
+def test_submodules(name):
+    # submodules are available after importing the package, without importing them explicitly
+    assert (
+        run(f"import starplot; print(starplot.{name}.__name__)") == f"starplot.{name}"
+    )
+
+
+@pytest.mark.parametrize("name", ["MapPlot", "Observer", "PlotStyle", "Miller", "_"])
+def test_lazy_names(name):
+    import starplot
+
+    assert getattr(starplot, name) is not None
+    assert name in dir(starplot)
+
+
+def test_unknown_name():
+    import starplot
+
+    with pytest.raises(AttributeError):
+        starplot.NotAName
+
+
+@pytest.mark.parametrize("name", TOP_LEVEL_NAMES)
+def test_top_level_names(name):
+    import starplot
+
+    assert hasattr(starplot, name)
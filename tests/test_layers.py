@@ -0,0 +1,38 @@
+import numpy as np
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.patches import Polygon
+
+from starplot.layers import Layer
+
+
+def test_layer_needs_replay():
+    assert not Layer(lst=0).needs_replay(lst=90, requery_degrees=1)
+
+    layer = Layer(replay=lambda: None, lst=359.5)
+    assert not layer.needs_replay(lst=359.9, requery_degrees=1)
+    assert not layer.needs_replay(lst=0.4, requery_degrees=1)
+    assert layer.needs_replay(lst=1, requery_degrees=1)
+    assert layer.needs_replay(lst=358, requery_degrees=1)
+
+
+def test_layer_dynamic_always_replays():
+    layer = Layer(replay=lambda: None, lst=0, dynamic=True)
+    assert layer.needs_replay(lst=0, requery_degrees=1)
+
+
+def test_layer_rasterizable():
+    stars = PathCollection([], offsets=np.zeros((500, 2)))
+    polygon = Polygon([(0, 0), (1, 0), (1, 1)])
+    lines = LineCollection([[(0, 0), (1, 1)]] * 500)
+    layer = Layer(artists=[stars, polygon, lines])
+
+    # lines are never rasterized
+    assert layer.rasterizable(threshold=100) == [stars, polygon]
+    assert layer.rasterizable(threshold=1000) == []
+    assert layer.rasterizable() == []
+
+    layer.rasterize = True
+    assert layer.rasterizable() == [stars, polygon]
+
+    layer.rasterize = False
+    assert layer.rasterizable(threshold=100) == []
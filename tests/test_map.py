@@ -1,8 +1,24 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+import logging
 
+import numpy as np
 import pytest
+from PIL import Image
 
-from starplot import Star, MapPlot, Mercator, Miller, Observer, _
+from starplot import (
+    Star,
+    MapPlot,
+    ZenithPlot,
+    Mercator,
+    Miller,
+    Observer,
+    LabelBudget,
+    PngStrategy,
+    override_settings,
+    styles,
+    _,
+)
 
 
 def test_map_radec_invalid():
@@ -67,6 +83,84 @@ def test_map_objects_list_planets():
     assert len(p.objects.planets) == 8
 
 
+def test_map_planet_labels_not_duplicated():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=360,
+        dec_min=-40,
+        dec_max=40,
+        observer=Observer(dt=datetime(2023, 8, 27, 23, 0, 0, 0, tzinfo=timezone.utc)),
+    )
+    p.planets()
+    num_labels = len(p.labels)
+    p.planets()
+
+    assert num_labels > 0
+    assert len(p.labels) == num_labels
+
+
+def test_map_in_bounds_many():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=30,
+        ra_max=90,
+        dec_min=-10,
+        dec_max=40,
+    )
+    ra = [60, 10, 89, 200, 45]
+    dec = [10, 10, 39, 0, -80]
+    in_bounds = p.in_bounds_many(ra, dec)
+
+    assert in_bounds.tolist() == [p.in_bounds(r, d) for r, d in zip(ra, dec)]
+    assert in_bounds.tolist() == [True, False, True, False, False]
+    assert p.in_bounds_many([], []).tolist() == []
+
+
+def test_zenith_update_time():
+    dt = datetime(2023, 8, 27, 23, 0, 0, 0, tzinfo=timezone.utc)
+    zenith_ra = Observer(dt=dt, lat=33.36, lon=-116.8).lst
+
+    def plot(dt):
+        p = ZenithPlot(observer=Observer(dt=dt, lat=33.36, lon=-116.8), resolution=1000)
+        p.ecliptic()
+        p.marker(ra=zenith_ra, dec=33, style__marker__color="blue")
+        p.planets()
+        return p
+
+    def positions(p, gid):
+        return np.concatenate(
+            [
+                p._projector.to_display(*c.get_offsets().T)
+                for c in p.ax.collections
+                if c.get_gid() == gid
+            ]
+        )
+
+    updated = plot(dt)
+    updated.update_time(dt + timedelta(hours=1))
+    expected = plot(dt + timedelta(hours=1))
+
+    assert updated.observer.dt == expected.observer.dt
+    assert positions(updated, "marker") == pytest.approx(positions(expected, "marker"))
+    assert positions(updated, "planet-marker") == pytest.approx(
+        positions(expected, "planet-marker")
+    )
+    assert [p.name for p in updated.objects.planets] == [
+        p.name for p in expected.objects.planets
+    ]
+
+    def ecliptic(p):
+        (line,) = [line for line in p.ax.lines if line.get_gid() == "line"]
+        return p._projector.to_display(*line.get_xydata().T)
+
+    assert ecliptic(updated) == pytest.approx(ecliptic(expected), nan_ok=True)
+
+    assert sorted(label.get_text() for label in updated.labels) == sorted(
+        label.get_text() for label in expected.labels
+    )
+
+
 def test_marker_no_label():
     p = MapPlot(projection=Mercator())
     p.marker(ra=150, dec=0, style__marker__color="blue")
@@ -77,6 +171,34 @@ def test_text_no_style_kwarg():
     p.text(ra=100, dec=0, text="hello")
 
 
+def test_label_budget_max_labels():
+    p = MapPlot(
+        projection=Mercator(),
+        ra_min=0,
+        ra_max=90,
+        dec_min=-20,
+        dec_max=40,
+        label_budget=LabelBudget(max_labels=2),
+    )
+    for ra in range(10, 90, 15):
+        p.text(ra=ra, dec=10, text=f"label {ra}")
+
+    assert len(p.labels) == 2
+    assert p.labels_dropped == 4
+
+
+def test_label_budget_time_limit():
+    p = MapPlot(
+        projection=Mercator(),
+        label_budget=LabelBudget(time_limit=0),
+    )
+    p.text(ra=100, dec=0, text="hello")
+    p.celestial_equator()
+
+    assert len(p.labels) == 0
+    assert p.labels_dropped == 2
+
+
 def test_plots_at_astrometric():
     """Asserts that map plots plot astrometric positions, NOT apparent"""
 
@@ -111,3 +233,257 @@ def test_plots_at_astrometric():
         if s.hip == 87937:
             assert 269.454 == round(s.ra, 3)
             assert 4.668 == round(s.dec, 3)
+
+
+def test_map_astrometry_catalog():
+    """Asserts that star positions are NOT propagated when using catalog positions"""
+
+    barnard = Star.get(hip=87937)  # Barnard's Star
+    p = MapPlot(
+        projection=Miller(),
+        observer=Observer.at_epoch(1991.25),
+        ra_min=17.5 * 15,
+        ra_max=18.5 * 15,
+        dec_min=4,
+        dec_max=5,
+        astrometry="catalog",
+    )
+    p.stars(where=[_.magnitude < 10])
+
+    for s in p.objects.stars:  # find Barnard
+        if s.hip == 87937:
+            assert round(barnard.ra, 3) == round(s.ra, 3)
+            assert round(barnard.dec, 3) == round(s.dec, 3)
+
+
+def test_map_figure_not_managed_by_pyplot(tmp_path):
+    from matplotlib import pyplot as plt
+
+    figures = plt.get_fignums()
+    p = MapPlot(projection=Miller(), ra_min=0, ra_max=30, dec_min=-10, dec_max=10)
+
+    assert plt.get_fignums() == figures
+
+    p.export(tmp_path / "map.svg")
+    assert plt.rcParams["svg.fonttype"] == plt.rcParamsDefault["svg.fonttype"]
+
+
+def test_map_logger_per_plot():
+    debug = MapPlot(
+        projection=Miller(), ra_min=0, ra_max=30, dec_min=-10, dec_max=10, debug=True
+    )
+    quiet = MapPlot(projection=Miller(), ra_min=0, ra_max=30, dec_min=-10, dec_max=10)
+
+    assert debug.logger.isEnabledFor(logging.DEBUG)
+    assert not quiet.logger.isEnabledFor(logging.DEBUG)
+
+
+@pytest.mark.parametrize(
+    "file_format,signature",
+    [
+        ("png", b"\x89PNG"),
+        ("jpeg", b"\xff\xd8"),
+        ("webp", b"RIFF"),
+        ("svg", b"<?xml"),
+    ],
+)
+def test_map_export_bytes(file_format, signature):
+    p = MapPlot(projection=Miller(), ra_min=0, ra_max=30, dec_min=-10, dec_max=10)
+    assert p.export_bytes(file_format).startswith(signature)
+
+
+def test_map_export_bytes_compression():
+    p = MapPlot(projection=Miller(), ra_min=0, ra_max=30, dec_min=-10, dec_max=10)
+    p.gridlines()
+
+    fast = p.export_bytes("png", compress_level=1)
+    small = p.export_bytes("png", compress_level=9, png_strategy=PngStrategy.FILTERED)
+    assert len(small) < len(fast)
+
+    with pytest.raises(ValueError):
+        p.export_bytes("png", compress_level=10)
+
+
+def test_map_export_array():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=30,
+        dec_min=-10,
+        dec_max=10,
+        resolution=1000,
+    )
+    array = p.export_array()
+
+    assert array.dtype == np.uint8
+    assert array.shape[1] == 1000
+    assert array.shape[2] == 4
+    assert not array.flags.owndata
+
+
+def test_map_export_tight_bbox():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=30,
+        dec_min=-10,
+        dec_max=10,
+        resolution=1000,
+    )
+    p.gridlines()
+    p.title("Title")
+
+    data = p.export_bytes("png", padding=0.1)
+    exported = Image.open(BytesIO(data))
+
+    # the bbox is only measured again after the figure changes
+    cached = p._tight_bbox()
+    assert p.export_bytes("png", padding=0.1) == data
+    assert p._tight_bbox() is cached
+    # matplotlib's stale flag isn't reset by exports
+    assert p.fig.stale
+
+    expected = BytesIO()
+    p.fig.savefig(expected, format="png", bbox_inches="tight", pad_inches=0.1 * p.scale)
+    assert exported.size == Image.open(expected).size
+
+    # changing an existing artist invalidates the bbox
+    p.ax.title.set_text("A much longer title than the plot is wide " * 3)
+    assert p._tight_bbox().width > cached.width
+
+
+def test_map_export_sizes(tmp_path, monkeypatch):
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=30,
+        dec_min=-10,
+        dec_max=10,
+        resolution=1000,
+    )
+    p.gridlines()
+    p.text("Label", 15, 0, style={"font_size": 30})
+
+    exports = []
+    export = p.export
+    monkeypatch.setattr(
+        p,
+        "export",
+        lambda *args, **kwargs: exports.append(args) or export(*args, **kwargs),
+    )
+
+    full = Image.open(BytesIO(p.export_bytes("png")))
+    exports.clear()
+
+    p.export_sizes(
+        {
+            tmp_path / "full.png": None,
+            tmp_path / "web.jpg": 500,
+            tmp_path / "thumbnail.webp": 50,
+            tmp_path / "chart.svg": None,
+        },
+        min_label_pixels=5,
+    )
+
+    assert Image.open(tmp_path / "full.png").size == full.size
+    assert np.array_equal(np.asarray(Image.open(tmp_path / "full.png")), full)
+    assert Image.open(tmp_path / "web.jpg").size[0] == 500
+    assert Image.open(tmp_path / "web.jpg").mode == "RGB"
+    assert Image.open(tmp_path / "thumbnail.webp").size[0] == 50
+    assert (tmp_path / "chart.svg").read_bytes().startswith(b"<?xml")
+
+    # full size and web images are written from one render, and the thumbnail's
+    # labels would be illegible when downsampled, so it's rendered again
+    targets = [args[0] for args in exports]
+    assert targets[0] == tmp_path / "chart.svg"
+    assert isinstance(targets[1], BytesIO)
+    assert targets[2:] == [tmp_path / "thumbnail.webp"]
+
+
+def test_map_export_rasterize_threshold():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=30,
+        dec_min=-10,
+        dec_max=10,
+        resolution=1000,
+    )
+    p.gridlines()
+
+    for ra in range(1, 30):
+        p.marker(ra, 0, style={"marker": {"symbol": "circle", "size": 10}})
+
+    assert b"<image" not in p.export_bytes("svg")
+    assert b"<image" not in p.export_bytes("svg", rasterize_threshold=100)
+
+    rasterized = p.export_bytes("svg", rasterize_threshold=10)
+    assert b"<image" in rasterized
+
+    # artists are restored to vectors after exporting
+    assert b"<image" not in p.export_bytes("svg")
+
+
+def test_map_export_rasterize_objects():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=30,
+        dec_min=-10,
+        dec_max=10,
+        resolution=1000,
+    )
+    p.marker(10, 0, style={"marker": {"symbol": "circle"}}, rasterize=True)
+    p.circle((20, 0), 2, style={"fill_color": "red"})
+
+    exported = p.export_bytes("svg")
+    assert exported.count(b"<image") == 1
+
+    # objects plotted after a rasterized object aren't part of its layer
+    assert len(p._layers[0].rasterizable()) == 1
+    assert p._layers[1].rasterizable() == []
+
+    p.marker(25, 0, style={"marker": {"symbol": "circle"}}, rasterize=False)
+    assert p._layers[2].rasterizable(threshold=0) == []
+
+
+def test_map_export_gradient_rasterize_dpi():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=30,
+        dec_min=-10,
+        dec_max=10,
+        style=styles.PlotStyle().extend(styles.extensions.GRADIENT_PRE_DAWN),
+        resolution=1000,
+    )
+
+    # gradients are always rasterized, at the resolution of rasterized layers
+    low = p.export_bytes("svg", rasterize_dpi=50)
+    high = p.export_bytes("svg", rasterize_dpi=200)
+    assert b"<image" in low
+    assert len(high) > len(low)
+
+
+def test_map_export_svg_compact():
+    p = MapPlot(
+        projection=Miller(),
+        ra_min=0,
+        ra_max=30,
+        dec_min=-10,
+        dec_max=10,
+        resolution=1000,
+    )
+    p.gridlines()
+
+    for ra in range(1, 30):
+        p.marker(ra, 0, style={"marker": {"symbol": "circle", "size": 10}})
+
+    exported = p.export_bytes("svg")
+
+    with override_settings(svg_compact=True):
+        compacted = p.export_bytes("svg")
+
+    assert compacted.startswith(b"<?xml")
+    assert b"style-0" in compacted
+    assert len(compacted) < len(exported)
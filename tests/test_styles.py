@@ -1,10 +1,17 @@
 import pytest
 
+from matplotlib import font_manager
 from pydantic import ValidationError
 from pydantic.color import Color
 
-from starplot import MapPlot, Miller
-from starplot.styles import PlotStyle, FontWeightEnum, LineStyle, LineStyleEnum
+from starplot import MapPlot, Miller, override_settings
+from starplot.styles import (
+    PlotStyle,
+    FontWeightEnum,
+    LineStyle,
+    LineStyleEnum,
+    fonts,
+)
 
 
 @pytest.mark.parametrize(
@@ -62,3 +69,30 @@ def test_style_context_manager():
 
     # AND when I exit the context manager, it should revert to the original style
     assert p.style.dso_open_cluster.label.font_size == 128
+
+
+def test_fonts_load_once(monkeypatch):
+    fonts.load()
+    monkeypatch.setattr(
+        font_manager,
+        "findSystemFonts",
+        lambda *args, **kwargs: pytest.fail("Fonts were scanned again"),
+    )
+    fonts.load()
+
+
+def test_fonts_font_list(tmp_path):
+    with override_settings(data_path=tmp_path):
+        fonts.load(rebuild=True)
+        count = len(font_manager.fontManager.ttflist)
+        library_fonts = [
+            e for e in font_manager.fontManager.ttflist if fonts._is_library_font(e)
+        ]
+
+        assert (tmp_path / fonts.FONT_LIST_FILENAME).exists()
+        assert fonts._read_font_list() == library_fonts
+        assert font_manager.findfont("Inter").endswith("Inter-Regular.ttf")
+
+        # rebuilding doesn't register fonts twice
+        fonts.load(rebuild=True)
+        assert len(font_manager.fontManager.ttflist) == count
@@ -0,0 +1,54 @@
+from xml.etree import ElementTree as ET
+
+from starplot import svg
+
+SVG = b"""<?xml version="1.0" encoding="utf-8" standalone="no"?>
+<svg xmlns:xlink="http://www.w3.org/1999/xlink" xmlns="http://www.w3.org/2000/svg" version="1.1">
+ <defs>
+  <style type="text/css">*{stroke-linejoin: round; stroke-linecap: butt}</style>
+ </defs>
+ <g id="stars">
+  <path d="M 10 20 L 12 20 L 12 22 z" style="fill: #000000"/>
+  <path d="M 30.5 40 L 32.5 40 L 32.5 42 z" clip-path="url(#clip)" style="fill: #000000"/>
+  <path d="M 0 0 L 50 50" style="stroke: #ff0000"/>
+ </g>
+</svg>
+"""
+
+
+def _find(root, tag):
+    return root.findall(f".//{{{svg.SVG_NS}}}{tag}")
+
+
+def test_compact_shares_shapes():
+    root = ET.fromstring(svg.compact(SVG))
+    href = f"{{{svg.XLINK_NS}}}href"
+
+    shapes = [p for p in _find(root, "path") if p.get("id")]
+    assert len(shapes) == 1
+    assert shapes[0].get("d") == "M 0 0 L 2 0 L 2 2 z"
+
+    uses = _find(root, "use")
+    assert [(u.get(href), u.get("x"), u.get("y")) for u in uses] == [
+        ("#shape-0", "10", "20"),
+        ("#shape-0", "30.5", "40"),
+    ]
+
+    # clip paths stay on a group, so they're not moved with the shape
+    clipped = [g for g in _find(root, "g") if g.get("clip-path")]
+    assert len(clipped) == 1
+    assert clipped[0].find(f"{{{svg.SVG_NS}}}use") is uses[1]
+
+    # shapes that aren't repeated stay inline
+    assert [p.get("d") for p in _find(root, "path") if not p.get("id")] == [
+        "M 0 0 L 50 50"
+    ]
+
+
+def test_compact_shares_styles():
+    compacted = svg.compact(SVG)
+    root = ET.fromstring(compacted)
+
+    assert [u.get("class") for u in _find(root, "use")] == ["style-0", "style-0"]
+    assert _find(root, "style")[0].text.endswith(".style-0{fill: #000000}")
+    assert b'style="stroke: #ff0000"' in compacted
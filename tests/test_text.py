@@ -0,0 +1,27 @@
+from starplot.plotters.text import LabelBudget, LabelRegistry
+
+
+def test_label_registry():
+    registry = LabelRegistry()
+
+    assert registry.register(("hip", 32349), ("tyc", None))
+    assert ("hip", 32349) in registry
+    assert len(registry) == 1
+
+    # same object, by any of its keys
+    assert not registry.register(("hip", 32349))
+    assert not registry.register(("tyc", "1234-5678-1"), ("hip", 32349))
+
+    # same identifier, different namespace
+    assert registry.register(("dso", 32349))
+
+
+def test_label_budget():
+    assert not LabelBudget().is_limited
+    assert not LabelBudget().is_spent(num_labels=10_000, seconds=10_000)
+
+    budget = LabelBudget(max_labels=10, time_limit=2)
+    assert budget.is_limited
+    assert not budget.is_spent(num_labels=9, seconds=1.5)
+    assert budget.is_spent(num_labels=10, seconds=1.5)
+    assert budget.is_spent(num_labels=0, seconds=2)
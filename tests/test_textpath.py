@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import TextToPath
+
+from starplot.textpath import CachedTextToPath, TextPathCacheArtist, text_to_path
+
+
+def test_cached_text_to_path_matches_matplotlib():
+    prop = FontProperties(size=12)
+    cached = CachedTextToPath()
+
+    verts, codes = cached.get_text_path(prop, "αβγ NESW")
+    expected_verts, expected_codes = TextToPath().get_text_path(prop, "αβγ NESW")
+
+    assert np.allclose(verts, expected_verts)
+    assert list(codes) == list(expected_codes)
+
+
+def test_cached_text_to_path_reuses_paths():
+    cached = CachedTextToPath(max_texts=2)
+
+    first = cached.get_text_path(FontProperties(size=12), "N")
+    # glyph outlines don't depend on font size
+    assert cached.get_text_path(FontProperties(size=30), "N") is first
+    assert len(cached._glyphs) == 1
+
+    cached.get_text_path(FontProperties(size=12), "E")
+    cached.get_text_path(FontProperties(size=12), "S")
+    assert len(cached._texts) == 2
+    assert len(cached._glyphs) == 3
+
+    cached.clear()
+    assert len(cached._texts) == 0
+
+
+def test_cached_text_to_path_without_shaping_arguments(monkeypatch):
+    # matplotlib < 3.10 doesn't have the features and language arguments
+    get_text_path = TextToPath.get_text_path
+
+    def legacy_get_text_path(self, prop, s, ismath=False):
+        return get_text_path(self, prop, s, ismath=ismath)
+
+    monkeypatch.setattr(TextToPath, "get_text_path", legacy_get_text_path)
+
+    verts, codes = CachedTextToPath().get_text_path(FontProperties(size=12), "N")
+    assert len(verts) == len(codes) > 0
+
+
+def test_cached_text_to_path_threads():
+    cached = CachedTextToPath(max_texts=8)
+    texts = [chr(c) for c in range(ord("A"), ord("Z") + 1)] * 20
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(
+                lambda s: cached.get_text_path(FontProperties(size=12), s), texts
+            )
+        )
+
+    assert len(results) == len(texts)
+    assert len(cached._texts) == 8
+
+
+def test_text_path_cache_artist_agg():
+    fig = Figure()
+    fig.add_artist(TextPathCacheArtist())
+    fig.text(0.5, 0.5, "Sirius")
+
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+
+    assert canvas.get_renderer()._text2path is text_to_path
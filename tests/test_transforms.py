@@ -0,0 +1,152 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from cartopy import crs as ccrs
+from matplotlib import pyplot as plt
+
+from starplot import Observer, override_settings
+from starplot.transforms import (
+    AltAzTransform,
+    Projector,
+    SkyfieldAltAzTransform,
+    altaz_transform,
+    galactic_to_radec,
+    geometric_altitude,
+    radec_to_galactic,
+    radec_to_xyz,
+    xyz_to_lonlat,
+)
+
+ARCSECOND = 1 / 3600
+
+
+@pytest.fixture()
+def observer():
+    return Observer(
+        dt=datetime(2024, 3, 2, 4, 0, tzinfo=timezone.utc),
+        lat=33.363484,
+        lon=-116.836394,
+        elevation=1500,
+    )
+
+
+def test_radec_to_xyz_round_trip():
+    ra = np.array([0, 45, 180, 359.5])
+    dec = np.array([0, -30, 60, 89])
+    lon, lat = xyz_to_lonlat(radec_to_xyz(ra, dec))
+    assert lon == pytest.approx(ra)
+    assert lat == pytest.approx(dec)
+
+
+def test_geometric_altitude():
+    alt = geometric_altitude(
+        ra=[100, 100, 280, 130], dec=[40, -50, 40, 0], lst=100, lat=40
+    )
+    # zenith, south horizon, and lower culmination
+    assert alt[:3] == pytest.approx([90, 0, -10], abs=1e-6)
+    assert alt[3] == pytest.approx(41.56, abs=0.01)
+
+
+def test_radec_to_galactic():
+    # galactic center and north galactic pole
+    lon, lat = radec_to_galactic([266.40499, 192.85948], [-28.93617, 27.12825])
+    assert (lon[0] + 180) % 360 - 180 == pytest.approx(0, abs=1e-4)
+    assert lat == pytest.approx([0, 90], abs=1e-4)
+
+    ra, dec = galactic_to_radec(*radec_to_galactic([10, 250], [-45, 60]))
+    assert ra == pytest.approx([10, 250])
+    assert dec == pytest.approx([-45, 60])
+
+
+def test_altaz_transform_identity_rotation():
+    transform = AltAzTransform(rotation=np.identity(3))
+    az, alt = transform.transform([10, 200], [20, -45])
+    assert az == pytest.approx([10, 200])
+    assert alt == pytest.approx([20, -45])
+
+
+def test_altaz_transform_refraction():
+    transform = AltAzTransform(rotation=np.identity(3), temperature=10, pressure=1010)
+    _, alt = transform.transform([0, 0, 0], [-5, 0, 45])
+    # no refraction far below the horizon
+    assert alt[0] == -5
+    # about half a degree at the horizon
+    assert alt[1] == pytest.approx(0.48, abs=0.02)
+    assert alt[2] == pytest.approx(45.0163, abs=0.001)
+
+
+def test_altaz_transform_matches_skyfield(observer):
+    rng = np.random.default_rng(1)
+    ra = rng.uniform(0, 360, 2_000)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 2_000)))
+
+    az, alt = AltAzTransform.from_observer(observer).transform(ra, dec)
+    expected_az, expected_alt = SkyfieldAltAzTransform(observer).transform(ra, dec)
+
+    az_error = np.abs((az - expected_az + 180) % 360 - 180)
+    az_error *= np.cos(np.radians(expected_alt))
+
+    # only differences are deflection and parallax, which are sub-arcsecond
+    assert az_error.max() < ARCSECOND
+    assert np.abs(alt - expected_alt).max() < ARCSECOND
+
+
+def test_altaz_transform_from_observers(observer):
+    observers = [
+        Observer(
+            dt=observer.dt + timedelta(minutes=m),
+            lat=observer.lat,
+            lon=observer.lon,
+            elevation=observer.elevation,
+        )
+        for m in (0, 30, 60)
+    ]
+    ra, dec = np.array([10, 120, 250]), np.array([-20, 45, 80])
+
+    for o, transform in zip(observers, AltAzTransform.from_observers(observers)):
+        expected = AltAzTransform.from_observer(o).transform(ra, dec)
+        assert transform.transform(ra, dec) == pytest.approx(expected)
+
+
+def test_altaz_transform_from_observers_different_places(observer):
+    other = Observer(dt=observer.dt, lat=10, lon=observer.lon)
+
+    with pytest.raises(ValueError):
+        AltAzTransform.from_observers([observer, other])
+
+
+def test_altaz_transform_reference_setting(observer):
+    assert isinstance(altaz_transform(observer), AltAzTransform)
+    assert altaz_transform(observer) is altaz_transform(observer)
+
+    with override_settings(altaz_reference=True):
+        assert isinstance(altaz_transform(observer), SkyfieldAltAzTransform)
+
+
+def test_projector_matches_cartopy():
+    source = ccrs.PlateCarree()
+    target = ccrs.Mollweide()
+    fig = plt.figure(figsize=(4, 4))
+    ax = fig.add_subplot(1, 1, 1, projection=target)
+    ax.set_global()
+
+    projector = Projector(source, target, ax)
+
+    ra = np.array([0, 45, 120, -150])
+    dec = np.array([0, 30, -60, 89])
+    expected = target.transform_points(source, ra, dec)[:, :2]
+
+    assert projector.to_data(ra, dec) == pytest.approx(expected)
+    assert projector.to_display(ra, dec) == pytest.approx(
+        ax.transData.transform(expected)
+    )
+    assert projector.point_to_display(45, 30) == pytest.approx(
+        tuple(ax.transData.transform(expected[1]))
+    )
+
+    x_axes, y_axes = projector.point_to_axes(0, 0)
+    assert (x_axes, y_axes) == pytest.approx((0.5, 0.5))
+    assert projector.point_from_axes(0.5, 0.5) == pytest.approx((0, 0), abs=1e-9)
+
+    plt.close(fig)